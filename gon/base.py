@@ -6,6 +6,14 @@ from ground.hints import Scalar as _Scalar
 from .core.angle import (Angle as _Angle,
                          Kind,
                          Orientation)
+from .core.areas import (intersection_area,
+                         intersection_areas,
+                         union_area)
+from .core.complexity import (CoordinatesComplexity,
+                              CoordinatesComplexityWarning,
+                              get_coordinates_complexity_threshold,
+                              set_coordinates_complexity_threshold,
+                              to_coordinates_complexity)
 from .core.compound import (Compound,
                             Indexable,
                             Linear,
@@ -14,15 +22,23 @@ from .core.compound import (Compound,
                             Shaped)
 from .core.contour import Contour as _Contour
 from .core.empty import Empty as _Empty
+from .core.geofencing import (Geofence,
+                              Transition,
+                              TransitionKind)
 from .core.geometry import Geometry
 from .core.mix import Mix as _Mix
 from .core.multipoint import Multipoint as _Multipoint
 from .core.multipolygon import Multipolygon as _Multipolygon
 from .core.multisegment import Multisegment as _Multisegment
+from .core.parallel import validate_all
 from .core.point import Point as _Point
 from .core.polygon import (Polygon as _Polygon,
                            Triangulation)
 from .core.segment import Segment as _Segment
+from .core.simplification import (SimplificationMethod,
+                                  simplify_coverage)
+from .core.validation import (ValidationLevel,
+                              Violation)
 from .core.vector import Vector as _Vector
 
 Compound = Compound
@@ -40,9 +56,37 @@ Kind = Kind
 Location = Location
 Orientation = Orientation
 Relation = Relation
+SimplificationMethod = SimplificationMethod
+SimplificationMethod.__module__ = __name__
+ValidationLevel = ValidationLevel
+ValidationLevel.__module__ = __name__
+Violation = Violation
+Violation.__module__ = __name__
+
+Geofence = Geofence
+Transition = Transition
+TransitionKind = TransitionKind
+Geofence.__module__ = __name__
+Transition.__module__ = __name__
+TransitionKind.__module__ = __name__
 
 Triangulation = Triangulation
 
+CoordinatesComplexity = CoordinatesComplexity
+CoordinatesComplexityWarning = CoordinatesComplexityWarning
+CoordinatesComplexity.__module__ = __name__
+CoordinatesComplexityWarning.__module__ = __name__
+get_coordinates_complexity_threshold = get_coordinates_complexity_threshold
+set_coordinates_complexity_threshold = set_coordinates_complexity_threshold
+to_coordinates_complexity = to_coordinates_complexity
+
+intersection_area = intersection_area
+intersection_areas = intersection_areas
+union_area = union_area
+
+simplify_coverage = simplify_coverage
+validate_all = validate_all
+
 
 class _ContextMixin:
     _context = ...  # type: _Context
@@ -108,3 +152,5 @@ _context = _get_context().replace(contour_cls=Contour,
                                   segment_cls=Segment)
 _ContextMixin._context = _context
 _set_context(_context)
+
+Box = _context.box_cls
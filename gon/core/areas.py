@@ -0,0 +1,184 @@
+from typing import (List,
+                    Sequence)
+
+from ground.base import (Context,
+                         Location)
+from ground.hints import Scalar
+
+from .boxes_tree import (boxes_disjoint,
+                         to_boxes_tree,
+                         to_overlapping_items_pairs)
+from .compound import Shaped
+from .iterable import pairwise_sum
+from .predicates import to_box
+from .relating import (Edge,
+                       split_edges_pairwise,
+                       to_aligned_side,
+                       to_piece_key,
+                       to_shaped_edges)
+
+
+def intersection_area(first: Shaped, second: Shaped) -> Scalar:
+    """
+    Returns area of intersection of shaped geometries
+    without constructing the intersection.
+
+    Time complexity:
+        ``O((vertices_count + intersections_count) * log vertices_count)``
+        expected,
+        ``O(vertices_count ** 2)`` worst
+    Memory complexity:
+        ``O(vertices_count + intersections_count)``
+
+    where ``vertices_count`` is a total number of geometries' vertices,
+    ``intersections_count`` is a number of intersections
+    of geometries' edges.
+
+    >>> from gon.base import Contour, Point, Polygon, intersection_area
+    >>> first = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                          Point(0, 4)]))
+    >>> second = Polygon(Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+    ...                           Point(2, 6)]))
+    >>> intersection_area(first, second) == 4
+    True
+    >>> intersection_area(first, first) == first.area
+    True
+    """
+    context = first._context
+    return (_to_intersection_area(first, to_shaped_edges(first, context),
+                                  second, to_shaped_edges(second, context),
+                                  context)
+            if not boxes_disjoint(to_box(first), to_box(second))
+            else 0)
+
+
+def intersection_areas(firsts: Sequence[Shaped],
+                       seconds: Sequence[Shaped]) -> List[List[Scalar]]:
+    """
+    Returns areas of intersections of each shaped geometry
+    from the first sequence with each one from the second sequence
+    skipping pairs with disjoint boxes.
+
+    Time complexity:
+        ``O(firsts_count * seconds_count + vertices_count
+        + hits_count * intersection_time)`` expected
+    Memory complexity:
+        ``O(firsts_count * seconds_count + vertices_count)``
+
+    where ``firsts_count = len(firsts)``, ``seconds_count = len(seconds)``,
+    ``vertices_count`` is a total number of geometries' vertices,
+    ``hits_count`` is a number of pairs of geometries
+    with intersecting boxes,
+    ``intersection_time`` is a time complexity of ``intersection_area``.
+
+    >>> from gon.base import Contour, Point, Polygon, intersection_areas
+    >>> first = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                          Point(0, 4)]))
+    >>> second = Polygon(Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+    ...                           Point(2, 6)]))
+    >>> third = Polygon(Contour([Point(7, 7), Point(8, 7), Point(8, 8),
+    ...                          Point(7, 8)]))
+    >>> intersection_areas([first, second], [second, third]) == [[4, 0],
+    ...                                                          [16, 0]]
+    True
+    """
+    if not firsts or not seconds:
+        return [[] for _ in firsts]
+    context = firsts[0]._context
+    result = [[0] * len(seconds) for _ in firsts]
+    firsts_boxes = [to_box(first) for first in firsts]
+    seconds_boxes = [to_box(second) for second in seconds]
+    firsts_edges = [None] * len(firsts)  # type: List[List[Edge]]
+    seconds_edges = [None] * len(seconds)  # type: List[List[Edge]]
+    for first_index, second_index in to_overlapping_items_pairs(
+            to_boxes_tree(firsts_boxes, range(len(firsts)), context),
+            to_boxes_tree(seconds_boxes, range(len(seconds)), context)):
+        first, second = firsts[first_index], seconds[second_index]
+        if firsts_edges[first_index] is None:
+            firsts_edges[first_index] = to_shaped_edges(first, context)
+        if seconds_edges[second_index] is None:
+            seconds_edges[second_index] = to_shaped_edges(second, context)
+        result[first_index][second_index] = _to_intersection_area(
+                first, firsts_edges[first_index],
+                second, seconds_edges[second_index], context)
+    return result
+
+
+def union_area(first: Shaped, second: Shaped) -> Scalar:
+    """
+    Returns area of union of shaped geometries
+    without constructing the union.
+
+    Time complexity:
+        ``O((vertices_count + intersections_count) * log vertices_count)``
+        expected,
+        ``O(vertices_count ** 2)`` worst
+    Memory complexity:
+        ``O(vertices_count + intersections_count)``
+
+    where ``vertices_count`` is a total number of geometries' vertices,
+    ``intersections_count`` is a number of intersections
+    of geometries' edges.
+
+    >>> from gon.base import Contour, Point, Polygon, union_area
+    >>> first = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                          Point(0, 4)]))
+    >>> second = Polygon(Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+    ...                           Point(2, 6)]))
+    >>> union_area(first, second) == 28
+    True
+    >>> union_area(first, first) == first.area
+    True
+    """
+    return first.area + second.area - intersection_area(first, second)
+
+
+def _to_intersection_area(first: Shaped,
+                          first_edges: Sequence[Edge],
+                          second: Shaped,
+                          second_edges: Sequence[Edge],
+                          context: Context) -> Scalar:
+    # area is found by the shoelace formula over the pieces of edges
+    # which bound the intersection oriented with its interior on the left:
+    # pieces of each geometry's edges inside of the other one
+    # & shared pieces with interiors of both geometries on the same side
+    first_pieces, second_pieces, _ = split_edges_pairwise(
+            first_edges, second_edges, context)
+    cross_product, segment_cls, segment_centroid = (
+        context.cross_product, context.segment_cls, context.segment_centroid)
+    origin = first_edges[0][0].start
+    first_pieces_keys = set()
+    second_pieces_by_keys = {to_piece_key(piece): piece
+                             for piece in second_pieces}
+    bounding_pieces, rest_first_pieces = [], []
+    for piece in first_pieces:
+        piece_key = to_piece_key(piece)
+        first_pieces_keys.add(piece_key)
+        second_piece = second_pieces_by_keys.get(piece_key)
+        if second_piece is None:
+            rest_first_pieces.append(piece)
+        elif to_aligned_side(piece, second_piece) == piece[2]:
+            bounding_pieces.append(piece)
+    rest_second_pieces = [piece
+                          for piece in second_pieces
+                          if to_piece_key(piece) not in first_pieces_keys]
+    for pieces, other in ((rest_first_pieces, second),
+                          (rest_second_pieces, first)):
+        if not pieces:
+            continue
+        bounding_pieces.extend(
+                piece
+                for piece, location in zip(
+                        pieces, other._locate_points(
+                                [segment_centroid(segment_cls(start, end))
+                                 for start, end, _ in pieces]))
+                if location is Location.INTERIOR)
+    if not bounding_pieces:
+        return 0
+    doubled_area = pairwise_sum(
+            cross_product(origin, start, origin, end)
+            if is_interior_on_left
+            else cross_product(origin, end, origin, start)
+            for start, end, is_interior_on_left in bounding_pieces
+    )
+    return doubled_area / 2
@@ -0,0 +1,410 @@
+from bisect import bisect_right
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from bentley_ottmann.planar import contour_self_intersects
+from ground.base import (Context,
+                         Location,
+                         Relation)
+from ground.hints import (Box,
+                          Contour,
+                          Point,
+                          Polygon,
+                          Scalar,
+                          Segment)
+from locus import kd
+from orient.planar import region_in_region
+
+from .angle import Orientation
+from .compound import Compound
+from .packing import pack_mix
+
+_Position = Tuple[int, Scalar]
+
+
+def box_to_polygon(box: Box, context: Context) -> Polygon:
+    return context.polygon_cls(context.contour_cls(_box_to_corners(box,
+                                                                   context)),
+                               [])
+
+
+def clip_contour_by_box(contour: Contour,
+                        box: Box,
+                        context: Context) -> Compound:
+    return _clip_segments(contour.segments, box, context, False)
+
+
+def clip_polygons_by_box(polygons: Sequence[Polygon],
+                         box: Box,
+                         context: Context) -> Optional[Compound]:
+    """
+    Returns intersection of polygons with the box
+    or ``None`` if polygons are in degenerate position relative to it.
+    """
+    result = []
+    for polygon in polygons:
+        polygon_box = context.polygon_box(polygon)
+        if _is_box_subset_of(polygon_box, box):
+            result.append(polygon)
+        elif not _are_boxes_disjoint(polygon_box, box):
+            polygon_result = _clip_polygon(polygon, box, context)
+            if polygon_result is None:
+                return None
+            result.extend(polygon_result)
+    return (context.empty
+            if not result
+            else (result[0]
+                  if len(result) == 1
+                  else context.multipolygon_cls(result)))
+
+
+def clip_segments_by_box(segments: Sequence[Segment],
+                         box: Box,
+                         context: Context) -> Compound:
+    return _clip_segments(segments, box, context, True)
+
+
+def _are_boxes_disjoint(first: Box, second: Box) -> bool:
+    return (first.max_x < second.min_x or second.max_x < first.min_x
+            or first.max_y < second.min_y or second.max_y < first.min_y)
+
+
+def _box_to_corners(box: Box, context: Context) -> List[Point]:
+    point_cls = context.point_cls
+    return [point_cls(box.min_x, box.min_y), point_cls(box.max_x, box.min_y),
+            point_cls(box.max_x, box.max_y), point_cls(box.min_x, box.max_y)]
+
+
+def _box_to_edges(box: Box, context: Context) -> List[Segment]:
+    corners = _box_to_corners(box, context)
+    segment_cls = context.segment_cls
+    return [segment_cls(corners[index - 1], corners[index])
+            for index in range(len(corners))]
+
+
+def _clip_polygon(polygon: Polygon,
+                  box: Box,
+                  context: Context) -> Optional[List[Polygon]]:
+    border, holes = polygon.border, polygon.holes
+    border_clip = _clip_ring(_to_oriented_vertices(border, True), box,
+                             context)
+    if border_clip is None:
+        return None
+    pieces = border_clip
+    inner_holes, has_crossing_holes = [], False
+    for hole in holes:
+        hole_box = context.contour_box(hole)
+        if _are_boxes_disjoint(hole_box, box):
+            continue
+        hole_clip = _clip_ring(_to_oriented_vertices(hole, False), box,
+                               context)
+        if hole_clip is None:
+            return None
+        elif hole_clip:
+            pieces += hole_clip
+            has_crossing_holes = True
+        elif _is_box_subset_of(hole_box, box):
+            inner_holes.append(hole)
+        elif _locate_point_in_box(hole.vertices[0],
+                                  box) is Location.INTERIOR:
+            inner_holes.append(hole)
+    contour_cls = context.contour_cls
+    if pieces:
+        borders = [contour_cls(vertices)
+                   for vertices in _connect_pieces(pieces, box, context)]
+        if has_crossing_holes and any(
+                contour_self_intersects(border,
+                                        context=context)
+                for border in borders):
+            return None
+    else:
+        corners = _box_to_corners(box, context)
+        borders = ([contour_cls(corners)]
+                   if polygon.locate(corners[0]) is Location.INTERIOR
+                   else [])
+    borders_holes = [[] for _ in borders]
+    for hole in inner_holes:
+        hole_box = context.contour_box(hole)
+        container_index = None
+        for index, border in enumerate(borders):
+            if _are_boxes_disjoint(hole_box, context.contour_box(border)):
+                continue
+            relation = region_in_region(hole, border,
+                                        context=context)
+            if relation is Relation.WITHIN:
+                container_index = index
+            elif relation is not Relation.DISJOINT:
+                return None
+        if container_index is None:
+            return None
+        borders_holes[container_index].append(hole)
+    polygon_cls = context.polygon_cls
+    return [polygon_cls(border, border_holes)
+            for border, border_holes in zip(borders, borders_holes)]
+
+
+def _clip_ring(vertices: Sequence[Point],
+               box: Box,
+               context: Context) -> Optional[List[List[Point]]]:
+    """
+    Returns parts of the ring lying inside the box
+    which start & end on the box boundary
+    or ``None`` if the ring is in degenerate position relative to the box.
+    """
+    insides = []
+    for vertex in vertices:
+        location = _locate_point_in_box(vertex, box)
+        if location is Location.BOUNDARY:
+            return None
+        insides.append(location is Location.INTERIOR)
+    if all(insides):
+        return []
+    size = len(vertices)
+    start = insides.index(False)
+    result, piece = [], []
+    for offset in range(size):
+        index = (start + offset) % size
+        next_index = (index + 1) % size
+        if insides[index] and insides[next_index]:
+            piece.append(vertices[next_index])
+            continue
+        endpoints = _clip_segment(vertices[index], vertices[next_index], box,
+                                  context)
+        if endpoints is None:
+            continue
+        entry, exit_ = endpoints
+        if (entry == exit_
+                or _is_box_corner(entry, box)
+                or _is_box_corner(exit_, box)):
+            return None
+        elif insides[index]:
+            piece.append(exit_)
+            result.append(piece)
+            piece = []
+        elif insides[next_index]:
+            piece = [entry, exit_]
+        else:
+            result.append([entry, exit_])
+    return result
+
+
+def _clip_segment(start: Point,
+                  end: Point,
+                  box: Box,
+                  context: Context) -> Optional[Tuple[Point, Point]]:
+    """
+    Returns endpoints of the segment's part lying in the closed box
+    ordered along the segment or ``None`` if there is no such part.
+    """
+    min_x, max_x = (start.x, end.x) if start.x < end.x else (end.x, start.x)
+    min_y, max_y = (start.y, end.y) if start.y < end.y else (end.y, start.y)
+    if (max_x < box.min_x or box.max_x < min_x
+            or max_y < box.min_y or box.max_y < min_y):
+        return None
+    start_location, end_location = (_locate_point_in_box(start, box),
+                                     _locate_point_in_box(end, box))
+    if (start_location is not Location.EXTERIOR
+            and end_location is not Location.EXTERIOR):
+        return start, end
+    segment = context.segment_cls(start, end)
+    candidates = [point
+                  for point, location in [(start, start_location),
+                                          (end, end_location)]
+                  if location is not Location.EXTERIOR]
+    for edge in _box_to_edges(box, context):
+        relation = context.segments_relation(segment, edge)
+        if relation is Relation.DISJOINT:
+            continue
+        elif relation is Relation.TOUCH or relation is Relation.CROSS:
+            candidates.append(context.segments_intersection(segment, edge))
+        else:
+            candidates.extend(point
+                              for point in (edge.start, edge.end)
+                              if context.segment_contains_point(segment,
+                                                                point))
+    if not candidates:
+        return None
+    if start.x != end.x:
+        first, last = (min(candidates,
+                           key=_to_x),
+                       max(candidates,
+                           key=_to_x))
+        return (first, last) if start.x < end.x else (last, first)
+    else:
+        first, last = (min(candidates,
+                           key=_to_y),
+                       max(candidates,
+                           key=_to_y))
+        return (first, last) if start.y < end.y else (last, first)
+
+
+def _clip_segments(segments: Sequence[Segment],
+                   box: Box,
+                   context: Context,
+                   may_touch: bool) -> Compound:
+    points, pieces = [], []
+    for segment in segments:
+        endpoints = _clip_segment(segment.start, segment.end, box, context)
+        if endpoints is None:
+            continue
+        start, end = endpoints
+        if start == end:
+            points.append(start)
+        else:
+            pieces.append(segment
+                          if start == segment.start and end == segment.end
+                          else context.segment_cls(start, end))
+    points = list(dict.fromkeys(points))
+    if may_touch and (len(pieces) > 1 or pieces and points):
+        pieces = _split_touching_segments(pieces, points, context)
+    endpoints = {endpoint
+                 for piece in pieces
+                 for endpoint in (piece.start, piece.end)}
+    points = [point
+              for point in points
+              if (point not in endpoints
+                  and not any(context.segment_contains_point(piece, point)
+                              for piece in pieces
+                              if _is_segment_on_box_boundary(piece, box)))]
+    return pack_mix((context.multipoint_cls(points)
+                     if points
+                     else context.empty),
+                    (context.empty
+                     if not pieces
+                     else (pieces[0]
+                           if len(pieces) == 1
+                           else context.multisegment_cls(pieces))),
+                    context.empty, context.empty, context.mix_cls)
+
+
+def _connect_pieces(pieces: Sequence[Sequence[Point]],
+                    box: Box,
+                    context: Context) -> List[List[Point]]:
+    entries = sorted((_to_boundary_position(piece[0], box), index)
+                     for index, piece in enumerate(pieces))
+    entries_positions = [position for position, _ in entries]
+    corners = _box_to_corners(box, context)
+    corners_positions = [_to_boundary_position(corner, box)
+                         for corner in corners]
+    result = []
+    visited = [False] * len(pieces)
+    for index in range(len(pieces)):
+        if visited[index]:
+            continue
+        vertices = []
+        cursor = index
+        while not visited[cursor]:
+            visited[cursor] = True
+            piece = pieces[cursor]
+            vertices.extend(piece)
+            exit_position = _to_boundary_position(piece[-1], box)
+            next_entry_index = bisect_right(entries_positions, exit_position)
+            entry_position, cursor = entries[next_entry_index
+                                             % len(entries)]
+            corner_index = bisect_right(corners_positions, exit_position)
+            for offset in range(len(corners)):
+                corner_position = corners_positions[
+                    (corner_index + offset) % len(corners)]
+                if not (exit_position < corner_position < entry_position
+                        if exit_position < entry_position
+                        else (exit_position < corner_position
+                              or corner_position < entry_position)):
+                    break
+                vertices.append(corners[(corner_index + offset)
+                                        % len(corners)])
+        result.append(vertices)
+    return result
+
+
+def _is_box_corner(point: Point, box: Box) -> bool:
+    return ((point.x == box.min_x or point.x == box.max_x)
+            and (point.y == box.min_y or point.y == box.max_y))
+
+
+def _is_box_subset_of(test: Box, goal: Box) -> bool:
+    return (goal.min_x <= test.min_x and test.max_x <= goal.max_x
+            and goal.min_y <= test.min_y and test.max_y <= goal.max_y)
+
+
+def _is_segment_on_box_boundary(segment: Segment, box: Box) -> bool:
+    start, end = segment.start, segment.end
+    return (start.x == end.x and (start.x == box.min_x
+                                  or start.x == box.max_x)
+            or start.y == end.y and (start.y == box.min_y
+                                     or start.y == box.max_y))
+
+
+def _locate_point_in_box(point: Point, box: Box) -> Location:
+    if (box.min_x < point.x < box.max_x
+            and box.min_y < point.y < box.max_y):
+        return Location.INTERIOR
+    elif (box.min_x <= point.x <= box.max_x
+          and box.min_y <= point.y <= box.max_y):
+        return Location.BOUNDARY
+    else:
+        return Location.EXTERIOR
+
+
+def _split_touching_segments(segments: Sequence[Segment],
+                             points: Sequence[Point],
+                             context: Context) -> List[Segment]:
+    """
+    Splits segments by endpoints of other segments & points
+    lying in their interiors.
+    """
+    tree = kd.Tree(list({point
+                         for segment in segments
+                         for point in (segment.start, segment.end)}
+                        .union(points)),
+                   context=context)
+    result = []
+    for segment in segments:
+        start, end = segment.start, segment.end
+        cut_points = [point
+                      for point in tree.find_box_points(
+                              context.segment_box(segment))
+                      if (point != start and point != end
+                          and context.segment_contains_point(segment,
+                                                             point))]
+        if not cut_points:
+            result.append(segment)
+            continue
+        cut_points.sort(key=_to_x if start.x != end.x else _to_y,
+                        reverse=(end.x < start.x
+                                 if start.x != end.x
+                                 else end.y < start.y))
+        cut_points = [start, *cut_points, end]
+        segment_cls = context.segment_cls
+        result.extend(segment_cls(cut_points[index - 1], cut_points[index])
+                      for index in range(1, len(cut_points)))
+    return result
+
+
+def _to_boundary_position(point: Point, box: Box) -> _Position:
+    if point.y == box.min_y and point.x != box.max_x:
+        return 0, point.x
+    elif point.x == box.max_x and point.y != box.max_y:
+        return 1, point.y
+    elif point.y == box.max_y and point.x != box.min_x:
+        return 2, -point.x
+    else:
+        return 3, -point.y
+
+
+def _to_oriented_vertices(contour: Contour,
+                          counterclockwise: bool) -> Sequence[Point]:
+    vertices = contour.vertices
+    return (vertices
+            if ((contour.orientation is Orientation.COUNTERCLOCKWISE)
+                is counterclockwise)
+            else vertices[::-1])
+
+
+def _to_x(point: Point) -> Scalar:
+    return point.x
+
+
+def _to_y(point: Point) -> Scalar:
+    return point.y
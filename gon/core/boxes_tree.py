@@ -0,0 +1,401 @@
+from fractions import Fraction
+from functools import partial
+from heapq import (heappop,
+                   heappush)
+from itertools import count
+from math import (ceil,
+                  sqrt)
+from typing import (Any,
+                    Callable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.base import (Context,
+                         Relation)
+from ground.hints import (Box,
+                          Point,
+                          Scalar,
+                          Segment)
+
+#: node of the tree as a triplet of box, children & item,
+#: leaves have no children & non-leaves have no item
+BoxesTree = Tuple[Box, Optional[Sequence['BoxesTree']], Any]
+#: boxes tree with segments as items
+SegmentsTree = BoxesTree
+
+MAX_CHILDREN = 16
+
+
+def box_point_squared_distance(box: Box, point: Point) -> Scalar:
+    """
+    Returns squared distance between box and a point
+    with floating point coordinates converted to fractions,
+    so rounding never makes lower bounds exceed exact distances.
+    """
+    x, y = point.x, point.y
+    delta_x = (to_exact(box.min_x) - to_exact(x)
+               if x < box.min_x
+               else (to_exact(x) - to_exact(box.max_x)
+                     if box.max_x < x
+                     else 0))
+    delta_y = (to_exact(box.min_y) - to_exact(y)
+               if y < box.min_y
+               else (to_exact(y) - to_exact(box.max_y)
+                     if box.max_y < y
+                     else 0))
+    return delta_x * delta_x + delta_y * delta_y
+
+
+def box_segment_squared_distance(box: Box,
+                                 segment: Segment,
+                                 context: Context) -> Scalar:
+    """
+    Returns squared distance between box and a segment
+    with floating point coordinates converted to fractions,
+    so rounding never makes lower bounds exceed exact distances.
+    """
+    point_cls = context.point_cls
+    start, end = segment.start, segment.end
+    return context.box_segment_squared_distance(
+            context.box_cls(to_exact(box.min_x), to_exact(box.max_x),
+                            to_exact(box.min_y), to_exact(box.max_y)),
+            context.segment_cls(point_cls(to_exact(start.x),
+                                          to_exact(start.y)),
+                                point_cls(to_exact(end.x),
+                                          to_exact(end.y))))
+
+
+def boxes_disjoint(first: Box, second: Box) -> bool:
+    """
+    Checks if boxes have no common points.
+    """
+    return (first.max_x < second.min_x or second.max_x < first.min_x
+            or first.max_y < second.min_y or second.max_y < first.min_y)
+
+
+def boxes_squared_distance(first: Box, second: Box) -> Scalar:
+    """
+    Returns squared distance between boxes
+    with floating point coordinates converted to fractions,
+    so rounding never makes lower bounds exceed exact distances.
+    """
+    delta_x = (to_exact(first.min_x) - to_exact(second.max_x)
+               if second.max_x < first.min_x
+               else (to_exact(second.min_x) - to_exact(first.max_x)
+                     if first.max_x < second.min_x
+                     else 0))
+    delta_y = (to_exact(first.min_y) - to_exact(second.max_y)
+               if second.max_y < first.min_y
+               else (to_exact(second.min_y) - to_exact(first.max_y)
+                     if first.max_y < second.min_y
+                     else 0))
+    return delta_x * delta_x + delta_y * delta_y
+
+
+def pack_trees(trees: Sequence[BoxesTree], context: Context) -> BoxesTree:
+    """
+    Builds packed bounding boxes tree with given trees as subtrees
+    with Sort-Tile-Recursive algorithm.
+    """
+    nodes = trees
+    while len(nodes) > 1:
+        nodes = _pack_nodes(nodes, context)
+    return nodes[0]
+
+
+def segments_trees_intersect(first: SegmentsTree,
+                             second: SegmentsTree,
+                             context: Context) -> bool:
+    """
+    Checks if segments of the trees intersect
+    traversing both of them simultaneously depth-first,
+    pruning pairs of nodes with disjoint boxes
+    & stopping at the first intersecting pair of segments.
+    """
+    segments_relation = context.segments_relation
+    stack = [(first, second)]
+    while stack:
+        first_node, second_node = stack.pop()
+        if boxes_disjoint(first_node[0], second_node[0]):
+            continue
+        first_children, second_children = first_node[1], second_node[1]
+        if first_children is None and second_children is None:
+            if (segments_relation(first_node[2], second_node[2])
+                    is not Relation.DISJOINT):
+                return True
+        elif (second_children is None
+              or (first_children is not None
+                  and (_to_box_size(first_node[0])
+                       >= _to_box_size(second_node[0])))):
+            stack.extend((child, second_node) for child in first_children)
+        else:
+            stack.extend((first_node, child) for child in second_children)
+    return False
+
+
+def segments_trees_squared_distance(first: SegmentsTree,
+                                    second: SegmentsTree,
+                                    context: Context) -> Scalar:
+    """
+    Returns squared distance between segments of the trees
+    traversing both of them simultaneously in order of boxes distances
+    and pruning pairs of nodes which boxes are farther than the best candidate.
+    """
+    segments_squared_distance = context.segments_squared_distance
+    counter = count()
+    queue = [(boxes_squared_distance(first[0], second[0]), next(counter),
+              first, second)]
+    result = None
+    while queue:
+        lower_bound, _, first_node, second_node = heappop(queue)
+        if result is not None and lower_bound >= result:
+            break
+        first_children, second_children = first_node[1], second_node[1]
+        if first_children is None and second_children is None:
+            candidate = segments_squared_distance(first_node[2],
+                                                  second_node[2])
+            if result is None or candidate < result:
+                result = candidate
+                if not result:
+                    break
+            continue
+        if (second_children is None
+                or (first_children is not None
+                    and (_to_box_size(first_node[0])
+                         >= _to_box_size(second_node[0])))):
+            pairs = [(child, second_node) for child in first_children]
+        else:
+            pairs = [(first_node, child) for child in second_children]
+        for first_child, second_child in pairs:
+            lower_bound = boxes_squared_distance(first_child[0],
+                                                 second_child[0])
+            if result is None or lower_bound < result:
+                heappush(queue, (lower_bound, next(counter), first_child,
+                                 second_child))
+    return result
+
+
+def to_boxes_tree(boxes: Sequence[Box],
+                  items: Sequence[Any],
+                  context: Context) -> BoxesTree:
+    """
+    Builds packed bounding boxes tree of items
+    with Sort-Tile-Recursive algorithm.
+    """
+    nodes = [(box, None, item) for box, item in zip(boxes, items)]
+    while len(nodes) > 1:
+        nodes = _pack_nodes(nodes, context)
+    return nodes[0]
+
+
+def to_exact(value: Scalar) -> Scalar:
+    """
+    Returns value with floating point number converted to fraction,
+    so arithmetic on it does not round.
+    """
+    return Fraction(value) if isinstance(value, float) else value
+
+
+def to_intersecting_segments_pairs(segments: Sequence[Segment],
+                                   context: Context
+                                   ) -> Iterator[Tuple[int, int, Relation]]:
+    """
+    Yields pairs of ascending indices of intersecting segments
+    along with relations between them
+    joining the tree of segments' boxes with itself.
+    """
+    tree = to_boxes_tree([context.segment_box(segment)
+                          for segment in segments], range(len(segments)),
+                         context)
+    segments_relation = context.segments_relation
+    for first_index, second_index in to_overlapping_items_pairs(tree, tree):
+        if first_index < second_index:
+            relation = segments_relation(segments[first_index],
+                                         segments[second_index])
+            if relation is not Relation.DISJOINT:
+                yield first_index, second_index, relation
+
+
+def to_nearest_item(tree: BoxesTree,
+                    to_lower_bound: Callable[[Box], Scalar],
+                    to_distance: Callable[[Any], Scalar]) -> Any:
+    """
+    Returns item of the tree with the least distance
+    traversing nodes best-first
+    & stopping when lower bounds of distances reach the least found one.
+    """
+    counter = count()
+    queue = [(to_lower_bound(tree[0]), next(counter), tree)]
+    result = result_distance = None
+    while queue:
+        lower_bound, _, node = heappop(queue)
+        if result_distance is not None and lower_bound >= result_distance:
+            break
+        children = node[1]
+        if children is None:
+            distance = to_distance(node[2])
+            if result_distance is None or distance < result_distance:
+                result, result_distance = node[2], distance
+                if not result_distance:
+                    break
+            continue
+        for child in children:
+            lower_bound = to_lower_bound(child[0])
+            if result_distance is None or lower_bound < result_distance:
+                heappush(queue, (lower_bound, next(counter), child))
+    return result
+
+
+def to_nearest_items(tree: BoxesTree,
+                     to_lower_bound: Callable[[Box], Scalar]
+                     ) -> Iterator[Tuple[Scalar, Any]]:
+    """
+    Yields items of the tree along with lower bounds of distances to them
+    in ascending order of lower bounds traversing nodes best-first.
+    """
+    counter = count()
+    queue = [(to_lower_bound(tree[0]), next(counter), tree)]
+    while queue:
+        lower_bound, _, node = heappop(queue)
+        children = node[1]
+        if children is None:
+            yield lower_bound, node[2]
+            continue
+        for child in children:
+            heappush(queue, (to_lower_bound(child[0]), next(counter), child))
+
+
+def to_overlapping_items_pairs(first: BoxesTree,
+                               second: BoxesTree) -> Iterator[Tuple[Any, Any]]:
+    """
+    Yields pairs of items of the trees which boxes intersect
+    traversing both of them simultaneously depth-first
+    & pruning pairs of nodes with disjoint boxes.
+    """
+    stack = [(first, second)]
+    while stack:
+        first_node, second_node = stack.pop()
+        if boxes_disjoint(first_node[0], second_node[0]):
+            continue
+        first_children, second_children = first_node[1], second_node[1]
+        if first_children is None and second_children is None:
+            yield first_node[2], second_node[2]
+        elif (second_children is None
+              or (first_children is not None
+                  and (_to_box_size(first_node[0])
+                       >= _to_box_size(second_node[0])))):
+            stack.extend((child, second_node) for child in first_children)
+        else:
+            stack.extend((first_node, child) for child in second_children)
+
+
+def to_point_containing_items(tree: BoxesTree,
+                              point: Point) -> Tuple[List[Any],
+                                                     Optional[Scalar]]:
+    """
+    Returns items of the tree which boxes contain the point
+    along with squared distance from the point
+    to the nearest box of the tree which does not contain it (if any)
+    bounded from below by boxes of pruned nodes
+    & computed exactly for floating point coordinates.
+    """
+    items, squared_clearance = [], None
+    queue = [tree]
+    while queue:
+        box, children, item = queue.pop()
+        squared_distance = box_point_squared_distance(box, point)
+        if squared_distance:
+            if (squared_clearance is None
+                    or squared_distance < squared_clearance):
+                squared_clearance = squared_distance
+        elif children is None:
+            items.append(item)
+        else:
+            queue.extend(children)
+    return items, squared_clearance
+
+
+def to_points_tree(points: Sequence[Point], context: Context) -> BoxesTree:
+    """
+    Builds packed bounding boxes tree of points along with their indices.
+    """
+    box_cls = context.box_cls
+    return to_boxes_tree([box_cls(point.x, point.x, point.y, point.y)
+                          for point in points], list(enumerate(points)),
+                         context)
+
+
+def to_point_nearest_segment_in_tree(context: Context,
+                                     tree: SegmentsTree,
+                                     point: Point) -> Segment:
+    """
+    Returns segment of the tree nearest to the point.
+    """
+    return to_nearest_item(
+            tree, partial(box_point_squared_distance, point=point),
+            partial(_segment_point_squared_distance, context, point)
+    )
+
+
+def to_segment_nearest_segment_in_tree(context: Context,
+                                       tree: SegmentsTree,
+                                       segment: Segment) -> Segment:
+    """
+    Returns segment of the tree nearest to the segment.
+    """
+    return to_nearest_item(tree, partial(boxes_squared_distance,
+                                         context.segment_box(segment)),
+                           partial(context.segments_squared_distance,
+                                   segment))
+
+
+def to_segments_tree(segments: Sequence[Segment],
+                     context: Context) -> SegmentsTree:
+    """
+    Builds packed bounding boxes tree of segments
+    with Sort-Tile-Recursive algorithm.
+    """
+    return to_boxes_tree([context.segment_box(segment)
+                          for segment in segments], segments, context)
+
+
+def _pack_nodes(nodes: Sequence[BoxesTree],
+                context: Context) -> Sequence[BoxesTree]:
+    groups_count = ceil(len(nodes) / MAX_CHILDREN)
+    slice_size = ceil(sqrt(groups_count)) * MAX_CHILDREN
+    nodes = sorted(nodes,
+                   key=_to_node_double_center_x)
+    result = []
+    for slice_start in range(0, len(nodes), slice_size):
+        slice_nodes = sorted(nodes[slice_start:slice_start + slice_size],
+                             key=_to_node_double_center_y)
+        for start in range(0, len(slice_nodes), MAX_CHILDREN):
+            children = slice_nodes[start:start + MAX_CHILDREN]
+            box = children[0][0]
+            for child in children[1:]:
+                box = context.merged_box(box, child[0])
+            result.append((box, children, None))
+    return result
+
+
+def _segment_point_squared_distance(context: Context,
+                                    point: Point,
+                                    segment: Segment) -> Scalar:
+    return context.segment_point_squared_distance(segment, point)
+
+
+def _to_box_size(box: Box) -> Scalar:
+    return box.max_x - box.min_x + box.max_y - box.min_y
+
+
+def _to_node_double_center_x(node: BoxesTree) -> Scalar:
+    box = node[0]
+    return box.min_x + box.max_x
+
+
+def _to_node_double_center_y(node: BoxesTree) -> Scalar:
+    box = node[0]
+    return box.min_y + box.max_y
@@ -0,0 +1,299 @@
+import math
+import warnings
+from contextvars import ContextVar
+from functools import wraps
+from itertools import chain
+from numbers import (Rational,
+                     Real)
+from typing import (Callable,
+                    Iterable,
+                    Optional,
+                    Tuple,
+                    TypeVar)
+
+from ground.base import Context
+from ground.hints import (Point,
+                          Scalar)
+from reprit.base import generate_repr
+from symba.base import Expression
+
+from .geometry import Geometry
+from .iterable import flatten
+
+
+class CoordinatesComplexity:
+    __slots__ = '_max_bit_length', '_max_depth', '_mean_bit_length'
+
+    def __init__(self,
+                 max_bit_length: int,
+                 mean_bit_length: float,
+                 max_depth: int) -> None:
+        """
+        Initializes coordinates complexity.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+        """
+        self._max_bit_length, self._mean_bit_length, self._max_depth = (
+            max_bit_length, mean_bit_length, max_depth
+        )
+
+    __repr__ = generate_repr(__init__)
+
+    def __eq__(self, other: 'CoordinatesComplexity') -> bool:
+        """
+        Checks if coordinates complexities are equal.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import CoordinatesComplexity
+        >>> (CoordinatesComplexity(1, 1., 0)
+        ...  == CoordinatesComplexity(1, 1., 0))
+        True
+        """
+        return ((self._max_bit_length, self._mean_bit_length, self._max_depth)
+                == (other._max_bit_length, other._mean_bit_length,
+                    other._max_depth)
+                if isinstance(other, CoordinatesComplexity)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        """
+        Returns hash value of the coordinates complexity.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import CoordinatesComplexity
+        >>> (hash(CoordinatesComplexity(1, 1., 0))
+        ...  == hash(CoordinatesComplexity(1, 1., 0)))
+        True
+        """
+        return hash((self._max_bit_length, self._mean_bit_length,
+                     self._max_depth))
+
+    @property
+    def max_bit_length(self) -> int:
+        """
+        Returns maximum bit length among non-symbolic coordinates.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import CoordinatesComplexity
+        >>> CoordinatesComplexity(3, 2., 0).max_bit_length == 3
+        True
+        """
+        return self._max_bit_length
+
+    @property
+    def max_depth(self) -> int:
+        """
+        Returns maximum depth of symbolic coordinates.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import CoordinatesComplexity
+        >>> CoordinatesComplexity(3, 2., 0).max_depth == 0
+        True
+        """
+        return self._max_depth
+
+    @property
+    def mean_bit_length(self) -> float:
+        """
+        Returns mean bit length of non-symbolic coordinates.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import CoordinatesComplexity
+        >>> CoordinatesComplexity(3, 2., 0).mean_bit_length == 2
+        True
+        """
+        return self._mean_bit_length
+
+
+class CoordinatesComplexityWarning(UserWarning):
+    pass
+
+
+_threshold = ContextVar(
+        'threshold',
+        default=(None, None)
+)  # type: ContextVar[Tuple[Optional[int], Optional[int]]]
+
+
+def get_coordinates_complexity_threshold(
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Returns current pair of maximum coordinates bit length & depth
+    after exceeding which results of boolean operations are reported.
+
+    Time complexity:
+        ``O(1)``
+    Memory complexity:
+        ``O(1)``
+
+    >>> from gon.base import get_coordinates_complexity_threshold
+    >>> get_coordinates_complexity_threshold() == (None, None)
+    True
+    """
+    return _threshold.get()
+
+
+def set_coordinates_complexity_threshold(max_bit_length: Optional[int] = None,
+                                         max_depth: Optional[int] = None
+                                         ) -> None:
+    """
+    Sets maximum coordinates bit length & depth
+    after exceeding which results of boolean operations
+    are reported with ``CoordinatesComplexityWarning``,
+    ``None`` disables corresponding check.
+
+    Time complexity:
+        ``O(1)``
+    Memory complexity:
+        ``O(1)``
+
+    >>> from gon.base import (get_coordinates_complexity_threshold,
+    ...                       set_coordinates_complexity_threshold)
+    >>> set_coordinates_complexity_threshold(128, 2)
+    >>> get_coordinates_complexity_threshold() == (128, 2)
+    True
+    >>> set_coordinates_complexity_threshold()
+    >>> get_coordinates_complexity_threshold() == (None, None)
+    True
+    """
+    _threshold.set((max_bit_length, max_depth))
+
+
+def to_coordinates_complexity(geometry: Geometry[Scalar]
+                              ) -> CoordinatesComplexity:
+    """
+    Returns complexity of the geometry coordinates:
+    bit lengths of numerators & denominators for non-symbolic ones
+    and depth of nested square roots for symbolic ones.
+
+    Time complexity:
+        ``O(coordinates_count)``
+    Memory complexity:
+        ``O(1)``
+
+    where ``coordinates_count`` is a number of coordinates of the geometry.
+
+    >>> from fractions import Fraction
+    >>> from gon.base import (CoordinatesComplexity, Point, Segment,
+    ...                       to_coordinates_complexity)
+    >>> (to_coordinates_complexity(Segment(Point(0, 0),
+    ...                                    Point(Fraction(1, 3), 255)))
+    ...  == CoordinatesComplexity(8, 2.75, 0))
+    True
+    """
+    max_bit_length = max_depth = bit_lengths_sum = bit_lengths_count = 0
+    for coordinate in _to_coordinates(geometry, geometry._context):
+        if isinstance(coordinate, Expression):
+            max_depth = max(max_depth, coordinate.degree)
+        else:
+            bit_length = _to_bit_length(coordinate)
+            max_bit_length = max(max_bit_length, bit_length)
+            bit_lengths_sum += bit_length
+            bit_lengths_count += 1
+    return CoordinatesComplexity(max_bit_length,
+                                 (bit_lengths_sum / bit_lengths_count
+                                  if bit_lengths_count
+                                  else 0.),
+                                 max_depth)
+
+
+_Operation = TypeVar('_Operation',
+                     bound=Callable[[Geometry, Geometry], Geometry])
+
+
+def monitored(operation: _Operation) -> _Operation:
+    @wraps(operation)
+    def wrapper(self: Geometry, other: Geometry) -> Geometry:
+        result = operation(self, other)
+        max_bit_length, max_depth = _threshold.get()
+        if ((max_bit_length is not None or max_depth is not None)
+                and result is not NotImplemented):
+            _check_complexity(result, max_bit_length, max_depth)
+        return result
+
+    return wrapper
+
+
+def _check_complexity(geometry: Geometry,
+                      max_bit_length: Optional[int],
+                      max_depth: Optional[int]) -> None:
+    complexity = to_coordinates_complexity(geometry)
+    if ((max_bit_length is not None
+         and complexity.max_bit_length > max_bit_length)
+            or (max_depth is not None and complexity.max_depth > max_depth)):
+        warnings.warn('Coordinates complexity {complexity} '
+                      'exceeds threshold with maximum bit length {bit_length} '
+                      'and maximum depth {depth}.'
+                      .format(complexity=complexity,
+                              bit_length=max_bit_length,
+                              depth=max_depth),
+                      CoordinatesComplexityWarning,
+                      stacklevel=3)
+
+
+def _to_bit_length(value: Real) -> int:
+    if isinstance(value, int):
+        return abs(value).bit_length()
+    elif isinstance(value, Rational):
+        numerator, denominator = value.numerator, value.denominator
+    elif math.isfinite(value):
+        numerator, denominator = value.as_integer_ratio()
+    else:
+        return 0
+    return (abs(numerator).bit_length()
+            + (denominator.bit_length() if denominator != 1 else 0))
+
+
+def _to_coordinates(geometry: Geometry,
+                    context: Context) -> Iterable[Scalar]:
+    return flatten((point.x, point.y)
+                   for point in _to_points(geometry, context))
+
+
+def _to_points(geometry: Geometry, context: Context) -> Iterable[Point]:
+    if isinstance(geometry, context.point_cls):
+        return [geometry]
+    elif isinstance(geometry, context.multipoint_cls):
+        return geometry.points
+    elif isinstance(geometry, context.segment_cls):
+        return [geometry.start, geometry.end]
+    elif isinstance(geometry, context.multisegment_cls):
+        return flatten((segment.start, segment.end)
+                       for segment in geometry.segments)
+    elif isinstance(geometry, context.contour_cls):
+        return geometry.vertices
+    elif isinstance(geometry, context.polygon_cls):
+        return chain(geometry.border.vertices,
+                     flatten(hole.vertices for hole in geometry.holes))
+    elif isinstance(geometry, context.multipolygon_cls):
+        return flatten(_to_points(polygon, context)
+                       for polygon in geometry.polygons)
+    elif isinstance(geometry, context.mix_cls):
+        return flatten(_to_points(component, context)
+                       for component in (geometry.discrete, geometry.linear,
+                                         geometry.shaped))
+    else:
+        return []
@@ -1,4 +1,6 @@
 from abc import abstractmethod
+from typing import (List,
+                    Sequence)
 
 from ground.base import (Location,
                          Relation)
@@ -6,6 +8,10 @@ from ground.hints import (Point,
                           Scalar)
 
 from .geometry import Geometry
+from .predicates import (geometries_intersect,
+                         geometry_covers)
+from .relating import (RelationMatrix,
+                       to_relation_matrix)
 
 Relation = Relation
 Location = Location
@@ -21,11 +27,23 @@ class Compound(Geometry[Scalar]):
         Returns centroid of the geometry.
         """
 
+    def covers(self, other: 'Compound[Scalar]') -> bool:
+        """
+        Checks if the geometry covers the other.
+        """
+        return geometry_covers(self, other)
+
     def disjoint(self, other: 'Compound[Scalar]') -> bool:
         """
         Checks if the geometry is disjoint from the other.
         """
-        return self.relate(other) is Relation.DISJOINT
+        return not self.intersects(other)
+
+    def intersects(self, other: 'Compound[Scalar]') -> bool:
+        """
+        Checks if the geometry intersects the other.
+        """
+        return geometries_intersect(self, other)
 
     @abstractmethod
     def locate(self, point: Point[Scalar]) -> Location:
@@ -39,6 +57,20 @@ class Compound(Geometry[Scalar]):
         Finds relation between geometric objects.
         """
 
+    def relation_matrix(self, other: 'Compound[Scalar]') -> RelationMatrix:
+        """
+        Returns flags of intersection of each location
+        relative to the geometry with each location relative to the other,
+        indexed by the former & the latter.
+        """
+        return to_relation_matrix(self, other)
+
+    def within(self, other: 'Compound[Scalar]') -> bool:
+        """
+        Checks if the geometry lies within the other.
+        """
+        return geometry_covers(other, self)
+
     @abstractmethod
     def __and__(self, other: 'Compound[Scalar]') -> 'Compound[Scalar]':
         """
@@ -93,6 +125,10 @@ class Compound(Geometry[Scalar]):
         Returns symmetric difference of the geometry with the other geometry.
         """
 
+    def _locate_points(self, points: Sequence[Point[Scalar]]
+                       ) -> List[Location]:
+        return [self.locate(point) for point in points]
+
 
 class Linear(Geometry[Scalar]):
     __slots__ = ()
@@ -1,5 +1,7 @@
 from functools import partial
-from typing import (Optional,
+from typing import (Iterator,
+                    List,
+                    Optional,
                     Sequence)
 
 from bentley_ottmann.planar import contour_self_intersects
@@ -12,8 +14,9 @@ from clipping.planar import (complete_intersect_multisegments,
                              symmetric_subtract_multisegments,
                              unite_multisegments,
                              unite_segment_with_multisegment)
-from ground.hints import Scalar
-from locus import segmental
+from ground.base import Context
+from ground.hints import (Box,
+                          Scalar)
 from orient.planar import (multisegment_in_multisegment,
                            point_in_multisegment,
                            segment_in_multisegment)
@@ -23,27 +26,53 @@ from sect.decomposition import Graph
 from . import vertices as _vertices
 from .angle import (Angle,
                     Orientation)
+from .box_clipping import clip_contour_by_box
+from .boxes_tree import (SegmentsTree,
+                         segments_trees_squared_distance,
+                         to_intersecting_segments_pairs,
+                         to_point_nearest_segment_in_tree,
+                         to_segment_nearest_segment_in_tree,
+                         to_segments_tree)
+from .complexity import monitored
 from .compound import (Compound,
                        Indexable,
                        Linear,
                        Location,
                        Relation)
 from .geometry import Geometry
-from .iterable import (non_negative_min,
+from .iterable import (flatten,
+                       non_negative_min,
                        shift_sequence)
 from .multipoint import Multipoint
 from .multisegment import Multisegment
 from .packing import pack_mix
 from .point import Point
+from .predicates import (geometry_covers,
+                         may_cover)
+from .rasterization import (Run,
+                            rasterize_segments,
+                            validate_grid)
 from .segment import Segment
+from .similarity import (to_curves_frechet_distance,
+                         to_hausdorff_distance,
+                         to_sample_points)
+from .simplification import (SimplificationMethod,
+                             simplify_rings)
 from .utils import (relate_multipoint_to_linear_compound,
                     to_point_nearest_segment,
                     to_segment_nearest_segment)
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations,
+                         to_repeats_indices)
 
 
 class Contour(Indexable[Scalar], Linear[Scalar]):
-    __slots__ = ('_locate', '_min_index', '_point_nearest_segment',
-                 '_segment_nearest_segment', '_segments', '_vertices')
+    __slots__ = ('_hash', '_is_canonical', '_locate', '_min_index',
+                 '_orientation', '_point_nearest_segment',
+                 '_segment_nearest_segment', '_segments', '_segments_tree',
+                 '_vertices')
 
     def __init__(self, vertices: Sequence[Point[Scalar]]) -> None:
         """
@@ -61,6 +90,10 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
                               key=vertices.__getitem__)
         context = self._context
         self._segments = segments = context.contour_segments(self)
+        self._hash = None  # type: Optional[int]
+        self._is_canonical = False
+        self._orientation = None  # type: Optional[Orientation]
+        self._segments_tree = None  # type: Optional[SegmentsTree]
         self._locate = partial(point_in_multisegment,
                                multisegment=self,
                                context=context)
@@ -71,6 +104,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
 
     __repr__ = generate_repr(__init__)
 
+    @monitored
     def __and__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns intersection of the contour with the other geometry.
@@ -127,7 +161,8 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         Checks if contours are equal.
 
         Time complexity:
-            ``O(min(len(self.vertices), len(other.vertices)))``
+            ``O(min(len(self.vertices), len(other.vertices)))``,
+            ``O(1)`` for canonical contours with different hash values
         Memory complexity:
             ``O(1)``
 
@@ -142,8 +177,12 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         True
         """
         return (self is other
-                or (_vertices.equal(self._vertices, other._vertices,
-                                    self.orientation is other.orientation)
+                or (((hash(self) == hash(other)
+                      and self._vertices == other._vertices)
+                     if self._is_canonical and other._is_canonical
+                     else _vertices.equal(self._vertices, other._vertices,
+                                          (self.orientation
+                                           is other.orientation)))
                     if isinstance(other, Contour)
                     else NotImplemented))
 
@@ -169,7 +208,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         True
         """
         return (self == other
-                or ((self.relate(other) in (Relation.COMPONENT, Relation.EQUAL)
+                or ((geometry_covers(self, other)
                      if isinstance(other, (Linear, Multipoint))
                      else other <= self)
                     if isinstance(other, Compound)
@@ -197,7 +236,8 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         False
         """
         return (self != other
-                and ((self.relate(other) is Relation.COMPONENT
+                and ((may_cover(self, other)
+                      and self.relate(other) is Relation.COMPONENT
                       if isinstance(other, (Linear, Multipoint))
                       else other < self)
                      if isinstance(other, Compound)
@@ -208,7 +248,8 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         Returns hash value of the contour.
 
         Time complexity:
-            ``O(vertices_count)``
+            ``O(vertices_count)`` for the first call,
+            ``O(1)`` for subsequent ones
         Memory complexity:
             ``O(1)`` if contour is counterclockwise
             and starts from the bottom leftmost vertex,
@@ -221,13 +262,17 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         >>> hash(contour) == hash(contour)
         True
         """
-        vertices = shift_sequence(self._vertices, self._min_index)
-        return hash(vertices
+        if self._hash is None:
+            vertices = shift_sequence(self._vertices, self._min_index)
+            self._hash = hash(
+                    vertices
                     if (self._context.angle_orientation(vertices[-1],
                                                         vertices[0],
                                                         vertices[1])
                         is Orientation.COUNTERCLOCKWISE)
-                    else _vertices.rotate_positions(vertices))
+                    else _vertices.rotate_positions(vertices)
+            )
+        return self._hash
 
     def __le__(self, other: Compound[Scalar]) -> bool:
         """
@@ -253,8 +298,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         return (self == other
                 or not isinstance(other, Multipoint)
                 and (not isinstance(other, Segment)
-                     and self.relate(other) in (Relation.EQUAL,
-                                                Relation.COMPOSITE)
+                     and geometry_covers(other, self)
                      if isinstance(other, Linear)
                      else NotImplemented))
 
@@ -282,10 +326,12 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         return (self != other
                 and not isinstance(other, Multipoint)
                 and (not isinstance(other, Segment)
+                     and may_cover(other, self)
                      and self.relate(other) is Relation.COMPOSITE
                      if isinstance(other, Linear)
                      else NotImplemented))
 
+    @monitored
     def __or__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns union of the contour with the other geometry.
@@ -317,6 +363,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
 
     __ror__ = __or__
 
+    @monitored
     def __rsub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the other geometry with the contour.
@@ -337,6 +384,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
                       if isinstance(other, Multisegment)
                       else NotImplemented))
 
+    @monitored
     def __sub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the contour with the other geometry.
@@ -363,6 +411,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
                             if isinstance(other, Linear)
                             else NotImplemented)))
 
+    @monitored
     def __xor__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns symmetric difference of the contour with the other geometry.
@@ -465,11 +514,13 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         >>> contour.orientation is Orientation.COUNTERCLOCKWISE
         True
         """
-        vertices, min_index = self._vertices, self._min_index
-        return self._context.angle_orientation(
-                vertices[min_index - 1], vertices[min_index],
-                vertices[(min_index + 1) % len(vertices)]
-        )
+        if self._orientation is None:
+            vertices, min_index = self._vertices, self._min_index
+            self._orientation = self._context.angle_orientation(
+                    vertices[min_index - 1], vertices[min_index],
+                    vertices[(min_index + 1) % len(vertices)]
+            )
+        return self._orientation
 
     @property
     def vertices(self) -> Sequence[Point[Scalar]]:
@@ -490,6 +541,27 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         """
         return list(self._vertices)
 
+    def clip_by_box(self, box: Box[Scalar]) -> Compound[Scalar]:
+        """
+        Returns intersection of the contour with the box.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(self.vertices)``.
+
+        >>> from gon.base import Box, Contour, Multisegment, Point, Segment
+        >>> contour = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                    Point(0, 4)])
+        >>> (contour.clip_by_box(Box(-1, 2, -1, 2))
+        ...  == Multisegment([Segment(Point(0, 0), Point(2, 0)),
+        ...                   Segment(Point(0, 0), Point(0, 2))]))
+        True
+        """
+        return clip_contour_by_box(self, box, self._context)
+
     def distance_to(self, other: Geometry[Scalar]) -> Scalar:
         """
         Returns distance between the contour and the other geometry.
@@ -513,11 +585,82 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
                       (self._distance_to_segment(other)
                        if isinstance(other, Segment)
                        else
-                       (non_negative_min(self._distance_to_segment(segment)
-                                         for segment in other.segments)
+                       (self._distance_to_linear(other)
                         if isinstance(other, Linear)
                         else other.distance_to(self)))))
 
+    def frechet_distance(self,
+                         other: 'Contour[Scalar]',
+                         densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Fréchet distance between the contour
+        and the other contour.
+
+        Contours are traversed in their canonical forms
+        (counterclockwise & starting from the minimal vertex),
+        so neither starting vertex nor orientation affect the result.
+        Vertices are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(self_size * other_size)``
+        Memory complexity:
+            ``O(other_size)``
+
+        where ``self_size``, ``other_size`` --- numbers of sample points
+        of the contour & the other geometry respectively.
+
+        >>> from gon.base import Contour, Point
+        >>> contour = Contour([Point(0, 0), Point(1, 0), Point(0, 1)])
+        >>> contour.frechet_distance(contour) == 0
+        True
+        >>> contour.frechet_distance(contour.translate(1, 0)) == 1
+        True
+        """
+        if not isinstance(other, Contour):
+            raise TypeError('Fréchet distance is defined only '
+                            'between contours, but found {type}.'
+                            .format(type=type(other).__qualname__))
+        return to_curves_frechet_distance(
+                self._to_frechet_curves(densification),
+                other._to_frechet_curves(densification), self._context
+        )
+
+    def hausdorff_distance(self,
+                           other: Geometry[Scalar],
+                           densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Hausdorff distance between the contour
+        and the other geometry.
+
+        Vertices of geometries are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(size * log size)`` expected,
+            ``O(size ** 2)`` worst
+        Memory complexity:
+            ``O(size)``
+
+        where ``size`` --- total number of sample points of the geometries.
+
+        >>> from gon.base import Contour, Point
+        >>> contour = Contour([Point(0, 0), Point(1, 0), Point(0, 1)])
+        >>> contour.hausdorff_distance(contour) == 0
+        True
+        >>> contour.hausdorff_distance(contour.translate(1, 0)) == 1
+        True
+        """
+        return to_hausdorff_distance(
+                self._to_sample_points(densification),
+                other._to_sample_points(densification), self._context,
+                second_tree=(other._points_tree
+                             if isinstance(other, Multipoint)
+                             else None)
+        )
+
     def index(self) -> None:
         """
         Pre-processes the contour to potentially improve queries.
@@ -536,9 +679,12 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         """
         self._locate = Graph.from_multisegment(self,
                                                context=self._context).locate
-        tree = segmental.Tree(self._segments)
-        self._point_nearest_segment = tree.nearest_to_point_segment
-        self._segment_nearest_segment = tree.nearest_segment
+        self._segments_tree = tree = to_segments_tree(self._segments,
+                                                      self._context)
+        self._point_nearest_segment, self._segment_nearest_segment = (
+            partial(to_point_nearest_segment_in_tree, self._context, tree),
+            partial(to_segment_nearest_segment_in_tree, self._context, tree)
+        )
 
     def locate(self, point: Point[Scalar]) -> Location:
         """
@@ -560,6 +706,39 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         """
         return self._locate(point)
 
+    def rasterize(self,
+                  box: Box[Scalar],
+                  columns: int,
+                  rows: int) -> List[Run]:
+        """
+        Returns runs of cells of the regular grid over the box
+        which the contour passes through,
+        cells are half-open except for the last row & column
+        which include top & right sides of the box respectively.
+
+        Time complexity:
+            ``O(vertices_count + spans_count * log spans_count)``
+        Memory complexity:
+            ``O(spans_count)``
+
+        where ``vertices_count = len(self.vertices)``,
+        ``spans_count`` is the number of pairs of contour's segments
+        & rows of cells they pass through.
+
+        :param box: box to cover with the grid.
+        :param columns: number of columns of the grid.
+        :param rows: number of rows of the grid.
+        :returns: runs of cells as triplets of row index along with start
+            & stop (exclusive) indices of columns sorted by rows & columns.
+
+        >>> from gon.base import Box, Contour, Point
+        >>> contour = Contour([Point(0, 0), Point(4, 0), Point(4, 4)])
+        >>> contour.rasterize(Box(0, 4, 0, 4), 4, 4)
+        [(0, 0, 4), (1, 1, 2), (1, 3, 4), (2, 2, 4), (3, 3, 4)]
+        """
+        validate_grid(box, columns, rows)
+        return rasterize_segments(self._segments, box, columns, rows)
+
     def relate(self, other: Compound[Scalar]) -> Relation:
         """
         Finds relation between the contour and the other geometry.
@@ -656,6 +835,74 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
                 self, factor_x, factor_x if factor_y is None else factor_y
         )
 
+    def simplify(self,
+                 tolerance: Scalar,
+                 method: SimplificationMethod
+                 = SimplificationMethod.DOUGLAS_PEUCKER) -> 'Contour[Scalar]':
+        """
+        Returns the contour simplified by given method within given tolerance
+        (distance for Douglas-Peucker method, area for Visvalingam-Whyatt one)
+        so that it stays valid.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)`` expected,
+            ``O(vertices_count ** 2)`` worst
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(self.vertices)``.
+
+        >>> from gon.base import Contour, Point, SimplificationMethod
+        >>> contour = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                    Point(2, 5), Point(0, 4)])
+        >>> contour.simplify(0) == contour
+        True
+        >>> (contour.simplify(1)
+        ...  == contour.simplify(3, SimplificationMethod.VISVALINGAM_WHYATT)
+        ...  == Contour([Point(0, 0), Point(4, 0), Point(4, 4), Point(0, 4)]))
+        True
+        """
+        context = self._context
+        vertices, = simplify_rings([self._vertices], tolerance, method,
+                                   context)
+        return context.contour_cls(vertices)
+
+    def to_canonical(self) -> 'Contour[Scalar]':
+        """
+        Returns the contour in canonical form:
+        counterclockwise and starting from the minimal vertex.
+
+        Canonical contours are compared for equality
+        by hash values and vertices directly.
+
+        Time complexity:
+            ``O(1)`` if canonical already,
+            ``O(vertices_count)`` -- otherwise
+        Memory complexity:
+            ``O(1)`` if canonical already,
+            ``O(vertices_count)`` -- otherwise
+
+        where ``vertices_count = len(self.vertices)``.
+
+        >>> from gon.base import Contour, Point
+        >>> contour = Contour([Point(1, 0), Point(0, 1), Point(0, 0)])
+        >>> contour.to_canonical() == contour
+        True
+        >>> (contour.to_canonical().vertices
+        ...  == [Point(0, 0), Point(1, 0), Point(0, 1)])
+        True
+        """
+        if self._is_canonical:
+            return self
+        vertices = shift_sequence(self._vertices, self._min_index)
+        result = self._context.contour_cls(
+                vertices
+                if self.orientation is Orientation.COUNTERCLOCKWISE
+                else _vertices.rotate_positions(vertices)
+        )
+        result._is_canonical = True
+        return result
+
     def to_clockwise(self) -> 'Contour[Scalar]':
         """
         Returns the clockwise contour.
@@ -722,7 +969,7 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         """
         return self._context.translate_contour(self, step_x, step_y)
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if the contour is valid.
 
@@ -737,26 +984,39 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
         >>> contour = Contour([Point(0, 0), Point(1, 0), Point(0, 1)])
         >>> contour.validate()
         """
-        vertices = self._vertices
-        vertices_count = len(vertices)
-        if vertices_count < _vertices.MIN_COUNT:
-            raise ValueError('Contour should have '
-                             'at least {expected} vertices, '
-                             'but found {actual}.'
-                             .format(expected=_vertices.MIN_COUNT,
-                                     actual=vertices_count))
-        for vertex in vertices:
-            vertex.validate()
-        orienteer = self._context.angle_orientation
-        if any(orienteer(vertices[index - 1], vertices[index],
-                         vertices[(index + 1) % vertices_count])
-               is Orientation.COLLINEAR
-               for index in range(vertices_count)):
-            raise ValueError('Consecutive vertices triplets '
-                             'should not be on the same line.')
-        if contour_self_intersects(self,
-                                   context=self._context):
-            raise ValueError('Contour should not be self-intersecting.')
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of the contour's constraints.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(self.vertices)``.
+
+        >>> from gon.base import Contour, Point, ValidationLevel, Violation
+        >>> contour = Contour([Point(0, 0), Point(1, 0), Point(2, 0),
+        ...                    Point(0, 1)])
+        >>> (contour.violations()
+        ...  == [Violation(ValidationLevel.TOPOLOGY,
+        ...                'Consecutive vertices triplets '
+        ...                'should not be on the same line.',
+        ...                ('vertices', 1))])
+        True
+        >>> contour.violations(ValidationLevel.BASIC) == []
+        True
+        """
+        return list(self._to_violations(level))
+
+    def _distance_to_linear(self, other: Linear[Scalar]) -> Scalar:
+        return self._context.sqrt(segments_trees_squared_distance(
+                self._to_segments_tree(), other._to_segments_tree(),
+                self._context
+        ))
 
     def _distance_to_point(self, other: Point[Scalar]) -> Scalar:
         return self._context.sqrt(self._context.segment_point_squared_distance(
@@ -768,8 +1028,75 @@ class Contour(Indexable[Scalar], Linear[Scalar]):
                 self._segment_nearest_segment(other), other
         ))
 
+    def _to_frechet_curves(self, densification: Optional[Scalar]
+                           ) -> List[List[Point[Scalar]]]:
+        return [self.to_canonical()._to_sample_points(densification)]
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point[Scalar]]:
+        return to_sample_points(self.segments, densification)
+
+    def _to_segments_tree(self) -> SegmentsTree:
+        return (to_segments_tree(self._segments, self._context)
+                if self._segments_tree is None
+                else self._segments_tree)
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        vertices = self._vertices
+        vertices_count = len(vertices)
+        is_valid = vertices_count >= _vertices.MIN_COUNT
+        if not is_valid:
+            yield Violation(ValidationLevel.BASIC,
+                            'Contour should have '
+                            'at least {expected} vertices, '
+                            'but found {actual}.'
+                            .format(expected=_vertices.MIN_COUNT,
+                                    actual=vertices_count))
+        for index in to_repeats_indices(vertices):
+            is_valid = False
+            yield Violation(ValidationLevel.BASIC, 'Duplicate vertices found.',
+                            ('vertices', index))
+        for index, vertex in enumerate(vertices):
+            for violation in to_prefixed_violations(
+                    vertex._to_violations(level), 'vertices', index):
+                is_valid = False
+                yield violation
+        if level < ValidationLevel.TOPOLOGY or not is_valid:
+            return
+        orienteer = self._context.angle_orientation
+        for index in range(vertices_count):
+            if (orienteer(vertices[index - 1], vertices[index],
+                          vertices[(index + 1) % vertices_count])
+                    is Orientation.COLLINEAR):
+                is_valid = False
+                yield Violation(ValidationLevel.TOPOLOGY,
+                                'Consecutive vertices triplets '
+                                'should not be on the same line.',
+                                ('vertices', index))
+        if is_valid and contour_self_intersects(self,
+                                                context=self._context):
+            for index in _to_self_intersecting_segments_indices(
+                    self._segments, self._context):
+                yield Violation(ValidationLevel.TOPOLOGY,
+                                'Contour should not be self-intersecting.',
+                                ('segments', index))
+
     def _unite_with_multipoint(self, other: Multipoint[Scalar]
                                ) -> Compound[Scalar]:
         context = self._context
         return pack_mix(other - self, self, context.empty, context.empty,
                         context.mix_cls)
+
+
+def _to_self_intersecting_segments_indices(segments: Sequence[Segment],
+                                           context: Context) -> List[int]:
+    # consecutive segments share an endpoint & should only touch there
+    segments_count = len(segments)
+    return sorted(set(flatten(
+            (first_index, second_index)
+            for first_index, second_index, relation
+            in to_intersecting_segments_pairs(segments, context)
+            if not (relation is Relation.TOUCH
+                    and (second_index - first_index) % segments_count
+                    in (1, segments_count - 1))
+    )))
@@ -0,0 +1,333 @@
+from typing import (Dict,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+from ground.base import (Context,
+                         Location,
+                         Relation)
+from ground.hints import (Contour,
+                          Empty,
+                          Point,
+                          Polygon,
+                          Scalar,
+                          Segment)
+
+from .angle import Orientation
+
+_Crossing = Tuple[int, int, Point]
+_Chain = Sequence[Tuple[Point, Point, int]]
+
+
+def intersect_convex_polygons(first: Polygon,
+                              second: Polygon,
+                              context: Context
+                              ) -> Optional[Union[Empty, Polygon]]:
+    """
+    Returns intersection of hole-free convex polygons
+    or ``None`` if polygons are in degenerate position relative to each other.
+    """
+    first_vertices = first.border.to_counterclockwise().vertices
+    second_vertices = second.border.to_counterclockwise().vertices
+    crossings = _to_crossings(first_vertices, second_vertices, context)
+    if crossings is None:
+        return None
+    elif not crossings:
+        return (first
+                if (_locate_point_in_convex_region(first_vertices[0],
+                                                   second_vertices, context)
+                    is Location.INTERIOR)
+                else (second
+                      if (_locate_point_in_convex_region(second_vertices[0],
+                                                         first_vertices,
+                                                         context)
+                          is Location.INTERIOR)
+                      else context.empty))
+    first_walk, first_positions = _to_walk(
+            first_vertices, [(first_index, point)
+                             for first_index, _, point in crossings])
+    second_walk, second_positions = _to_walk(
+            second_vertices, [(second_index, point)
+                              for _, second_index, point in crossings])
+    cross_product = context.cross_product
+    start = next(point
+                 for first_index, second_index, point in crossings
+                 if cross_product(second_vertices[second_index],
+                                  second_vertices[(second_index + 1)
+                                                  % len(second_vertices)],
+                                  second_vertices[second_index],
+                                  first_vertices[first_index]) < 0)
+    vertices = []
+    point, on_first = start, True
+    while True:
+        walk, positions = ((first_walk, first_positions)
+                           if on_first
+                           else (second_walk, second_positions))
+        vertices.append(point)
+        index = (positions[point] + 1) % len(walk)
+        while walk[index] not in positions:
+            vertices.append(walk[index])
+            index = (index + 1) % len(walk)
+        point, on_first = walk[index], not on_first
+        if point == start:
+            break
+    return context.polygon_cls(context.contour_cls(vertices), [])
+
+
+def locate_point_in_convex_region(point: Point,
+                                  border: Contour,
+                                  context: Context) -> Location:
+    """
+    Locates point relative to the convex region
+    with binary search over wedges of the fan from the first vertex.
+    """
+    vertices = border.vertices
+    size = len(vertices)
+    if border.orientation is Orientation.COUNTERCLOCKWISE:
+        def to_vertex(index: int) -> Point:
+            return vertices[index]
+    else:
+        def to_vertex(index: int) -> Point:
+            return vertices[-index]
+    cross_product = context.cross_product
+    base = to_vertex(0)
+    first, last = to_vertex(1), to_vertex(size - 1)
+    first_cross_product = cross_product(base, first, base, point)
+    if first_cross_product < 0:
+        return Location.EXTERIOR
+    elif not first_cross_product:
+        return (Location.BOUNDARY
+                if _is_point_in_segment_box(point, base, first)
+                else Location.EXTERIOR)
+    last_cross_product = cross_product(base, last, base, point)
+    if last_cross_product > 0:
+        return Location.EXTERIOR
+    elif not last_cross_product:
+        return (Location.BOUNDARY
+                if _is_point_in_segment_box(point, base, last)
+                else Location.EXTERIOR)
+    low, high = 1, size - 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        if cross_product(base, to_vertex(middle), base, point) >= 0:
+            low = middle
+        else:
+            high = middle
+    edge_cross_product = cross_product(to_vertex(low), to_vertex(high),
+                                       to_vertex(low), point)
+    return (Location.INTERIOR
+            if edge_cross_product > 0
+            else (Location.BOUNDARY
+                  if not edge_cross_product
+                  else Location.EXTERIOR))
+
+
+def relate_convex_polygons(test: Polygon,
+                           goal: Polygon,
+                           context: Context) -> Optional[Relation]:
+    """
+    Returns relation between hole-free convex polygons
+    or ``None`` if polygons are in degenerate position relative to each other.
+    """
+    test_vertices = test.border.to_counterclockwise().vertices
+    goal_vertices = goal.border.to_counterclockwise().vertices
+    separation = min(_to_separation(test_vertices, goal_vertices, context),
+                     _to_separation(goal_vertices, test_vertices, context))
+    if separation < 0:
+        return Relation.DISJOINT
+    elif not separation:
+        return None
+    crossings = _to_crossings(test_vertices, goal_vertices, context)
+    if crossings is None:
+        return None
+    elif crossings:
+        return Relation.OVERLAP
+    else:
+        return (Relation.WITHIN
+                if (_locate_point_in_convex_region(test_vertices[0],
+                                                   goal_vertices, context)
+                    is Location.INTERIOR)
+                else Relation.COVER)
+
+
+def to_convex_polygons_separation(first: Polygon,
+                                  second: Polygon,
+                                  context: Context) -> int:
+    """
+    Returns negative value if hole-free convex polygons are disjoint,
+    zero if their interiors are disjoint, but polygons may touch,
+    positive value if their interiors intersect.
+    """
+    first_vertices = first.border.to_counterclockwise().vertices
+    second_vertices = second.border.to_counterclockwise().vertices
+    return min(_to_separation(first_vertices, second_vertices, context),
+               _to_separation(second_vertices, first_vertices, context))
+
+
+def _is_point_in_segment_box(point: Point, start: Point, end: Point) -> bool:
+    return ((start.x <= point.x <= end.x or end.x <= point.x <= start.x)
+            and (start.y <= point.y <= end.y or end.y <= point.y <= start.y))
+
+
+def _locate_point_in_convex_region(point: Point,
+                                   vertices: Sequence[Point],
+                                   context: Context) -> Location:
+    cross_product = context.cross_product
+    result = Location.INTERIOR
+    for index in range(len(vertices)):
+        start, end = vertices[index - 1], vertices[index]
+        cross_product_value = cross_product(start, end, start, point)
+        if cross_product_value < 0:
+            return Location.EXTERIOR
+        elif not cross_product_value:
+            result = Location.BOUNDARY
+    return result
+
+
+def _merge_chains(first: _Chain,
+                  second: _Chain,
+                  first_segments: Sequence[Segment],
+                  second_segments: Sequence[Segment],
+                  context: Context,
+                  result: List[_Crossing]) -> bool:
+    first_index = second_index = 0
+    while first_index < len(first) and second_index < len(second):
+        _, first_end, first_edge_index = first[first_index]
+        _, second_end, second_edge_index = second[second_index]
+        first_segment, second_segment = (first_segments[first_edge_index],
+                                         second_segments[second_edge_index])
+        relation = context.segments_relation(first_segment, second_segment)
+        if relation is Relation.CROSS:
+            result.append((first_edge_index, second_edge_index,
+                           context.segments_intersection(first_segment,
+                                                         second_segment)))
+        elif relation is not Relation.DISJOINT:
+            return False
+        first_end_key, second_end_key = ((first_end.x, first_end.y),
+                                         (second_end.x, second_end.y))
+        if first_end_key <= second_end_key:
+            first_index += 1
+        if second_end_key <= first_end_key:
+            second_index += 1
+    return True
+
+
+def _to_chains(vertices: Sequence[Point]) -> Tuple[_Chain, _Chain]:
+    """
+    Splits counterclockwise vertices of convex region
+    into lower & upper chains of edges
+    ordered lexicographically from the leftmost vertex to the rightmost one.
+    """
+    keys = [(vertex.x, vertex.y) for vertex in vertices]
+    size = len(vertices)
+    min_index = min(range(size),
+                    key=keys.__getitem__)
+    max_index = max(range(size),
+                    key=keys.__getitem__)
+    lower, upper = [], []
+    index = min_index
+    while index != max_index:
+        next_index = (index + 1) % size
+        lower.append((vertices[index], vertices[next_index], index))
+        index = next_index
+    while index != min_index:
+        next_index = (index + 1) % size
+        upper.append((vertices[next_index], vertices[index], index))
+        index = next_index
+    upper.reverse()
+    return lower, upper
+
+
+def _to_crossings(first_vertices: Sequence[Point],
+                  second_vertices: Sequence[Point],
+                  context: Context) -> Optional[List[_Crossing]]:
+    """
+    Returns crossings of convex regions' borders
+    as triplets of first edge index, second edge index & crossing point
+    or ``None`` if borders touch or overlap.
+    """
+    first_segments, second_segments = (_to_segments(first_vertices, context),
+                                       _to_segments(second_vertices, context))
+    first_chains, second_chains = (_to_chains(first_vertices),
+                                   _to_chains(second_vertices))
+    result = []
+    for first_chain in first_chains:
+        for second_chain in second_chains:
+            if not _merge_chains(first_chain, second_chain, first_segments,
+                                 second_segments, context, result):
+                return None
+    return result
+
+
+def _to_segments(vertices: Sequence[Point],
+                 context: Context) -> List[Segment]:
+    segment_cls = context.segment_cls
+    return [segment_cls(vertices[index], vertices[(index + 1) % len(vertices)])
+            for index in range(len(vertices))]
+
+
+def _to_separation(first: Sequence[Point],
+                   second: Sequence[Point],
+                   context: Context) -> int:
+    """
+    Checks if there is an edge of the first convex region
+    which line separates regions using rotating calipers.
+    """
+    cross_product = context.cross_product
+    start, end = first[-1], first[0]
+    extreme_index = max(range(len(second)),
+                        key=lambda index: cross_product(start, end, start,
+                                                        second[index]))
+    result = 1
+    for index in range(len(first)):
+        start, end = first[index - 1], first[index]
+        while cross_product(
+                start, end, second[extreme_index],
+                second[(extreme_index + 1) % len(second)]) > 0:
+            extreme_index = (extreme_index + 1) % len(second)
+        max_cross_product = cross_product(start, end, start,
+                                          second[extreme_index])
+        if max_cross_product < 0:
+            return -1
+        elif not max_cross_product:
+            result = 0
+    return result
+
+
+def _to_walk(vertices: Sequence[Point],
+             crossings: Sequence[Tuple[int, Point]]
+             ) -> Tuple[List[Point], Dict[Point, int]]:
+    """
+    Returns vertices of the region interleaved with crossings
+    along with positions of crossings.
+    """
+    edges_crossings = {}  # type: Dict[int, List[Point]]
+    for edge_index, point in crossings:
+        edges_crossings.setdefault(edge_index, []).append(point)
+    walk, positions = [], {}
+    for index, vertex in enumerate(vertices):
+        walk.append(vertex)
+        edge_crossings = edges_crossings.get(index)
+        if edge_crossings is None:
+            continue
+        end = vertices[(index + 1) % len(vertices)]
+        if vertex.x != end.x:
+            edge_crossings.sort(key=_to_x,
+                                reverse=end.x < vertex.x)
+        else:
+            edge_crossings.sort(key=_to_y,
+                                reverse=end.y < vertex.y)
+        for point in edge_crossings:
+            positions[point] = len(walk)
+            walk.append(point)
+    return walk, positions
+
+
+def _to_x(point: Point) -> Scalar:
+    return point.x
+
+
+def _to_y(point: Point) -> Scalar:
+    return point.y
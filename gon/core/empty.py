@@ -1,4 +1,6 @@
-from typing import (NoReturn,
+from typing import (Iterator,
+                    List,
+                    NoReturn,
                     Optional)
 
 from ground.hints import (Point,
@@ -10,6 +12,8 @@ from .compound import (Compound,
                        Location,
                        Relation)
 from .geometry import Geometry
+from .validation import (ValidationLevel,
+                         Violation)
 
 
 class Empty(Compound):
@@ -324,7 +328,7 @@ class Empty(Compound):
         """
         return self
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if the empty geometry is valid.
 
@@ -334,3 +338,26 @@ class Empty(Compound):
             ``O(1)``
         """
         # empty geometry considered to be always valid
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of the empty geometry.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import EMPTY
+        >>> EMPTY.violations() == []
+        True
+        """
+        return []
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> NoReturn:
+        raise ValueError('Empty geometry has no points.')
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        return iter(())
@@ -0,0 +1,375 @@
+from enum import (IntEnum,
+                  unique)
+from typing import (Dict,
+                    Hashable,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.base import get_context
+from ground.hints import (Point,
+                          Scalar)
+from reprit.base import generate_repr
+
+from .boxes_tree import (BoxesTree,
+                         to_boxes_tree,
+                         to_point_containing_items)
+from .compound import Location
+from .polygon import Polygon
+
+#: point where fences containing it were found,
+#: squared radius of the disk around the point where they stay the same
+#: & indices of the fences
+_State = Tuple[Point, Optional[Scalar], Tuple[int, ...]]
+
+
+@unique
+class TransitionKind(IntEnum):
+    """
+    Represents kinds of transitions of objects through fences.
+    """
+    #: object has entered the fence
+    ENTER = 0
+    #: object has exited the fence
+    EXIT = 1
+
+    def __repr__(self) -> str:
+        return type(self).__qualname__ + '.' + self.name
+
+
+class Transition:
+    __slots__ = '_fence_index', '_kind', '_object_id'
+
+    def __init__(self,
+                 object_id: Hashable,
+                 fence_index: int,
+                 kind: TransitionKind) -> None:
+        """
+        Initializes transition.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+        """
+        self._object_id, self._fence_index, self._kind = (object_id,
+                                                          fence_index, kind)
+
+    __repr__ = generate_repr(__init__)
+
+    def __eq__(self, other: 'Transition') -> bool:
+        """
+        Checks if transitions are equal.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Transition, TransitionKind
+        >>> (Transition('car', 0, TransitionKind.ENTER)
+        ...  == Transition('car', 0, TransitionKind.ENTER))
+        True
+        >>> (Transition('car', 0, TransitionKind.ENTER)
+        ...  == Transition('car', 0, TransitionKind.EXIT))
+        False
+        """
+        return ((self._object_id, self._fence_index, self._kind)
+                == (other._object_id, other._fence_index, other._kind)
+                if isinstance(other, Transition)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        """
+        Returns hash value of the transition.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Transition, TransitionKind
+        >>> (hash(Transition('car', 0, TransitionKind.ENTER))
+        ...  == hash(Transition('car', 0, TransitionKind.ENTER)))
+        True
+        """
+        return hash((self._object_id, self._fence_index, self._kind))
+
+    @property
+    def fence_index(self) -> int:
+        """
+        Returns index of the fence which the object has passed through.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Transition, TransitionKind
+        >>> Transition('car', 0, TransitionKind.ENTER).fence_index
+        0
+        """
+        return self._fence_index
+
+    @property
+    def kind(self) -> TransitionKind:
+        """
+        Returns kind of the transition.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Transition, TransitionKind
+        >>> (Transition('car', 0, TransitionKind.ENTER).kind
+        ...  is TransitionKind.ENTER)
+        True
+        """
+        return self._kind
+
+    @property
+    def object_id(self) -> Hashable:
+        """
+        Returns identifier of the object which has passed through the fence.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Transition, TransitionKind
+        >>> Transition('car', 0, TransitionKind.ENTER).object_id == 'car'
+        True
+        """
+        return self._object_id
+
+
+class Geofence:
+    __slots__ = '_context', '_fences', '_states', '_tree'
+
+    def __init__(self, fences: Sequence[Polygon]) -> None:
+        """
+        Initializes geofence indexing given fences.
+
+        Objects are considered inside of the fence
+        if they lie in its interior or on its boundary.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)`` expected,
+            ``O(vertices_count ** 2)`` worst
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count`` is a total number of fences' vertices.
+        """
+        self._context = context = (fences[0]._context
+                                   if fences
+                                   else get_context())
+        for fence in fences:
+            fence.index()
+        self._fences = fences
+        self._tree = (to_boxes_tree([context.polygon_box(fence)
+                                     for fence in fences],
+                                    range(len(fences)), context)
+                      if fences
+                      else None)  # type: Optional[BoxesTree]
+        self._states = {}  # type: Dict[Hashable, _State]
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def fences(self) -> Sequence[Polygon]:
+        """
+        Returns fences of the geofence.
+
+        Time complexity:
+            ``O(fences_count)``
+        Memory complexity:
+            ``O(fences_count)``
+
+        where ``fences_count = len(self.fences)``.
+
+        >>> from gon.base import Contour, Geofence, Point, Polygon
+        >>> fences = [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                            Point(0, 4)]))]
+        >>> Geofence(fences).fences == fences
+        True
+        """
+        return list(self._fences)
+
+    def locate(self, point: Point) -> List[int]:
+        """
+        Returns indices of fences which contain the point.
+
+        Time complexity:
+            ``O(log fences_count + hits_count * log vertices_count)``
+            expected,
+            ``O(fences_count + vertices_count)`` worst
+        Memory complexity:
+            ``O(hits_count)``
+
+        where ``fences_count = len(self.fences)``,
+        ``vertices_count`` is a total number of fences' vertices,
+        ``hits_count`` is a number of fences which boxes contain the point.
+
+        >>> from gon.base import Contour, Geofence, Point, Polygon
+        >>> geofence = Geofence(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)])),
+        ...          Polygon(Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+        ...                           Point(2, 6)]))])
+        >>> geofence.locate(Point(1, 1))
+        [0]
+        >>> geofence.locate(Point(3, 3))
+        [0, 1]
+        >>> geofence.locate(Point(7, 7))
+        []
+        """
+        candidates_indices, _ = self._to_candidates_indices(point)
+        return sorted(index
+                      for index in candidates_indices
+                      if (self._fences[index].locate(point)
+                          is not Location.EXTERIOR))
+
+    def process(self, updates: Iterable[Tuple[Hashable, Point]]
+                ) -> Iterator[Transition]:
+        """
+        Yields transitions of objects caused by stream of their positions.
+
+        Time complexity:
+            ``O(updates_count * update_time)``
+        Memory complexity:
+            ``O(objects_count + hits_count)``
+
+        where ``updates_count`` is a number of updates,
+        ``update_time`` is a time complexity of ``Geofence.update``,
+        ``objects_count`` is a number of tracked objects,
+        ``hits_count`` is a number of fences which contain objects.
+
+        >>> from gon.base import (Contour, Geofence, Point, Polygon,
+        ...                       Transition, TransitionKind)
+        >>> geofence = Geofence(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)]))])
+        >>> (list(geofence.process([('car', Point(-1, 1)),
+        ...                         ('car', Point(1, 1)),
+        ...                         ('car', Point(2, 1)),
+        ...                         ('car', Point(5, 1))]))
+        ...  == [Transition('car', 0, TransitionKind.ENTER),
+        ...      Transition('car', 0, TransitionKind.EXIT)])
+        True
+        """
+        for object_id, point in updates:
+            yield from self.update(object_id, point)
+
+    def remove(self, object_id: Hashable) -> List[Transition]:
+        """
+        Stops tracking of the object
+        returning exits from fences which contain it.
+
+        Time complexity:
+            ``O(hits_count)``
+        Memory complexity:
+            ``O(hits_count)``
+
+        where ``hits_count`` is a number of fences which contain the object.
+
+        >>> from gon.base import (Contour, Geofence, Point, Polygon,
+        ...                       Transition, TransitionKind)
+        >>> geofence = Geofence(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)]))])
+        >>> geofence.update('car', Point(1, 1))
+        [Transition('car', 0, TransitionKind.ENTER)]
+        >>> geofence.remove('car')
+        [Transition('car', 0, TransitionKind.EXIT)]
+        >>> geofence.remove('car')
+        []
+        """
+        try:
+            _, _, fences_indices = self._states.pop(object_id)
+        except KeyError:
+            return []
+        return [Transition(object_id, index, TransitionKind.EXIT)
+                for index in fences_indices]
+
+    def update(self, object_id: Hashable, point: Point) -> List[Transition]:
+        """
+        Updates position of the object returning its transitions:
+        exits from fences followed by entries to fences.
+
+        Fences containing the object are reused while it stays
+        closer to the position where they were found
+        than to fences' edges & boxes of other fences.
+
+        Time complexity:
+            ``O(1)`` if object stays near the previous position,
+            ``O(log fences_count + hits_count * log vertices_count)``
+            expected otherwise,
+            ``O(fences_count + vertices_count)`` worst
+        Memory complexity:
+            ``O(hits_count)``
+
+        where ``fences_count = len(self.fences)``,
+        ``vertices_count`` is a total number of fences' vertices,
+        ``hits_count`` is a number of fences which boxes contain the point.
+
+        >>> from gon.base import (Contour, Geofence, Point, Polygon,
+        ...                       Transition, TransitionKind)
+        >>> geofence = Geofence(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)])),
+        ...          Polygon(Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+        ...                           Point(2, 6)]))])
+        >>> geofence.update('car', Point(1, 1))
+        [Transition('car', 0, TransitionKind.ENTER)]
+        >>> geofence.update('car', Point(1, 2))
+        []
+        >>> geofence.update('car', Point(5, 5))
+        [Transition('car', 0, TransitionKind.EXIT),\
+ Transition('car', 1, TransitionKind.ENTER)]
+        """
+        state = self._states.get(object_id)
+        if state is None:
+            previous_indices = ()  # type: Tuple[int, ...]
+        else:
+            anchor, squared_clearance, previous_indices = state
+            if (squared_clearance is None
+                    or (self._context.points_squared_distance(anchor, point)
+                        < squared_clearance)):
+                return []
+        state = self._states[object_id] = self._to_state(point)
+        _, _, indices = state
+        return ([Transition(object_id, index, TransitionKind.EXIT)
+                 for index in previous_indices
+                 if index not in indices]
+                + [Transition(object_id, index, TransitionKind.ENTER)
+                   for index in indices
+                   if index not in previous_indices])
+
+    def _to_candidates_indices(self, point: Point
+                               ) -> Tuple[List[int], Optional[Scalar]]:
+        return (to_point_containing_items(self._tree, point)
+                if self._tree is not None
+                else ([], None))
+
+    def _to_state(self, point: Point) -> _State:
+        segment_point_squared_distance = (
+            self._context.segment_point_squared_distance)
+        candidates_indices, squared_clearance = self._to_candidates_indices(
+                point)
+        indices = []
+        for index in candidates_indices:
+            fence = self._fences[index]
+            if fence.locate(point) is not Location.EXTERIOR:
+                indices.append(index)
+            squared_distance = segment_point_squared_distance(
+                    fence._point_nearest_edge(point), point)
+            if (squared_clearance is None
+                    or squared_distance < squared_clearance):
+                squared_clearance = squared_distance
+        return point, squared_clearance, tuple(sorted(indices))
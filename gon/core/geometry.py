@@ -1,6 +1,7 @@
 from abc import (ABC,
                  abstractmethod)
 from typing import (Generic,
+                    List,
                     Optional,
                     TypeVar)
 
@@ -9,6 +10,8 @@ from ground.hints import (Point,
                           Scalar)
 
 from .angle import Angle
+from .validation import (ValidationLevel,
+                         Violation)
 
 _T = TypeVar('_T')
 
@@ -45,10 +48,18 @@ class Geometry(Generic[Scalar], ABC):
         """
 
     @abstractmethod
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
-        Checks geometric object's constraints
+        Checks geometric object's constraints up to given level
         and raises error if any violation was found.
         """
 
+    @abstractmethod
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns all violations of geometric object's constraints
+        up to given level.
+        """
+
     _context = ...  # type: Context
@@ -0,0 +1,234 @@
+from typing import (Dict,
+                    Hashable,
+                    Iterator,
+                    List,
+                    Sequence,
+                    Set,
+                    Tuple)
+
+from clipping.planar import (subtract_multipolygon_from_polygon,
+                             subtract_polygons)
+from ground.base import (Context,
+                         Location,
+                         Relation)
+from ground.hints import (Box,
+                          Contour,
+                          Point,
+                          Segment,
+                          Shaped)
+from orient.planar import (point_in_region,
+                           region_in_multiregion,
+                           region_in_region)
+
+from .boxes_tree import (boxes_squared_distance,
+                         to_boxes_tree,
+                         to_nearest_items,
+                         to_overlapping_items_pairs)
+from .locating import locate_points_in_regions
+from .validation import (ValidationLevel,
+                         Violation)
+
+
+def to_holes_violations(border: Contour,
+                        holes: Sequence[Contour],
+                        context: Context) -> Iterator[Violation]:
+    """
+    Yields violations of holes lying outside of the border
+    or tearing polygon's interior apart
+    accepting exactly the polygons which are equal
+    to the difference of the border & holes.
+
+    Since the traversal of contacts of contours' edges
+    accepts only such polygons,
+    the difference is computed just to confirm its rejections.
+    """
+    are_valid, cross_or_overlap = _classify_holes(border, holes, context)
+    if are_valid:
+        return
+    relation = region_in_multiregion(border, holes,
+                                     context=context)
+    if not (relation is Relation.COVER or relation is Relation.ENCLOSES):
+        yield Violation(ValidationLevel.FULL,
+                        'Holes should lie inside the border.', ('holes',))
+    elif (cross_or_overlap
+          or (_to_border_minus_holes(border, holes, context)
+              != context.polygon_cls(border, holes))):
+        yield Violation(ValidationLevel.FULL,
+                        'Holes should not tear polygon apart.', ('holes',))
+
+
+def _box_contains_box(goal: Box, test: Box) -> bool:
+    return (goal.min_x <= test.min_x and test.max_x <= goal.max_x
+            and goal.min_y <= test.min_y and test.max_y <= goal.max_y)
+
+
+def _classify_holes(border: Contour,
+                    holes: Sequence[Contour],
+                    context: Context) -> Tuple[bool, bool]:
+    """
+    Checks if holes lie inside of the border
+    & do not tear polygon's interior apart
+    along with if they cross or overlap each other
+    based on contacts of contours' edges collected in a single traversal
+    of pairs of edges with overlapping boxes.
+
+    Holes tear the interior apart if they cross or overlap each other,
+    if graph of contours & their touch points has a cycle
+    or if some of them lie inside of the others.
+    """
+    incidences = set()  # type: Set[Tuple[int, Point]]
+    border_cross_or_overlap = holes_cross_or_overlap = False
+    for (first_index, first_segment, second_index, second_segment,
+         relation) in _to_contours_contacts([border, *holes], context):
+        if relation is Relation.TOUCH:
+            point = _to_touch_point(first_segment, second_segment, context)
+            incidences.update(((first_index, point), (second_index, point)))
+        elif first_index:
+            holes_cross_or_overlap = True
+        else:
+            border_cross_or_overlap = True
+    return (not border_cross_or_overlap
+            and not holes_cross_or_overlap
+            and _holes_lie_inside_border(border, holes, incidences, context)
+            and not _has_touches_cycle(incidences)
+            and not _has_nested_holes(holes, context),
+            holes_cross_or_overlap)
+
+
+def _find(parents: Dict[Hashable, Hashable], node: Hashable) -> Hashable:
+    root = node
+    while parents.setdefault(root, root) != root:
+        root = parents[root]
+    while node != root:
+        parents[node], node = root, parents[node]
+    return root
+
+
+def _has_nested_holes(holes: Sequence[Contour], context: Context) -> bool:
+    """
+    Checks if some hole lies inside of the other one
+    by locating its vertices in candidates with containing boxes,
+    since holes which neither cross, nor overlap, nor touch more than once
+    either lie one inside of the other or do not share interior points.
+    """
+    boxes = [context.contour_box(hole) for hole in holes]
+    tree = to_boxes_tree(boxes, range(len(holes)), context)
+    for index, (hole, box) in enumerate(zip(holes, boxes)):
+        for lower_bound, other_index in to_nearest_items(
+                tree, lambda other_box: boxes_squared_distance(box,
+                                                               other_box)):
+            if lower_bound:
+                break
+            elif (other_index != index
+                  and _box_contains_box(boxes[other_index], box)
+                  and _region_in_region_interior(hole, holes[other_index],
+                                                 context)):
+                return True
+    return False
+
+
+def _has_touches_cycle(incidences: Set[Tuple[int, Point]]) -> bool:
+    """
+    Checks if bipartite graph of contours & points where they touch
+    has a cycle using disjoint-set forest,
+    since contours which do not cross or overlap split the plane
+    into more than one region with such a cycle only.
+    """
+    parents = {}  # type: Dict[Hashable, Hashable]
+    for index, point in incidences:
+        contour_root, point_root = _find(parents, index), _find(parents,
+                                                                 point)
+        if contour_root == point_root:
+            return True
+        parents[point_root] = contour_root
+    return False
+
+
+def _holes_lie_inside_border(border: Contour,
+                             holes: Sequence[Contour],
+                             incidences: Set[Tuple[int, Point]],
+                             context: Context) -> bool:
+    """
+    Checks if holes which do not cross or overlap the border lie inside it
+    by locating their vertices which do not touch the border
+    in a single sweep.
+    """
+    vertices = []  # type: List[Point]
+    for hole in holes:
+        for vertex in hole.vertices:
+            if (0, vertex) not in incidences:
+                vertices.append(vertex)
+                break
+        else:
+            if (region_in_region(hole, border,
+                                 context=context)
+                    is not Relation.ENCLOSED):
+                return False
+    return all(location is Location.INTERIOR
+               for location in locate_points_in_regions(vertices, [border],
+                                                        context))
+
+
+def _region_in_region_interior(region: Contour,
+                               other: Contour,
+                               context: Context) -> bool:
+    for vertex in region.vertices:
+        location = point_in_region(vertex, other,
+                                   context=context)
+        if location is not Location.BOUNDARY:
+            return location is Location.INTERIOR
+    return False
+
+
+def _to_contours_contacts(contours: Sequence[Contour],
+                          context: Context
+                          ) -> Iterator[Tuple[int, Segment, int, Segment,
+                                              Relation]]:
+    """
+    Yields pairs of non-disjoint edges of different contours
+    with ascending indices of contours & relations between edges
+    joining the tree of edges' boxes with itself.
+    """
+    edges = [(index, segment)
+             for index, contour in enumerate(contours)
+             for segment in context.contour_segments(contour)]
+    tree = to_boxes_tree([context.segment_box(segment)
+                          for _, segment in edges], range(len(edges)),
+                         context)
+    segments_relation = context.segments_relation
+    for first_edge_index, second_edge_index in to_overlapping_items_pairs(
+            tree, tree):
+        (first_index, first_segment), (second_index, second_segment) = (
+            edges[first_edge_index], edges[second_edge_index])
+        if first_index < second_index:
+            relation = segments_relation(first_segment, second_segment)
+            if relation is not Relation.DISJOINT:
+                yield (first_index, first_segment, second_index,
+                       second_segment, relation)
+
+
+def _to_border_minus_holes(border: Contour,
+                           holes: Sequence[Contour],
+                           context: Context) -> Shaped:
+    polygon_cls = context.polygon_cls
+    border_polygon = polygon_cls(border, [])
+    return (subtract_multipolygon_from_polygon(
+                    border_polygon,
+                    context.multipolygon_cls([polygon_cls(hole, [])
+                                              for hole in holes])
+            )
+            if len(holes) > 1
+            else subtract_polygons(border_polygon, polygon_cls(holes[0], [])))
+
+
+def _to_touch_point(first: Segment,
+                    second: Segment,
+                    context: Context) -> Point:
+    segment_contains_point = context.segment_contains_point
+    return (first.start
+            if segment_contains_point(second, first.start)
+            else (first.end
+                  if segment_contains_point(second, first.end)
+                  else (second.start
+                        if segment_contains_point(first, second.start)
+                        else second.end)))
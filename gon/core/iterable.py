@@ -1,5 +1,6 @@
 from itertools import chain
 from typing import (Iterable,
+                    List,
                     Sequence,
                     TypeVar)
 
@@ -21,6 +22,24 @@ def non_negative_min(values: Iterable[_T]) -> _T:
     return result
 
 
+def pairwise_sum(values: Iterable[_T], start: _T = 0) -> _T:
+    """
+    Returns sum of values adding neighbours level by level,
+    so operands of exact additions stay of similar sizes
+    unlike the ones of running sum
+    which accumulates denominators of all preceding values.
+    """
+    level = list(values)  # type: List[_T]
+    if not level:
+        return start
+    while len(level) > 1:
+        level = [level[index] + level[index + 1]
+                 if index + 1 < len(level)
+                 else level[index]
+                 for index in range(0, len(level), 2)]
+    return start + level[0]
+
+
 def shift_sequence(sequence: Sequence[_T], step: int) -> Sequence[_T]:
     return (sequence[step:] + sequence[:step]
             if step
@@ -0,0 +1,281 @@
+from array import array
+from bisect import bisect_right
+from itertools import chain
+from typing import (Callable,
+                    Dict,
+                    Iterable,
+                    List,
+                    Sequence,
+                    Set,
+                    Tuple)
+
+from ground.base import (Context,
+                         Orientation)
+from ground.hints import (Contour,
+                          Point,
+                          Polygon,
+                          Scalar)
+from sect.core.trapezoidal.leaf import Leaf
+from sect.core.trapezoidal.x_node import XNode
+from sect.core.trapezoidal.y_node import YNode
+from sect.decomposition import Graph
+
+from .compound import Location
+
+#: minimal number of points for which locating them by sweep line
+#: is faster than locating them one by one
+SWEEP_POINTS_COUNT_THRESHOLD = 64
+
+#: trapezoidal map of the polygon flattened into nodes of fixed size:
+#: leaf kind followed by flag of interior trapezoid,
+#: vertical kind followed by index of the polygon's vertex
+#: & offsets of left & right children,
+#: edge kind followed by indices of the edge's left & right vertices
+#: & offsets of below & above children
+FlatGraph = array
+
+FLAT_GRAPH_TYPECODE = 'I'
+FLAT_NODE_SIZE = 5
+LEAF_KIND, VERTICAL_KIND, EDGE_KIND = range(3)
+
+#: leftmost & rightmost endpoints of non-vertical edge
+_Edge = Tuple[Point, Point]
+_Orienteer = Callable[[Point, Point, Point], Orientation]
+
+
+def locate_point_in_flat_graph(graph: FlatGraph,
+                               vertices: Sequence[Point],
+                               point: Point,
+                               context: Context) -> Location:
+    """
+    Finds location of the point relative to the polygon
+    by descending its flat trapezoidal map.
+    """
+    orientation = context.angle_orientation
+    offset = 0
+    while True:
+        kind = graph[offset]
+        if kind == LEAF_KIND:
+            return (Location.INTERIOR
+                    if graph[offset + 1]
+                    else Location.EXTERIOR)
+        elif kind == VERTICAL_KIND:
+            vertex = vertices[graph[offset + 1]]
+            if point < vertex:
+                offset = graph[offset + 2]
+            elif vertex < point:
+                offset = graph[offset + 3]
+            else:
+                return Location.BOUNDARY
+        else:
+            point_orientation = orientation(vertices[graph[offset + 1]],
+                                            vertices[graph[offset + 2]],
+                                            point)
+            if point_orientation is Orientation.COUNTERCLOCKWISE:
+                offset = graph[offset + 4]
+            elif point_orientation is Orientation.CLOCKWISE:
+                offset = graph[offset + 3]
+            else:
+                return Location.BOUNDARY
+
+
+def locate_points_in_regions(points: Sequence[Point],
+                             regions: Iterable[Contour],
+                             context: Context) -> List[Location]:
+    """
+    Returns locations of points relative to the area bounded by regions
+    (with even-odd rule for nested ones like holes)
+    sweeping sorted points & edges from left to right
+    while keeping edges crossed by the sweep line in vertical order.
+
+    Takes ``O((points_count + edges_count) * log edges_count)`` orientation
+    tests, but ``O(edges_count * active_edges_count)`` time in the worst case
+    where ``active_edges_count`` is the largest number of edges
+    crossed by the sweep line at once,
+    since edges are inserted into & removed from the sorted list by shifting.
+    Shifts are cheap element moves, so in practice
+    the list outperforms balanced trees on comb-like regions
+    with tens of thousands of edges crossed at once.
+    """
+    orientation = context.angle_orientation
+    vertices = set()  # type: Set[Point]
+    verticals = {}  # type: Dict[Scalar, List[Tuple[Scalar, Scalar]]]
+    edges = []  # type: List[_Edge]
+    for region in regions:
+        region_vertices = region.vertices
+        vertices.update(region_vertices)
+        for index, end in enumerate(region_vertices):
+            start = region_vertices[index - 1]
+            if start.x == end.x:
+                verticals.setdefault(start.x, []).append(
+                        (start.y, end.y) if start.y < end.y else (end.y,
+                                                                  start.y))
+            else:
+                edges.append((start, end) if start.x < end.x else (end, start))
+    for spans in verticals.values():
+        spans.sort()
+    edges.sort(key=_to_edge_left_x)
+    ends_indices = sorted(range(len(edges)),
+                          key=lambda index: edges[index][1].x)
+    active_indices, inserted_indices = [], set()  # type: List[int], Set[int]
+    starts_count = ends_count = 0
+    result = [Location.EXTERIOR] * len(points)
+    for point_index in sorted(range(len(points)),
+                              key=lambda index: points[index].x):
+        point = points[point_index]
+        x = point.x
+        while (ends_count < len(ends_indices)
+               and edges[ends_indices[ends_count]][1].x <= x):
+            edge_index = ends_indices[ends_count]
+            if edge_index in inserted_indices:
+                _remove_edge(active_indices, edges, edge_index, orientation)
+            ends_count += 1
+        while starts_count < len(edges) and edges[starts_count][0].x <= x:
+            if edges[starts_count][1].x > x:
+                _insert_edge(active_indices, edges, starts_count, orientation)
+                inserted_indices.add(starts_count)
+            starts_count += 1
+        if point in vertices or _is_point_on_verticals(verticals, point):
+            result[point_index] = Location.BOUNDARY
+            continue
+        low, high = 0, len(active_indices)
+        while low < high:
+            middle = (low + high) // 2
+            left, right = edges[active_indices[middle]]
+            point_orientation = orientation(left, right, point)
+            if point_orientation is Orientation.COUNTERCLOCKWISE:
+                low = middle + 1
+            elif point_orientation is Orientation.CLOCKWISE:
+                high = middle
+            else:
+                result[point_index] = Location.BOUNDARY
+                break
+        else:
+            if low % 2:
+                result[point_index] = Location.INTERIOR
+    return result
+
+
+def to_flat_graph(polygon: Polygon) -> FlatGraph:
+    """
+    Builds trapezoidal map of the polygon
+    & flattens it with vertices referred by their indices in the polygon,
+    so it can be cheaply transferred between processes
+    unlike the deeply linked graph.
+
+    Reads nodes of ``sect`` trapezoidal map which are not its public API,
+    so ``sect`` is pinned to the minor version they come from.
+    """
+    vertices_indices = {
+        vertex: index
+        for index, vertex in enumerate(chain(
+                polygon.border.vertices,
+                *[hole.vertices for hole in polygon.holes]))
+    }
+    # nodes are numbered in breadth-first order of their first visits
+    # since shared nodes make the graph acyclic but not a tree
+    nodes = [Graph.from_polygon(polygon,
+                                context=polygon._context).root]
+    nodes_offsets = {id(nodes[0]): 0}  # type: Dict[int, int]
+    result = array(FLAT_GRAPH_TYPECODE)
+    for node in nodes:
+        if isinstance(node, Leaf):
+            result.extend((LEAF_KIND, node.trapezoid.component, 0, 0, 0))
+        elif isinstance(node, XNode):
+            result.extend((VERTICAL_KIND, vertices_indices[node.point],
+                           _to_node_offset(node.left, nodes, nodes_offsets),
+                           _to_node_offset(node.right, nodes, nodes_offsets),
+                           0))
+        elif isinstance(node, YNode):
+            edge = node.edge
+            result.extend((EDGE_KIND, vertices_indices[edge.left],
+                           vertices_indices[edge.right],
+                           _to_node_offset(node.below, nodes, nodes_offsets),
+                           _to_node_offset(node.above, nodes, nodes_offsets)))
+        else:
+            raise TypeError('Unsupported trapezoidal map node type: {type}.'
+                            .format(type=type(node).__qualname__))
+    return result
+
+
+def _insert_edge(active_indices: List[int],
+                 edges: Sequence[_Edge],
+                 edge_index: int,
+                 orientation: _Orienteer) -> None:
+    edge = edges[edge_index]
+    low, high = 0, len(active_indices)
+    while low < high:
+        middle = (low + high) // 2
+        if _is_edge_below(edge, edges[active_indices[middle]], orientation):
+            high = middle
+        else:
+            low = middle + 1
+    active_indices.insert(low, edge_index)
+
+
+def _is_edge_below(first: _Edge,
+                   second: _Edge,
+                   orientation: _Orienteer) -> bool:
+    # edges are crossed by the sweep line & do not cross each other,
+    # so the edge with the rightmost left endpoint
+    # is located relative to the other one by its endpoints
+    first_left, first_right = first
+    second_left, second_right = second
+    if first_left.x >= second_left.x:
+        first_orientation = orientation(second_left, second_right, first_left)
+        if first_orientation is Orientation.COLLINEAR:
+            first_orientation = orientation(second_left, second_right,
+                                            first_right)
+        return first_orientation is Orientation.CLOCKWISE
+    else:
+        second_orientation = orientation(first_left, first_right, second_left)
+        if second_orientation is Orientation.COLLINEAR:
+            second_orientation = orientation(first_left, first_right,
+                                             second_right)
+        return second_orientation is Orientation.COUNTERCLOCKWISE
+
+
+def _is_point_on_verticals(verticals: Dict[Scalar, List[Tuple[Scalar,
+                                                              Scalar]]],
+                           point: Point) -> bool:
+    spans = verticals.get(point.x)
+    if spans is None:
+        return False
+    index = bisect_right(spans, (point.y, point.y))
+    return any(min_y <= point.y <= max_y
+               for min_y, max_y in spans[max(index - 1, 0):index + 1])
+
+
+def _remove_edge(active_indices: List[int],
+                 edges: Sequence[_Edge],
+                 edge_index: int,
+                 orientation: _Orienteer) -> None:
+    edge = edges[edge_index]
+    low, high = 0, len(active_indices)
+    while low < high:
+        middle = (low + high) // 2
+        candidate_index = active_indices[middle]
+        if candidate_index == edge_index:
+            del active_indices[middle]
+            return
+        elif _is_edge_below(edge, edges[candidate_index], orientation):
+            high = middle
+        else:
+            low = middle + 1
+    active_indices.remove(edge_index)
+
+
+def _to_node_offset(node: object,
+                    nodes: List[object],
+                    nodes_offsets: Dict[int, int]) -> int:
+    try:
+        return nodes_offsets[id(node)]
+    except KeyError:
+        result = nodes_offsets[id(node)] = len(nodes) * FLAT_NODE_SIZE
+        nodes.append(node)
+        return result
+
+
+def _to_edge_left_x(edge: _Edge) -> Scalar:
+    left, _ = edge
+    return left.x
@@ -1,26 +1,45 @@
-from typing import Optional
-
-from ground.hints import (Maybe,
+from typing import (Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.base import Context
+from ground.hints import (Box,
+                          Maybe,
                           Scalar)
 from reprit.base import generate_repr
 
 from .angle import Angle
+from .boxes_tree import boxes_squared_distance
+from .complexity import monitored
 from .compound import (Compound,
                        Indexable,
                        Linear,
                        Location,
                        Relation,
                        Shaped)
+from .contour import Contour
 from .geometry import Geometry
 from .iterable import non_negative_min
 from .multipoint import Multipoint
+from .multipolygon import Multipolygon
+from .multisegment import Multisegment
 from .packing import (MIN_MIX_NON_EMPTY_COMPONENTS,
                       pack_mix)
 from .point import Point
+from .polygon import Polygon
+from .predicates import geometry_covers
+from .segment import Segment
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations)
 
 
 class Mix(Indexable[Scalar]):
-    __slots__ = '_components', '_discrete', '_linear', '_shaped'
+    __slots__ = ('_components', '_components_boxes', '_discrete', '_linear',
+                 '_shaped')
 
     def __init__(self,
                  discrete: Maybe[Multipoint[Scalar]],
@@ -37,9 +56,11 @@ class Mix(Indexable[Scalar]):
         self._components = self._discrete, self._linear, self._shaped = (
             discrete, linear, shaped
         )
+        self._components_boxes = None  # type: Optional[Sequence[Box]]
 
     __repr__ = generate_repr(__init__)
 
+    @monitored
     def __and__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns intersection of the mix with the other geometry.
@@ -277,10 +298,7 @@ class Mix(Indexable[Scalar]):
                      or not isinstance(other, Shaped)
                      and (not isinstance(other, Mix)
                           or other.shaped is self._context.empty))
-                    and self.relate(other) in (Relation.EQUAL,
-                                               Relation.COMPONENT,
-                                               Relation.ENCLOSED,
-                                               Relation.WITHIN)
+                    and geometry_covers(self, other)
                     if isinstance(other, Compound)
                     else NotImplemented))
 
@@ -436,10 +454,7 @@ class Mix(Indexable[Scalar]):
                          or not isinstance(other, Linear)
                          and (not isinstance(other, Mix)
                               or other.shaped is not self._context.empty))
-                    and self.relate(other) in (Relation.COVER,
-                                               Relation.ENCLOSES,
-                                               Relation.COMPOSITE,
-                                               Relation.EQUAL)
+                    and geometry_covers(other, self)
                     if isinstance(other, Compound)
                     else NotImplemented))
 
@@ -499,6 +514,7 @@ class Mix(Indexable[Scalar]):
                      if isinstance(other, Compound)
                      else NotImplemented))
 
+    @monitored
     def __or__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns union of the mix with the other geometry.
@@ -575,6 +591,7 @@ class Mix(Indexable[Scalar]):
 
     __ror__ = __or__
 
+    @monitored
     def __rsub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the other geometry with the mix.
@@ -611,6 +628,7 @@ class Mix(Indexable[Scalar]):
         return ((other - self.discrete) & (other - self.linear)
                 & other - self.shaped)
 
+    @monitored
     def __sub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the mix with the other geometry.
@@ -659,6 +677,7 @@ class Mix(Indexable[Scalar]):
                         self.shaped - other, self._context.empty,
                         self._context.mix_cls)
 
+    @monitored
     def __xor__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns symmetric difference of the mix with the other geometry.
@@ -901,9 +920,27 @@ class Mix(Indexable[Scalar]):
         >>> mix.distance_to(mix) == 0
         True
         """
-        return non_negative_min(component.distance_to(other)
-                                for component in self._components
-                                if component is not self._context.empty)
+        context = self._context
+        other_box = (None
+                     if self._components_boxes is None
+                     else _to_box(other, context))
+        if other_box is None:
+            return non_negative_min(component.distance_to(other)
+                                    for component in self._components
+                                    if component is not context.empty)
+        result = None
+        for lower_bound, component in sorted(
+                [(boxes_squared_distance(box, other_box), component)
+                 for box, component in zip(self._components_boxes,
+                                           self._components)
+                 if component is not context.empty],
+                key=_to_first):
+            if result is not None and lower_bound >= result * result:
+                break
+            candidate = component.distance_to(other)
+            if result is None or candidate < result:
+                result = candidate
+        return result
 
     def index(self) -> None:
         """
@@ -955,6 +992,11 @@ class Mix(Indexable[Scalar]):
             self.linear.index()
         if isinstance(self.shaped, Indexable):
             self.shaped.index()
+        context = self._context
+        self._components_boxes = [
+            None if component is context.empty else _to_box(component, context)
+            for component in self._components
+        ]
 
     def locate(self, point: Point[Scalar]) -> Location:
         """
@@ -1256,7 +1298,7 @@ class Mix(Indexable[Scalar]):
                                      self.linear.translate(step_x, step_y),
                                      self.shaped.translate(step_x, step_y))
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if the mix is valid.
 
@@ -1299,39 +1341,56 @@ class Mix(Indexable[Scalar]):
         ...                             Point(4, 2)])]))
         >>> mix.validate()
         """
-        if (sum(component is not self._context.empty for component in
-                self._components)
-                < MIN_MIX_NON_EMPTY_COMPONENTS):
-            raise ValueError('At least {count} components should not be empty.'
-                             .format(count=MIN_MIX_NON_EMPTY_COMPONENTS))
-        for component in self._components:
-            component.validate()
-        if (not self.discrete.disjoint(self.linear)
-                or not self.discrete.disjoint(self.shaped)):
-            raise ValueError('Discrete component should be disjoint '
-                             'from other components.')
-        shaped_linear_relation = self.shaped.relate(self.linear)
-        if shaped_linear_relation in (Relation.CROSS, Relation.COMPONENT,
-                                      Relation.ENCLOSED, Relation.WITHIN):
-            raise ValueError('Linear component should not {} shaped component.'
-                             .format('cross'
-                                     if (shaped_linear_relation
-                                         is Relation.CROSS)
-                                     else 'be subset of'))
-        elif (shaped_linear_relation is Relation.TOUCH
-              and any(polygon.border.relate(self.linear)
-                      in (Relation.OVERLAP, Relation.COMPOSITE)
-                      or any(hole.relate(self.linear)
-                             in (Relation.OVERLAP, Relation.COMPOSITE)
-                             for hole in polygon.holes)
-                      for polygon in (
-                              self.shaped.polygons
-                              if isinstance(self.shaped,
-                                            self._context.multipolygon_cls)
-                              else [self.shaped]
-                      ))):
-            raise ValueError('Linear component should not overlap '
-                             'shaped component borders.')
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of the mix's constraints.
+
+        Time complexity:
+            ``O(elements_count * log elements_count)``
+        Memory complexity:
+            ``O(elements_count)``
+
+        where
+
+            .. code-block:: python
+
+                elements_count = discrete_size + linear_size\
+ + shaped_vertices_count
+                discrete_size = len(points)
+                linear_size = len(segments)
+                shaped_vertices_count = (sum(len(polygon.border.vertices)
+                                         + sum(len(hole.vertices)
+                                               for hole in polygon.holes)
+                                         for polygon in polygons)
+                points = [] if self.discrete is EMPTY else self.discrete.points
+                segments = ([]
+                            if self.linear is EMPTY
+                            else ([self.linear]
+                                  if isinstance(self.linear, Segment)
+                                  else self.linear.segments))
+                polygons = ([]
+                            if self.shaped is EMPTY
+                            else (self.shaped.polygons
+                                  if isinstance(self.linear, Multipolygon)
+                                  else [self.shaped]))
+
+        >>> from gon.base import (EMPTY, Contour, Mix, Multipoint, Point,
+        ...                       Polygon, ValidationLevel, Violation)
+        >>> mix = Mix(Multipoint([Point(3, 3)]), EMPTY,
+        ...           Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]), []))
+        >>> (mix.violations()
+        ...  == [Violation(ValidationLevel.FULL,
+        ...                'Discrete component should be disjoint '
+        ...                'from other components.', ('discrete',))])
+        True
+        >>> mix.violations(ValidationLevel.TOPOLOGY) == []
+        True
+        """
+        return list(self._to_violations(level))
 
     def _relate_linear(self, other: Linear[Scalar]) -> Relation:
         if self.shaped is self._context.empty:
@@ -1369,12 +1428,10 @@ class Mix(Indexable[Scalar]):
                             else Relation.TOUCH)
             elif (shaped_relation is Relation.TOUCH
                   or shaped_relation is Relation.CROSS):
-                rest_other = other - self.shaped
-                linear_relation = self.linear.relate(rest_other)
-                return (Relation.COMPONENT
-                        if (linear_relation is Relation.EQUAL
-                            or linear_relation is Relation.COMPONENT)
-                        else shaped_relation)
+                return (shaped_relation
+                        if (self.relation_matrix(other)[Location.EXTERIOR]
+                            [Location.BOUNDARY])
+                        else Relation.COMPONENT)
             else:
                 return shaped_relation
 
@@ -1833,82 +1890,18 @@ class Mix(Indexable[Scalar]):
             return shaped_components_relation
 
     def _relate_discrete(self, other: Multipoint[Scalar]) -> Relation:
-        if self.shaped is self._context.empty:
-            linear_relation = self.linear.relate(other)
-            if linear_relation is Relation.DISJOINT:
-                discrete_relation = self.discrete.relate(other)
-                return (discrete_relation
-                        if discrete_relation is Relation.DISJOINT
-                        else (Relation.COMPONENT
-                              if (discrete_relation is Relation.COMPONENT
-                                  or discrete_relation is Relation.EQUAL)
-                              else Relation.TOUCH))
-            elif linear_relation is Relation.TOUCH:
-                rest_other = other - self.linear
-                discrete_relation = self.discrete.relate(rest_other)
-                return (Relation.COMPONENT
-                        if (discrete_relation is Relation.EQUAL
-                            or discrete_relation is Relation.COMPONENT)
-                        else linear_relation)
-            else:
-                return linear_relation
-        else:
-            shaped_relation = self.shaped.relate(other)
-            if shaped_relation in (Relation.COMPONENT,
-                                   Relation.ENCLOSED,
-                                   Relation.WITHIN):
-                return shaped_relation
-            elif (shaped_relation is Relation.TOUCH
-                  or shaped_relation is Relation.CROSS):
-                rest_other = other - self.shaped
-                if self.linear is self._context.empty:
-                    discrete_relation = self.discrete.relate(rest_other)
-                    return (Relation.COMPONENT
-                            if (discrete_relation is Relation.EQUAL
-                                or discrete_relation is Relation.COMPONENT)
-                            else shaped_relation)
-                else:
-                    linear_relation = self.linear.relate(rest_other)
-                    if linear_relation is Relation.DISJOINT:
-                        discrete_relation = self.discrete.relate(rest_other)
-                        return ((Relation.COMPONENT
-                                 if shaped_relation is Relation.TOUCH
-                                 else Relation.ENCLOSED)
-                                if (discrete_relation is Relation.COMPONENT
-                                    or discrete_relation is Relation.EQUAL)
-                                else shaped_relation)
-                    elif linear_relation is Relation.TOUCH:
-                        rest_other -= self.linear
-                        discrete_relation = self.discrete.relate(rest_other)
-                        return (Relation.COMPONENT
-                                if (discrete_relation is Relation.COMPONENT
-                                    or discrete_relation is Relation.EQUAL)
-                                else shaped_relation)
-                    else:
-                        return (Relation.COMPONENT
-                                if shaped_relation is Relation.TOUCH
-                                else Relation.ENCLOSED)
-            else:
-                linear_relation = self.linear.relate(other)
-                if linear_relation is Relation.DISJOINT:
-                    discrete_relation = self.discrete.relate(other)
-                    return (shaped_relation
-                            if discrete_relation is Relation.DISJOINT
-                            else (Relation.COMPONENT
-                                  if (discrete_relation is Relation.COMPONENT
-                                      or discrete_relation is Relation.EQUAL)
-                                  else Relation.TOUCH))
-                elif linear_relation is Relation.TOUCH:
-                    rest_other = other - self.linear
-                    discrete_relation = self.discrete.relate(rest_other)
-                    return (shaped_relation
-                            if discrete_relation is Relation.DISJOINT
-                            else (Relation.COMPONENT
-                                  if (discrete_relation is Relation.COMPONENT
-                                      or discrete_relation is Relation.EQUAL)
-                                  else Relation.TOUCH))
-                else:
-                    return linear_relation
+        matrix = self.relation_matrix(other)
+        has_interior, has_boundary, has_exterior = (
+            matrix[Location.INTERIOR][Location.BOUNDARY],
+            matrix[Location.BOUNDARY][Location.BOUNDARY],
+            matrix[Location.EXTERIOR][Location.BOUNDARY])
+        return ((Relation.CROSS if has_exterior else Relation.WITHIN)
+                if has_interior
+                else ((Relation.TOUCH
+                       if has_exterior
+                       else Relation.COMPONENT)
+                      if has_boundary
+                      else Relation.DISJOINT))
 
     def _relate_shaped(self, other: Shaped[Scalar]) -> Relation:
         if self.shaped is self._context.empty:
@@ -2042,3 +2035,88 @@ class Mix(Indexable[Scalar]):
                 return (Relation.COMPONENT
                         if shaped_relation is Relation.EQUAL
                         else shaped_relation)
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point[Scalar]]:
+        return [point
+                for component in self._components
+                if component is not self._context.empty
+                for point in component._to_sample_points(densification)]
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        context = self._context
+        is_valid = (sum(component is not context.empty
+                        for component in self._components)
+                    >= MIN_MIX_NON_EMPTY_COMPONENTS)
+        if not is_valid:
+            yield Violation(ValidationLevel.BASIC,
+                            'At least {count} components should not be empty.'
+                            .format(count=MIN_MIX_NON_EMPTY_COMPONENTS))
+        for name, component in zip(('discrete', 'linear', 'shaped'),
+                                   self._components):
+            for violation in to_prefixed_violations(
+                    component._to_violations(level), name):
+                is_valid = False
+                yield violation
+        if level < ValidationLevel.FULL or not is_valid:
+            return
+        if (not self.discrete.disjoint(self.linear)
+                or not self.discrete.disjoint(self.shaped)):
+            yield Violation(ValidationLevel.FULL,
+                            'Discrete component should be disjoint '
+                            'from other components.', ('discrete',))
+        shaped_linear_relation = self.shaped.relate(self.linear)
+        if shaped_linear_relation in (Relation.CROSS, Relation.COMPONENT,
+                                      Relation.ENCLOSED, Relation.WITHIN):
+            yield Violation(ValidationLevel.FULL,
+                            'Linear component should not {} shaped component.'
+                            .format('cross'
+                                    if (shaped_linear_relation
+                                        is Relation.CROSS)
+                                    else 'be subset of'), ('linear',))
+        elif (shaped_linear_relation is Relation.TOUCH
+              and any(polygon.border.relate(self.linear)
+                      in (Relation.OVERLAP, Relation.COMPOSITE)
+                      or any(hole.relate(self.linear)
+                             in (Relation.OVERLAP, Relation.COMPOSITE)
+                             for hole in polygon.holes)
+                      for polygon in (
+                              self.shaped.polygons
+                              if isinstance(self.shaped,
+                                            context.multipolygon_cls)
+                              else [self.shaped]
+                      ))):
+            yield Violation(ValidationLevel.FULL,
+                            'Linear component should not overlap '
+                            'shaped component borders.', ('linear',))
+
+
+def _to_box(geometry: Geometry, context: Context) -> Optional[Box]:
+    if isinstance(geometry, Point):
+        return context.box_cls(geometry.x, geometry.x, geometry.y, geometry.y)
+    elif isinstance(geometry, Multipoint):
+        return context.points_box(geometry.points)
+    elif isinstance(geometry, Segment):
+        return context.segment_box(geometry)
+    elif isinstance(geometry, Multisegment):
+        return context.segments_box(geometry.segments)
+    elif isinstance(geometry, Contour):
+        return context.contour_box(geometry)
+    elif isinstance(geometry, Polygon):
+        return context.polygon_box(geometry)
+    elif isinstance(geometry, Multipolygon):
+        return context.polygons_box(geometry.polygons)
+    elif isinstance(geometry, Mix):
+        boxes = [_to_box(component, context)
+                 for component in geometry._components
+                 if component is not context.empty]
+        result = boxes[0]
+        for box in boxes[1:]:
+            result = context.merged_box(result, box)
+        return result
+    else:
+        return None
+
+
+def _to_first(pair: Tuple[Scalar, Maybe[Compound]]) -> Scalar:
+    return pair[0]
@@ -1,15 +1,25 @@
 from functools import partial
+from heapq import nsmallest
 from typing import (AbstractSet,
+                    Iterator,
+                    List,
                     Optional,
-                    Sequence)
+                    Sequence,
+                    Tuple)
 
 from ground.base import Context
-from ground.hints import (Maybe,
+from ground.hints import (Box,
+                          Maybe,
                           Scalar)
-from locus import kd
 from reprit.base import generate_repr
 
 from .angle import Angle
+from .boxes_tree import (BoxesTree,
+                         box_point_squared_distance,
+                         to_exact,
+                         to_nearest_items,
+                         to_overlapping_items_pairs,
+                         to_points_tree)
 from .compound import (Compound,
                        Indexable,
                        Location,
@@ -17,10 +27,17 @@ from .compound import (Compound,
 from .geometry import Geometry
 from .iterable import non_negative_min
 from .point import Point
+from .similarity import (to_curves_frechet_distance,
+                         to_hausdorff_distance)
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations,
+                         to_repeats_indices)
 
 
 class Multipoint(Indexable[Scalar]):
-    __slots__ = '_points', '_points_set', '_nearest_point'
+    __slots__ = '_nearest_point', '_points', '_points_set', '_points_tree'
 
     def __init__(self, points: Sequence[Point[Scalar]]) -> None:
         """
@@ -35,6 +52,7 @@ class Multipoint(Indexable[Scalar]):
         """
         self._points, self._points_set = points, frozenset(points)
         self._nearest_point = partial(_to_nearest_point, self._context, points)
+        self._points_tree = None  # type: Optional[BoxesTree]
 
     __repr__ = generate_repr(__init__)
 
@@ -57,8 +75,9 @@ class Multipoint(Indexable[Scalar]):
         return (self._pack_points(self._points_set & other._points_set
                                   if isinstance(other, Multipoint)
                                   else [point
-                                        for point in self._points
-                                        if point in other])
+                                        for point, location
+                                        in self._to_located_points(other)
+                                        if location is not Location.EXTERIOR])
                 if isinstance(other, Compound)
                 else NotImplemented)
 
@@ -253,8 +272,9 @@ class Multipoint(Indexable[Scalar]):
         return (self._pack_points(self._points_set - other._points_set
                                   if isinstance(other, Multipoint)
                                   else [point
-                                        for point in self._points
-                                        if point not in other])
+                                        for point, location
+                                        in self._to_located_points(other)
+                                        if location is Location.EXTERIOR])
                 if isinstance(other, Compound)
                 else NotImplemented)
 
@@ -338,6 +358,75 @@ class Multipoint(Indexable[Scalar]):
                       if isinstance(other, Multipoint)
                       else other.distance_to(self)))
 
+    def frechet_distance(self,
+                         other: 'Multipoint[Scalar]',
+                         densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Fréchet distance between the multipoint
+        and the other multipoint.
+
+        Points are traversed in sorted order
+        since multipoints are unordered, so densification has no effect.
+
+        Time complexity:
+            ``O(self_size * other_size)``
+        Memory complexity:
+            ``O(other_size)``
+
+        where ``self_size``, ``other_size`` --- numbers of sample points
+        of the multipoint & the other geometry respectively.
+
+        >>> from gon.base import Multipoint, Point
+        >>> multipoint = Multipoint([Point(0, 0), Point(1, 0), Point(0, 1)])
+        >>> multipoint.frechet_distance(multipoint) == 0
+        True
+        >>> multipoint.frechet_distance(multipoint.translate(1, 0)) == 1
+        True
+        """
+        if not isinstance(other, Multipoint):
+            raise TypeError('Fréchet distance is defined only '
+                            'between multipoints, but found {type}.'
+                            .format(type=type(other).__qualname__))
+        return to_curves_frechet_distance(
+                self._to_frechet_curves(densification),
+                other._to_frechet_curves(densification), self._context
+        )
+
+    def hausdorff_distance(self,
+                           other: Geometry[Scalar],
+                           densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Hausdorff distance between the multipoint
+        and the other geometry.
+
+        Points of the multipoint are used as they are,
+        other geometries are sampled by their vertices
+        with points added by densification.
+
+        Time complexity:
+            ``O(size * log size)`` expected,
+            ``O(size ** 2)`` worst
+        Memory complexity:
+            ``O(size)``
+
+        where ``size`` --- total number of sample points of the geometries.
+
+        >>> from gon.base import Multipoint, Point
+        >>> multipoint = Multipoint([Point(0, 0), Point(1, 0), Point(0, 1)])
+        >>> multipoint.hausdorff_distance(multipoint) == 0
+        True
+        >>> multipoint.hausdorff_distance(multipoint.translate(1, 0)) == 1
+        True
+        """
+        return to_hausdorff_distance(
+                self._to_sample_points(densification),
+                other._to_sample_points(densification), self._context,
+                first_tree=self._points_tree,
+                second_tree=(other._points_tree
+                             if isinstance(other, Multipoint)
+                             else None)
+        )
+
     def index(self) -> None:
         """
         Pre-processes the multipoint to potentially improve queries.
@@ -353,7 +442,10 @@ class Multipoint(Indexable[Scalar]):
         >>> multipoint = Multipoint([Point(0, 0), Point(1, 0), Point(0, 1)])
         >>> multipoint.index()
         """
-        self._nearest_point = kd.Tree(self._points).nearest_point
+        points, context = self._points, self._context
+        self._points_tree = points_tree = to_points_tree(points, context)
+        self._nearest_point = partial(_to_indexed_nearest_point, context,
+                                      points_tree)
 
     def locate(self, point: Point[Scalar]) -> Location:
         """
@@ -375,6 +467,41 @@ class Multipoint(Indexable[Scalar]):
                 if point in self._points_set
                 else Location.EXTERIOR)
 
+    def nearest(self,
+                point: Point[Scalar],
+                k: int = 1) -> List[Tuple[int, Point[Scalar]]]:
+        """
+        Returns indices with points of the multipoint
+        which are the nearest to the given point
+        ordered by distance to it with ties broken by index.
+
+        Time complexity:
+            ``O(k * log points_count)`` expected if indexed,
+            ``O(points_count * log k)`` otherwise
+        Memory complexity:
+            ``O(k)``
+
+        where ``points_count = len(self.points)``.
+
+        >>> from gon.base import Multipoint, Point
+        >>> multipoint = Multipoint([Point(0, 0), Point(3, 0), Point(0, 2)])
+        >>> multipoint.nearest(Point(1, 0)) == [(0, Point(0, 0))]
+        True
+        >>> (multipoint.nearest(Point(1, 0), 2)
+        ...  == [(0, Point(0, 0)), (1, Point(3, 0))])
+        True
+        """
+        if k <= 0:
+            raise ValueError('Number of nearest points should be positive, '
+                             'but found {k}.'.format(k=k))
+        key = partial(_to_item_squared_distance, self._context, point)
+        return (nsmallest(k, enumerate(self._points),
+                          key=key)
+                if self._points_tree is None
+                else sorted(_to_tied_nearest_items(self._points_tree, point,
+                                                   k),
+                            key=key)[:k])
+
     def relate(self, other: Compound[Scalar]) -> Relation:
         """
         Finds relation between the multipoint and the other geometry.
@@ -472,7 +599,7 @@ class Multipoint(Indexable[Scalar]):
         """
         return self._context.translate_multipoint(self, step_x, step_y)
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if the multipoint is valid.
 
@@ -485,13 +612,99 @@ class Multipoint(Indexable[Scalar]):
         >>> multipoint = Multipoint([Point(0, 0), Point(1, 0), Point(0, 1)])
         >>> multipoint.validate()
         """
-        points = self._points
-        if not points:
-            raise ValueError('Multipoint is empty.')
-        elif len(points) > len(self._points_set):
-            raise ValueError('Duplicate points found.')
-        for point in points:
-            point.validate()
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of the multipoint's constraints.
+
+        Time complexity:
+            ``O(len(self.points))``
+        Memory complexity:
+            ``O(len(self.points))``
+
+        >>> from gon.base import Multipoint, Point, ValidationLevel, Violation
+        >>> multipoint = Multipoint([Point(0, 0), Point(1, 0), Point(0, 0)])
+        >>> (multipoint.violations()
+        ...  == [Violation(ValidationLevel.BASIC, 'Duplicate points found.',
+        ...                ('points', 2))])
+        True
+        """
+        return list(self._to_violations(level))
+
+    def within_box(self, box: Box[Scalar]) -> List[Tuple[int, Point[Scalar]]]:
+        """
+        Returns indices with points of the multipoint
+        which lie inside of the given box or on its boundary
+        ordered by index.
+
+        Time complexity:
+            ``O(log points_count + hits_count)`` expected if indexed,
+            ``O(points_count)`` otherwise
+        Memory complexity:
+            ``O(hits_count)``
+
+        where ``points_count = len(self.points)``,
+        ``hits_count`` --- number of found points.
+
+        >>> from gon.base import Box, Multipoint, Point
+        >>> multipoint = Multipoint([Point(0, 0), Point(3, 0), Point(0, 2)])
+        >>> (multipoint.within_box(Box(0, 1, 0, 2))
+        ...  == [(0, Point(0, 0)), (2, Point(0, 2))])
+        True
+        """
+        return (sorted(item
+                       for item, _ in to_overlapping_items_pairs(
+                            self._points_tree, (box, None, None)))
+                if self._points_tree is not None
+                else [(index, point)
+                      for index, point in enumerate(self._points)
+                      if (box.min_x <= point.x <= box.max_x
+                          and box.min_y <= point.y <= box.max_y)])
+
+    def within_distance(self,
+                        point: Point[Scalar],
+                        radius: Scalar) -> List[Tuple[int, Point[Scalar]]]:
+        """
+        Returns indices with points of the multipoint
+        which distance to the given point does not exceed the radius
+        ordered by index.
+
+        Time complexity:
+            ``O(log points_count + hits_count * log hits_count)``
+            expected if indexed, ``O(points_count)`` otherwise
+        Memory complexity:
+            ``O(log points_count + hits_count)``
+
+        where ``points_count = len(self.points)``,
+        ``hits_count`` --- number of points within the distance.
+
+        >>> from gon.base import Multipoint, Point
+        >>> multipoint = Multipoint([Point(0, 0), Point(3, 0), Point(0, 2)])
+        >>> (multipoint.within_distance(Point(1, 0), 2)
+        ...  == [(0, Point(0, 0)), (1, Point(3, 0))])
+        True
+        """
+        if radius < 0:
+            raise ValueError('Radius should be non-negative, '
+                             'but found {radius}.'.format(radius=radius))
+        exact_radius = to_exact(radius)
+        squared_radius = exact_radius * exact_radius
+        if self._points_tree is None:
+            points_squared_distance = self._context.points_squared_distance
+            return [(index, candidate)
+                    for index, candidate in enumerate(self._points)
+                    if (points_squared_distance(candidate, point)
+                        <= squared_radius)]
+        result = []
+        for squared_distance, item in _to_nearest_items(self._points_tree,
+                                                        point):
+            if squared_distance > squared_radius:
+                break
+            result.append(item)
+        result.sort()
+        return result
 
     def _distance_to_point(self, other: Point[Scalar]) -> Scalar:
         return self._context.sqrt(self._context.points_squared_distance(
@@ -503,8 +716,7 @@ class Multipoint(Indexable[Scalar]):
 
     def _relate_geometry(self, other: Compound[Scalar]) -> Relation:
         disjoint = is_subset = not_interior = not_boundary = True
-        for point in self._points:
-            location = other.locate(point)
+        for location in other._locate_points(self._points):
             if location is Location.INTERIOR:
                 if disjoint:
                     disjoint = False
@@ -529,6 +741,30 @@ class Multipoint(Indexable[Scalar]):
                             if is_subset
                             else Relation.CROSS)))
 
+    def _to_located_points(self, other: Compound[Scalar]
+                           ) -> Iterator[Tuple[Point[Scalar], Location]]:
+        return zip(self._points, other._locate_points(self._points))
+
+    def _to_frechet_curves(self, densification: Optional[Scalar]
+                           ) -> List[List[Point[Scalar]]]:
+        return [sorted(self._points)]
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point[Scalar]]:
+        return list(self._points)
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        points = self._points
+        if not points:
+            yield Violation(ValidationLevel.BASIC, 'Multipoint is empty.')
+        elif len(points) > len(self._points_set):
+            for index in to_repeats_indices(points):
+                yield Violation(ValidationLevel.BASIC,
+                                'Duplicate points found.', ('points', index))
+        for index, point in enumerate(points):
+            yield from to_prefixed_violations(point._to_violations(level),
+                                              'points', index)
+
 
 def _relate_sets(left: AbstractSet, right: AbstractSet) -> Relation:
     if left == right:
@@ -543,6 +779,40 @@ def _relate_sets(left: AbstractSet, right: AbstractSet) -> Relation:
             else Relation.DISJOINT)
 
 
+def _to_indexed_nearest_point(context: Context,
+                              tree: BoxesTree,
+                              point: Point[Scalar]) -> Point[Scalar]:
+    _, (_, result) = next(_to_nearest_items(tree, point))
+    return result
+
+
+def _to_item_squared_distance(context: Context,
+                              point: Point[Scalar],
+                              item: Tuple[int, Point[Scalar]]
+                              ) -> Tuple[Scalar, int]:
+    index, candidate = item
+    return context.points_squared_distance(candidate, point), index
+
+
+def _to_nearest_items(tree: BoxesTree,
+                      point: Point[Scalar]
+                      ) -> Iterator[Tuple[Scalar, Tuple[int, Point[Scalar]]]]:
+    return to_nearest_items(tree, partial(box_point_squared_distance,
+                                          point=point))
+
+
+def _to_tied_nearest_items(tree: BoxesTree,
+                           point: Point[Scalar],
+                           k: int) -> List[Tuple[int, Point[Scalar]]]:
+    result, last_squared_distance = [], None
+    for squared_distance, item in _to_nearest_items(tree, point):
+        if len(result) >= k and squared_distance != last_squared_distance:
+            break
+        result.append(item)
+        last_squared_distance = squared_distance
+    return result
+
+
 def _to_nearest_point(context: Context,
                       points: Sequence[Point[Scalar]],
                       point: Point[Scalar]) -> Point[Scalar]:
@@ -1,6 +1,13 @@
+from array import array
+from concurrent.futures import Executor
 from functools import partial
-from typing import (Optional,
-                    Sequence)
+from operator import methodcaller
+from typing import (Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
 from bentley_ottmann.planar import segments_cross_or_overlap
 from clipping.planar import (complete_intersect_multipolygons,
@@ -22,17 +29,29 @@ from clipping.planar import (complete_intersect_multipolygons,
                              unite_multisegment_with_multipolygon,
                              unite_polygon_with_multipolygon,
                              unite_segment_with_multipolygon)
-from ground.base import Context
-from ground.hints import Scalar
-from locus import r
+from ground.hints import (Box,
+                          Scalar)
 from orient.planar import (multipolygon_in_multipolygon,
                            multisegment_in_multipolygon,
-                           point_in_multipolygon,
                            polygon_in_multipolygon,
                            segment_in_multipolygon)
 from reprit.base import generate_repr
 
 from .angle import Angle
+from .box_clipping import (box_to_polygon,
+                          clip_polygons_by_box)
+from .boxes_tree import (BoxesTree,
+                         SegmentsTree,
+                         box_point_squared_distance,
+                         box_segment_squared_distance,
+                         pack_trees,
+                         segments_trees_squared_distance,
+                         to_boxes_tree,
+                         to_intersecting_segments_pairs,
+                         to_nearest_items,
+                         to_point_containing_items,
+                         to_segments_tree)
+from .complexity import monitored
 from .compound import (Compound,
                        Indexable,
                        Linear,
@@ -43,17 +62,45 @@ from .contour import Contour
 from .geometry import Geometry
 from .iterable import (flatten,
                        non_negative_min)
+from .locating import (SWEEP_POINTS_COUNT_THRESHOLD,
+                       locate_points_in_regions,
+                       to_flat_graph)
 from .multipoint import Multipoint
 from .packing import pack_mix
+from .parallel import map_raw
 from .point import Point
-from .polygon import Polygon
+from .polygon import (Polygon,
+                      Triangulation)
+from .predicates import (geometry_covers,
+                         may_cover)
+from .rasterization import (Run,
+                            rasterize_regions,
+                            validate_grid)
 from .segment import Segment
+from .similarity import (to_curves_frechet_distance,
+                         to_hausdorff_distance,
+                         to_sample_points)
+from .simplification import (SimplificationMethod,
+                             simplify_coverage)
+from .triangular import (TriangularArrays,
+                         merge_triangular_arrays,
+                         sample_triangular_arrays,
+                         to_cumulative_areas,
+                         to_readonly_buffers)
+from .validation import (Path,
+                         ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations,
+                         to_repeats_indices)
 
 MIN_MULTIPOLYGON_POLYGONS_COUNT = 2
 
 
 class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
-    __slots__ = '_locate', '_polygons', '_polygons_set'
+    __slots__ = ('_hash', '_is_canonical', '_locate_component', '_polygons',
+                 '_polygons_set', '_polygons_tree', '_segments_tree',
+                 '_triangles_cumulative_areas', '_triangulation_arrays')
 
     def __init__(self, polygons: Sequence[Polygon[Scalar]]) -> None:
         """
@@ -74,12 +121,18 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                                      for polygon in self.polygons)
         """
         self._polygons, self._polygons_set = polygons, frozenset(polygons)
-        self._locate = partial(point_in_multipolygon,
-                               multipolygon=self,
-                               context=self._context)
+        self._hash = None  # type: Optional[int]
+        self._is_canonical = False
+        self._polygons_tree = None  # type: Optional[BoxesTree]
+        self._segments_tree = None  # type: Optional[SegmentsTree]
+        self._triangles_cumulative_areas = None  # type: Optional[array]
+        self._triangulation_arrays = None  # type: Optional[TriangularArrays]
+        self._locate_component = partial(_locate_component_in_polygons,
+                                         polygons)
 
     __repr__ = generate_repr(__init__)
 
+    @monitored
     def __and__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns intersection of the multipolygon with the other geometry.
@@ -183,7 +236,8 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         Checks if multipolygons are equal.
 
         Time complexity:
-            ``O(len(self.polygons))``
+            ``O(len(self.polygons))``,
+            ``O(1)`` for canonical multipolygons with different hash values
         Memory complexity:
             ``O(1)``
 
@@ -200,7 +254,12 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         >>> multipolygon == multipolygon
         True
         """
-        return self is other or (self._polygons_set == other._polygons_set
+        return self is other or ((hash(self) == hash(other)
+                                  and self._polygons == other._polygons
+                                  if (self._is_canonical
+                                      and other._is_canonical)
+                                  else (self._polygons_set
+                                        == other._polygons_set))
                                  if isinstance(other, Multipolygon)
                                  else NotImplemented)
 
@@ -237,8 +296,7 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (other is self._context.empty
                 or self == other
-                or (self.relate(other) in (Relation.EQUAL, Relation.COMPONENT,
-                                           Relation.ENCLOSED, Relation.WITHIN)
+                or (geometry_covers(self, other)
                     if isinstance(other, Compound)
                     else NotImplemented))
 
@@ -275,17 +333,20 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (other is self._context.empty
                 or self != other
-                and (self.relate(other) in (Relation.COMPONENT,
-                                            Relation.ENCLOSED, Relation.WITHIN)
+                and (may_cover(self, other)
+                     and self.relate(other) in (Relation.COMPONENT,
+                                                Relation.ENCLOSED,
+                                                Relation.WITHIN)
                      if isinstance(other, Compound)
                      else NotImplemented))
 
     def __hash__(self) -> int:
         """
-        Returns hash value of the polygon.
+        Returns hash value of the multipolygon.
 
         Time complexity:
-            ``O(len(self.polygons))``
+            ``O(len(self.polygons))`` for the first call,
+            ``O(1)`` for subsequent ones
         Memory complexity:
             ``O(1)``
 
@@ -302,7 +363,9 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         >>> hash(multipolygon) == hash(multipolygon)
         True
         """
-        return hash(self._polygons_set)
+        if self._hash is None:
+            self._hash = hash(self._polygons_set)
+        return self._hash
 
     def __le__(self, other: Compound[Scalar]) -> bool:
         """
@@ -337,10 +400,7 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (self == other
                 or not isinstance(other, (Multipoint, Linear))
-                and (self.relate(other) in (Relation.COVER,
-                                            Relation.ENCLOSES,
-                                            Relation.COMPOSITE,
-                                            Relation.EQUAL)
+                and (geometry_covers(other, self)
                      if isinstance(other, Shaped)
                      else NotImplemented))
 
@@ -377,12 +437,14 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (self != other
                 and not isinstance(other, (Multipoint, Linear))
-                and (self.relate(other) in (Relation.COVER,
-                                            Relation.ENCLOSES,
-                                            Relation.COMPOSITE)
+                and (may_cover(other, self)
+                     and self.relate(other) in (Relation.COVER,
+                                                Relation.ENCLOSES,
+                                                Relation.COMPOSITE)
                      if isinstance(other, Shaped)
                      else NotImplemented))
 
+    @monitored
     def __or__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns union of the multipolygon with the other geometry.
@@ -434,6 +496,7 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
 
     __ror__ = __or__
 
+    @monitored
     def __rsub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the other geometry with the multipolygon.
@@ -465,6 +528,7 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                   if isinstance(other, Polygon)
                   else NotImplemented)))
 
+    @monitored
     def __sub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the multipolygon with the other geometry.
@@ -507,6 +571,7 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                        if isinstance(other, Multipolygon)
                        else NotImplemented)))
 
+    @monitored
     def __xor__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns symmetric difference of the multipolygon
@@ -701,6 +766,39 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return list(self._polygons)
 
+    def clip_by_box(self, box: Box[Scalar]) -> Compound[Scalar]:
+        """
+        Returns intersection of the multipolygon with the box.
+
+        Time complexity:
+            ``O(vertices_count)`` for multipolygons in general position
+            relative to the box, ``O(vertices_count * log vertices_count)``
+            otherwise
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in self.polygons)``.
+
+        >>> from gon.base import Box, Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon([
+        ...     Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+        ...                      Point(0, 2)]), []),
+        ...     Polygon(Contour([Point(4, 0), Point(6, 0), Point(6, 2),
+        ...                      Point(4, 2)]), [])])
+        >>> (multipolygon.clip_by_box(Box(1, 3, -1, 1))
+        ...  == Polygon(Contour([Point(1, 0), Point(2, 0), Point(2, 1),
+        ...                      Point(1, 1)]), []))
+        True
+        >>> multipolygon.clip_by_box(Box(0, 6, 0, 2)) == multipolygon
+        True
+        """
+        result = clip_polygons_by_box(self._polygons, box, self._context)
+        return (self & box_to_polygon(box, self._context)
+                if result is None
+                else result)
+
     def distance_to(self, other: Geometry[Scalar]) -> Scalar:
         """
         Returns distance between the multipolygon and the other geometry.
@@ -742,25 +840,107 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                  (self._distance_to_segment(other)
                   if isinstance(other, Segment)
                   else
-                  (non_negative_min(self._distance_to_segment(segment)
-                                    for segment in other.segments)
+                  (self._distance_to_linear(other)
                    if isinstance(other, Linear)
-                   else
-                   (non_negative_min(self._distance_to_segment(edge)
-                                     for edge in other.edges)
-                    if isinstance(other, Polygon)
-                    else ((non_negative_min(self._distance_to_segment(edge)
-                                            for polygon in other.polygons
-                                            for edge in polygon.edges)
-                           if self.disjoint(other)
-                           else 0)
-                          if isinstance(other, Multipolygon)
-                          else other.distance_to(self)))))))
+                   else (self._distance_to_shaped(other)
+                         if isinstance(other, (Multipolygon, Polygon))
+                         else other.distance_to(self))))))
+
+    def frechet_distance(self,
+                         other: 'Multipolygon[Scalar]',
+                         densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Fréchet distance between the multipolygon
+        and the other multipolygon
+        as the largest of distances between borders & holes of polygons
+        paired in order of their canonical forms.
+
+        Multipolygons should have the same total number of contours.
+        Vertices are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(self_size * other_size)``
+        Memory complexity:
+            ``O(other_size)``
+
+        where ``self_size``, ``other_size`` --- numbers of sample points
+        of the multipolygon & the other geometry respectively.
+
+        >>> from gon.base import Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(14, 0), Point(14, 14),
+        ...                           Point(0, 14)]),
+        ...                  [Contour([Point(2, 2), Point(2, 12),
+        ...                            Point(12, 12), Point(12, 2)])]),
+        ...          Polygon(Contour([Point(4, 4), Point(10, 4), Point(10, 10),
+        ...                           Point(4, 10)]),
+        ...                  [Contour([Point(6, 6), Point(6, 8), Point(8, 8),
+        ...                            Point(8, 6)])])])
+        >>> multipolygon.frechet_distance(multipolygon) == 0
+        True
+        >>> multipolygon.frechet_distance(multipolygon.translate(1, 0)) == 1
+        True
+        """
+        if not isinstance(other, Multipolygon):
+            raise TypeError('Fréchet distance is defined only '
+                            'between multipolygons, but found {type}.'
+                            .format(type=type(other).__qualname__))
+        return to_curves_frechet_distance(
+                self._to_frechet_curves(densification),
+                other._to_frechet_curves(densification), self._context
+        )
+
+    def hausdorff_distance(self,
+                           other: Geometry[Scalar],
+                           densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Hausdorff distance between the multipolygon
+        and the other geometry.
+
+        Vertices of geometries are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(size * log size)`` expected,
+            ``O(size ** 2)`` worst
+        Memory complexity:
+            ``O(size)``
+
+        where ``size`` --- total number of sample points of the geometries.
+
+        >>> from gon.base import Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(14, 0), Point(14, 14),
+        ...                           Point(0, 14)]),
+        ...                  [Contour([Point(2, 2), Point(2, 12),
+        ...                            Point(12, 12), Point(12, 2)])]),
+        ...          Polygon(Contour([Point(4, 4), Point(10, 4), Point(10, 10),
+        ...                           Point(4, 10)]),
+        ...                  [Contour([Point(6, 6), Point(6, 8), Point(8, 8),
+        ...                            Point(8, 6)])])])
+        >>> multipolygon.hausdorff_distance(multipolygon) == 0
+        True
+        >>> multipolygon.hausdorff_distance(multipolygon.translate(1, 0)) == 1
+        True
+        """
+        return to_hausdorff_distance(
+                self._to_sample_points(densification),
+                other._to_sample_points(densification), self._context,
+                second_tree=(other._points_tree
+                             if isinstance(other, Multipoint)
+                             else None)
+        )
 
-    def index(self) -> None:
+    def index(self, executor: Optional[Executor] = None) -> None:
         """
         Pre-processes the multipolygon to potentially improve queries.
 
+        If executor is given, polygons' points locating structures
+        are built in its workers.
+
         Time complexity:
             ``O(vertices_count * log vertices_count)`` expected,
             ``O(vertices_count ** 2)`` worst
@@ -789,15 +969,25 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         >>> multipolygon.index()
         """
         polygons = self.polygons
-        for polygon in polygons:
-            polygon.index()
+        if executor is None:
+            for polygon in polygons:
+                polygon.index()
+        else:
+            for polygon, graph in zip(polygons,
+                                      map_raw(to_flat_graph, polygons,
+                                              executor)):
+                polygon._index_with_flat_graph(graph)
         context = self._context
         to_polygon_box = context.polygon_box
-        tree = r.Tree([to_polygon_box(polygon) for polygon in polygons],
-                      context=context)
-        self._locate = partial(_locate_point_in_indexed_polygons, polygons,
-                               tree,
-                               context=context)
+        boxes = [to_polygon_box(polygon) for polygon in polygons]
+        tree = to_boxes_tree(boxes, range(len(polygons)), context)
+        self._locate_component = partial(
+                _locate_component_in_indexed_polygons, polygons, tree
+        )
+        self._polygons_tree = tree
+        self._segments_tree = pack_trees([polygon._segments_tree
+                                          for polygon in polygons],
+                                         context)
 
     def locate(self, point: Point[Scalar]) -> Location:
         """
@@ -845,7 +1035,141 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         >>> multipolygon.locate(Point(7, 7)) is Location.EXTERIOR
         True
         """
-        return self._locate(point)
+        _, location = self._locate_component(point)
+        return location
+
+    def locate_component(self, point: Point[Scalar]
+                         ) -> Tuple[Optional[int], Location]:
+        """
+        Finds index of the polygon which contains the point
+        along with location of the point relative to the multipolygon,
+        index is ``None`` for exterior points
+        & the least one for points shared by polygons' boundaries.
+
+        Time complexity:
+            ``O(log vertices_count)`` expected after indexing,
+            ``O(vertices_count)`` worst after indexing or without it
+        Memory complexity:
+            ``O(1)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in self.polygons)
+
+        >>> from gon.base import (Contour, Location, Multipolygon, Point,
+        ...                       Polygon)
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)])),
+        ...          Polygon(Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+        ...                           Point(4, 4)]))])
+        >>> (multipolygon.locate_component(Point(1, 1))
+        ...  == (0, Location.INTERIOR))
+        True
+        >>> (multipolygon.locate_component(Point(4, 2))
+        ...  == (0, Location.BOUNDARY))
+        True
+        >>> (multipolygon.locate_component(Point(5, 1))
+        ...  == (1, Location.INTERIOR))
+        True
+        >>> (multipolygon.locate_component(Point(9, 1))
+        ...  == (None, Location.EXTERIOR))
+        True
+        """
+        return self._locate_component(point)
+
+    def locate_components(self, points: Iterable[Point[Scalar]]
+                          ) -> List[Tuple[Optional[int], Location]]:
+        """
+        Finds indices of polygons which contain the points
+        along with locations of the points relative to the multipolygon.
+
+        Time complexity:
+            ``O(points_count * log vertices_count)`` expected after indexing,
+            ``O(points_count * vertices_count)`` worst after indexing
+            or without it
+        Memory complexity:
+            ``O(points_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in self.polygons)
+                points_count = len(points)
+
+        >>> from gon.base import (Contour, Location, Multipolygon, Point,
+        ...                       Polygon)
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)])),
+        ...          Polygon(Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+        ...                           Point(4, 4)]))])
+        >>> (multipolygon.locate_components([Point(1, 1), Point(5, 1),
+        ...                                  Point(9, 1)])
+        ...  == [(0, Location.INTERIOR), (1, Location.INTERIOR),
+        ...      (None, Location.EXTERIOR)])
+        True
+        """
+        locate_component = self._locate_component
+        return [locate_component(point) for point in points]
+
+    def rasterize(self,
+                  box: Box[Scalar],
+                  columns: int,
+                  rows: int) -> List[Run]:
+        """
+        Returns runs of cells of the regular grid over the box
+        which centers lie inside of the multipolygon
+        (cells with centers on its boundary may be included),
+        found by scanning rows of cells centers over the table of edges.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count + rows\
+ + crossings_count)``
+        Memory complexity:
+            ``O(vertices_count + runs_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in self.polygons)
+                runs_count = len(self.rasterize(box, columns, rows))
+
+        and ``crossings_count`` is the number of crossings of edges
+        with lines of cells centers.
+
+        :param box: box to cover with the grid.
+        :param columns: number of columns of the grid.
+        :param rows: number of rows of the grid.
+        :returns: runs of cells as triplets of row index along with start
+            & stop (exclusive) indices of columns sorted by rows & columns.
+
+        >>> from gon.base import Box, Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+        ...                           Point(0, 2)])),
+        ...          Polygon(Contour([Point(4, 4), Point(6, 4), Point(6, 6),
+        ...                           Point(4, 6)]))])
+        >>> multipolygon.rasterize(Box(0, 6, 0, 6), 3, 3)
+        [(0, 0, 1), (2, 2, 3)]
+        """
+        validate_grid(box, columns, rows)
+        return rasterize_regions(flatten([polygon.border, *polygon.holes]
+                                     for polygon in self._polygons),
+                                 box, columns, rows)
 
     def relate(self, other: Compound[Scalar]) -> Relation:
         """
@@ -941,6 +1265,64 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
             return self._context.rotate_multipolygon(self, angle.cosine,
                                                      angle.sine, point)
 
+    def sample(self,
+               count: int,
+               *,
+               seed: Optional[int] = None) -> List[Point[float]]:
+        """
+        Returns uniformly distributed random points
+        with ``float`` coordinates inside of the multipolygon.
+
+        Triangles of the cached triangulation are chosen
+        by binary search over their cumulative areas,
+        so no points are rejected.
+
+        Time complexity:
+            ``O(sum(polygon_vertices_count ** 2 for polygon in polygons)\
+ + count * log vertices_count)`` for the first call,
+            ``O(count * log vertices_count)`` for subsequent ones
+        Memory complexity:
+            ``O(vertices_count + count)``
+
+        where
+
+            .. code-block:: python
+
+                polygon_vertices_count = (len(polygon.border.vertices)
+                                          + sum(len(hole.vertices)\
+ for hole in polygon.holes))
+                vertices_count = sum(polygon_vertices_count\
+ for polygon in self.polygons)
+
+        :param count: number of points to sample.
+        :param seed: seed of random numbers generator,
+            same seeds give same points.
+        :returns: sampled points.
+
+        >>> from gon.base import (Contour, Location, Multipolygon, Point,
+        ...                       Polygon)
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(1, 0),
+        ...                           Point(0, 1)])),
+        ...          Polygon(Contour([Point(2, 0), Point(3, 0),
+        ...                           Point(2, 1)]))])
+        >>> points = multipolygon.sample(10, seed=0)
+        >>> len(points)
+        10
+        >>> all(multipolygon.locate(point) is not Location.EXTERIOR
+        ...     for point in points)
+        True
+        >>> multipolygon.sample(10, seed=0) == points
+        True
+        """
+        if self._triangles_cumulative_areas is None:
+            self._triangles_cumulative_areas = to_cumulative_areas(
+                    self._to_triangulation_arrays()
+            )
+        return sample_triangular_arrays(self._to_triangulation_arrays(),
+                                        self._triangles_cumulative_areas,
+                                        count, seed, self._context)
+
     def scale(self,
               factor_x: Scalar,
               factor_y: Optional[Scalar] = None) -> Compound[Scalar]:
@@ -989,6 +1371,142 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                 self, factor_x, factor_x if factor_y is None else factor_y
         )
 
+    def simplify(self,
+                 tolerance: Scalar,
+                 method: SimplificationMethod
+                 = SimplificationMethod.DOUGLAS_PEUCKER
+                 ) -> 'Multipolygon[Scalar]':
+        """
+        Returns the multipolygon simplified by given method
+        within given tolerance (distance for Douglas-Peucker method,
+        area for Visvalingam-Whyatt one) so that it stays valid.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)`` expected,
+            ``O(vertices_count ** 2)`` worst
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in self.polygons)
+
+        >>> from gon.base import Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(2, 5), Point(0, 4)]), []),
+        ...          Polygon(Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+        ...                           Point(4, 8)]), [])])
+        >>> multipolygon.simplify(0) == multipolygon
+        True
+        >>> (multipolygon.simplify(1)
+        ...  == Multipolygon([Polygon(Contour([Point(0, 0), Point(4, 0),
+        ...                                    Point(4, 4), Point(0, 4)]), []),
+        ...                   Polygon(Contour([Point(4, 4), Point(8, 4),
+        ...                                    Point(8, 8), Point(4, 8)]),
+        ...                           [])]))
+        True
+        """
+        return self._context.multipolygon_cls(
+                simplify_coverage(self._polygons, tolerance, method)
+        )
+
+    def to_canonical(self) -> 'Multipolygon[Scalar]':
+        """
+        Returns the multipolygon in canonical form:
+        with canonical polygons sorted by vertices of borders.
+
+        Canonical multipolygons are compared for equality
+        by hash values and polygons directly.
+
+        Time complexity:
+            ``O(1)`` if canonical already,
+            ``O(vertices_count + polygons_count * log polygons_count)``
+            -- otherwise
+        Memory complexity:
+            ``O(1)`` if canonical already,
+            ``O(vertices_count)`` -- otherwise
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in self.polygons)
+                polygons_count = len(self.polygons)
+
+        >>> from gon.base import Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(4, 4), Point(10, 4), Point(10, 10),
+        ...                           Point(4, 10)]),
+        ...                  [Contour([Point(6, 6), Point(6, 8), Point(8, 8),
+        ...                            Point(8, 6)])]),
+        ...          Polygon(Contour([Point(0, 0), Point(14, 0), Point(14, 14),
+        ...                           Point(0, 14)]),
+        ...                  [Contour([Point(2, 2), Point(2, 12),
+        ...                            Point(12, 12), Point(12, 2)])])])
+        >>> multipolygon.to_canonical() == multipolygon
+        True
+        >>> (multipolygon.to_canonical().polygons[0].border
+        ...  == Contour([Point(0, 0), Point(14, 0), Point(14, 14),
+        ...              Point(0, 14)]))
+        True
+        """
+        if self._is_canonical:
+            return self
+        result = self._context.multipolygon_cls(
+                sorted([polygon.to_canonical() for polygon in self._polygons],
+                       key=_to_border_vertices)
+        )
+        result._is_canonical = True
+        return result
+
+    def to_triangulation_buffers(self) -> Tuple[memoryview, memoryview]:
+        """
+        Returns triangulation of the multipolygon as flat read-only buffers:
+        interleaved ``float`` coordinates of the polygons' vertices
+        (in order of polygons, border's ones first, then holes' ones)
+        along with ``unsigned int`` indices of the vertices,
+        each consecutive triplet of which forms counterclockwise triangle.
+
+        Time complexity:
+            ``O(sum(polygon_vertices_count ** 2 for polygon in polygons))``
+            for the first call, ``O(1)`` for subsequent ones
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                polygon_vertices_count = (len(polygon.border.vertices)
+                                          + sum(len(hole.vertices)\
+ for hole in polygon.holes))
+                vertices_count = sum(polygon_vertices_count\
+ for polygon in self.polygons)
+
+        >>> from gon.base import Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(1, 0),
+        ...                           Point(0, 1)])),
+        ...          Polygon(Contour([Point(2, 0), Point(3, 0),
+        ...                           Point(2, 1)]))])
+        >>> coordinates, indices = multipolygon.to_triangulation_buffers()
+        >>> coordinates.tolist() == [0., 0., 1., 0., 0., 1.,
+        ...                          2., 0., 3., 0., 2., 1.]
+        True
+        >>> indices.tolist()
+        [0, 1, 2, 3, 4, 5]
+        """
+        return to_readonly_buffers(self._to_triangulation_arrays())
+
     def translate(self,
                   step_x: Scalar,
                   step_y: Scalar) -> 'Multipolygon[Scalar]':
@@ -1033,10 +1551,47 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return self._context.translate_multipolygon(self, step_x, step_y)
 
-    def validate(self) -> None:
+    def triangulate(self) -> List[Triangulation]:
+        """
+        Returns triangulations of the multipolygon's polygons.
+
+        Time complexity:
+            ``O(sum(polygon_vertices_count ** 2 for polygon in polygons))``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                polygon_vertices_count = (len(polygon.border.vertices)
+                                          + sum(len(hole.vertices)\
+ for hole in polygon.holes))
+                vertices_count = sum(polygon_vertices_count\
+ for polygon in self.polygons)
+
+        >>> from gon.base import Contour, Multipolygon, Point, Polygon
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(1, 0),
+        ...                           Point(0, 1)])),
+        ...          Polygon(Contour([Point(2, 0), Point(3, 0),
+        ...                           Point(2, 1)]))])
+        >>> ([triangulation.triangles()
+        ...   for triangulation in multipolygon.triangulate()]
+        ...  == [[Contour([Point(0, 0), Point(1, 0), Point(0, 1)])],
+        ...      [Contour([Point(2, 0), Point(3, 0), Point(2, 1)])]])
+        True
+        """
+        return [polygon.triangulate() for polygon in self._polygons]
+
+    def validate(self,
+                 level: ValidationLevel = ValidationLevel.FULL,
+                 executor: Optional[Executor] = None) -> None:
         """
         Checks if the multipolygon is valid.
 
+        If executor is given, polygons are validated in its workers.
+
         Time complexity:
             ``O(vertices_count * log (vertices_count))``
         Memory complexity:
@@ -1063,33 +1618,129 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
         ...                            Point(8, 6)])])])
         >>> multipolygon.validate()
         """
-        if len(self.polygons) < MIN_MULTIPOLYGON_POLYGONS_COUNT:
-            raise ValueError('Multipolygon should have '
-                             'at least {min_size} polygons, '
-                             'but found {size}.'
-                             .format(min_size=MIN_MULTIPOLYGON_POLYGONS_COUNT,
-                                     size=len(self.polygons)))
-        elif len(self.polygons) > len(self._polygons_set):
-            raise ValueError('Duplicate polygons found.')
-        for polygon in self.polygons:
-            polygon.validate()
-        if segments_cross_or_overlap(
-                list(flatten(polygon.edges for polygon in self.polygons)),
-                context=self._context
-        ):
-            raise ValueError('Polygons should only touch each other '
-                             'in discrete number of points.')
+        raise_first(self._to_violations(level, executor))
+
+    def violations(self,
+                   level: ValidationLevel = ValidationLevel.FULL,
+                   executor: Optional[Executor] = None) -> List[Violation]:
+        """
+        Returns violations of the multipolygon's constraints.
+
+        If executor is given, polygons are validated in its workers.
+
+        Time complexity:
+            ``O(vertices_count * log (vertices_count))``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in self.polygons)
+
+        >>> from gon.base import (Contour, Multipolygon, Point, Polygon,
+        ...                       ValidationLevel, Violation)
+        >>> multipolygon = Multipolygon(
+        ...         [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                           Point(0, 4)]), []),
+        ...          Polygon(Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+        ...                           Point(2, 6)]), [])])
+        >>> (multipolygon.violations()
+        ...  == [Violation(ValidationLevel.TOPOLOGY,
+        ...                'Polygons should only touch each other '
+        ...                'in discrete number of points.',
+        ...                ('polygons', polygon_index, 'border', 'segments',
+        ...                 segment_index))
+        ...      for polygon_index, segment_index in [(0, 2), (0, 3), (1, 0),
+        ...                                           (1, 1)]])
+        True
+        >>> multipolygon.violations(ValidationLevel.BASIC) == []
+        True
+        """
+        return list(self._to_violations(level, executor))
 
     def _as_multiregion(self) -> Sequence[Contour[Scalar]]:
         return [polygon.border for polygon in self.polygons]
 
+    def _distance_to_linear(self, other: Linear[Scalar]) -> Scalar:
+        squared_distance = segments_trees_squared_distance(
+                self._to_segments_tree(), other._to_segments_tree(),
+                self._context
+        )
+        return (0
+                if (not squared_distance
+                    or any(self.locate(point) is Location.INTERIOR
+                           for point in ([other.vertices[0]]
+                                         if isinstance(other, Contour)
+                                         else [segment.start
+                                               for segment
+                                               in other.segments])))
+                else self._context.sqrt(squared_distance))
+
     def _distance_to_point(self, other: Point[Scalar]) -> Scalar:
-        return non_negative_min(polygon._distance_to_point(other)
-                                for polygon in self.polygons)
+        if self._polygons_tree is None:
+            return non_negative_min(polygon._distance_to_point(other)
+                                    for polygon in self.polygons)
+        result = None
+        for lower_bound, index in to_nearest_items(
+                self._polygons_tree,
+                partial(box_point_squared_distance,
+                        point=other)):
+            if result is not None and lower_bound >= result:
+                break
+            polygon = self._polygons[index]
+            if polygon.locate(other) is not Location.EXTERIOR:
+                result = 0
+                break
+            candidate = polygon._squared_distance_to_exterior_point(other)
+            if result is None or candidate < result:
+                result = candidate
+        return self._context.sqrt(result)
 
     def _distance_to_segment(self, other: Segment[Scalar]) -> Scalar:
-        return non_negative_min(polygon._distance_to_segment(other)
-                                for polygon in self.polygons)
+        if self._polygons_tree is None:
+            return non_negative_min(polygon._distance_to_segment(other)
+                                    for polygon in self.polygons)
+        result = None
+        for lower_bound, index in to_nearest_items(
+                self._polygons_tree,
+                partial(box_segment_squared_distance,
+                        segment=other,
+                        context=self._context)):
+            if result is not None and lower_bound >= result:
+                break
+            polygon = self._polygons[index]
+            if (polygon.locate(other.start) is not Location.EXTERIOR
+                    or polygon.locate(other.end) is not Location.EXTERIOR):
+                result = 0
+                break
+            candidate = polygon._linear_distance_to_segment(other)
+            if result is None or candidate < result:
+                result = candidate
+                if not result:
+                    break
+        return self._context.sqrt(result)
+
+    def _distance_to_shaped(self, other: Shaped[Scalar]) -> Scalar:
+        squared_distance = segments_trees_squared_distance(
+                self._to_segments_tree(), other._to_segments_tree(),
+                self._context
+        )
+        return (0
+                if (not squared_distance
+                    or any(self.locate(polygon.border.vertices[0])
+                           is Location.INTERIOR
+                           for polygon in (other.polygons
+                                           if isinstance(other, Multipolygon)
+                                           else [other]))
+                    or any(other.locate(polygon.border.vertices[0])
+                           is Location.INTERIOR
+                           for polygon in self._polygons))
+                else self._context.sqrt(squared_distance))
 
     def _intersect_with_multipolygon(self, other: 'Multipolygon[Scalar]'
                                      ) -> Compound[Scalar]:
@@ -1114,6 +1765,89 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                     context=self._context
             )
 
+    def _locate_points(self, points: Sequence[Point[Scalar]]
+                       ) -> List[Location]:
+        return (locate_points_in_regions(
+                        points,
+                        flatten([polygon.border, *polygon.holes]
+                                for polygon in self._polygons),
+                        self._context)
+                if (self._segments_tree is None
+                    and len(points) >= SWEEP_POINTS_COUNT_THRESHOLD)
+                else [self.locate(point) for point in points])
+
+    def _to_edges(self) -> Sequence[Segment[Scalar]]:
+        return list(flatten(polygon.edges for polygon in self._polygons))
+
+    def _to_frechet_curves(self, densification: Optional[Scalar]
+                           ) -> List[List[Point[Scalar]]]:
+        return list(flatten(polygon._to_frechet_curves(densification)
+                            for polygon in self.to_canonical().polygons))
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point[Scalar]]:
+        return to_sample_points(self._to_edges(), densification)
+
+    def _to_segments_tree(self) -> SegmentsTree:
+        return (to_segments_tree(self._to_edges(), self._context)
+                if self._segments_tree is None
+                else self._segments_tree)
+
+    def _to_triangulation_arrays(self) -> TriangularArrays:
+        if self._triangulation_arrays is None:
+            self._triangulation_arrays = merge_triangular_arrays(
+                    polygon._to_triangulation_arrays()
+                    for polygon in self._polygons
+            )
+        return self._triangulation_arrays
+
+    def _to_violations(self,
+                       level: ValidationLevel,
+                       executor: Optional[Executor] = None
+                       ) -> Iterator[Violation]:
+        polygons = self._polygons
+        is_valid = len(polygons) >= MIN_MULTIPOLYGON_POLYGONS_COUNT
+        if not is_valid:
+            yield Violation(ValidationLevel.BASIC,
+                            'Multipolygon should have '
+                            'at least {min_size} polygons, '
+                            'but found {size}.'
+                            .format(min_size=MIN_MULTIPOLYGON_POLYGONS_COUNT,
+                                    size=len(polygons)))
+        elif len(polygons) > len(self._polygons_set):
+            is_valid = False
+            for index in to_repeats_indices(polygons):
+                yield Violation(ValidationLevel.BASIC,
+                                'Duplicate polygons found.',
+                                ('polygons', index))
+        polygons_violations = (
+            map(methodcaller('_to_violations', level), polygons)
+            if executor is None
+            else map_raw(methodcaller('violations', level), polygons,
+                         executor)
+        )
+        for index, polygon_violations in enumerate(polygons_violations):
+            for violation in to_prefixed_violations(polygon_violations,
+                                                    'polygons', index):
+                is_valid = False
+                yield violation
+        if level < ValidationLevel.TOPOLOGY or not is_valid:
+            return
+        edges = list(flatten(polygon.edges for polygon in polygons))
+        if segments_cross_or_overlap(edges,
+                                     context=self._context):
+            edges_paths = list(flatten(map(_to_edges_paths, polygons,
+                                           range(len(polygons)))))
+            for index in sorted(set(flatten(
+                    (first_index, second_index)
+                    for first_index, second_index, relation
+                    in to_intersecting_segments_pairs(edges, self._context)
+                    if relation is not Relation.TOUCH))):
+                yield Violation(ValidationLevel.TOPOLOGY,
+                                'Polygons should only touch each other '
+                                'in discrete number of points.',
+                                edges_paths[index])
+
     def _unite_with_multipoint(self, other: Multipoint[Scalar]
                                ) -> Compound[Scalar]:
         context = self._context
@@ -1121,19 +1855,40 @@ class Multipolygon(Indexable[Scalar], Shaped[Scalar]):
                         context.mix_cls)
 
 
-def _locate_point_in_indexed_polygons(polygons: Sequence[Polygon],
-                                      tree: r.Tree,
-                                      point: Point,
-                                      context: Context) -> Location:
-    candidates_indices = tree.find_supersets_indices(
-            context.box_cls(point.x, point.x, point.y, point.y)
-    )
-    for candidate_index in candidates_indices:
+def _locate_component_in_indexed_polygons(polygons: Sequence[Polygon],
+                                          tree: BoxesTree,
+                                          point: Point
+                                          ) -> Tuple[Optional[int], Location]:
+    candidates_indices, _ = to_point_containing_items(tree, point)
+    for candidate_index in sorted(candidates_indices):
         location = polygons[candidate_index].locate(point)
         if location is not Location.EXTERIOR:
-            return location
-    return Location.EXTERIOR
+            return candidate_index, location
+    return None, Location.EXTERIOR
+
+
+def _locate_component_in_polygons(polygons: Sequence[Polygon],
+                                  point: Point
+                                  ) -> Tuple[Optional[int], Location]:
+    for index, polygon in enumerate(polygons):
+        location = polygon.locate(point)
+        if location is not Location.EXTERIOR:
+            return index, location
+    return None, Location.EXTERIOR
+
+
+def _to_edges_paths(polygon: Polygon, index: int) -> Iterator[Path]:
+    for segment_index in range(len(polygon.border.vertices)):
+        yield 'polygons', index, 'border', 'segments', segment_index
+    for hole_index, hole in enumerate(polygon.holes):
+        for segment_index in range(len(hole.vertices)):
+            yield ('polygons', index, 'holes', hole_index, 'segments',
+                   segment_index)
 
 
 def _multipolygon_has_holes(multipolygon: Multipolygon) -> bool:
     return any(polygon.holes for polygon in multipolygon.polygons)
+
+
+def _to_border_vertices(polygon: Polygon) -> Sequence[Point]:
+    return polygon.border.vertices
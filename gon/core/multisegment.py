@@ -1,5 +1,7 @@
 from functools import partial
-from typing import (Optional,
+from typing import (Iterator,
+                    List,
+                    Optional,
                     Sequence)
 
 from bentley_ottmann.planar import segments_cross_or_overlap
@@ -12,8 +14,8 @@ from clipping.planar import (complete_intersect_multisegments,
                              symmetric_subtract_multisegments,
                              unite_multisegments,
                              unite_segment_with_multisegment)
-from ground.hints import Scalar
-from locus import segmental
+from ground.hints import (Box,
+                          Scalar)
 from orient.planar import (multisegment_in_multisegment,
                            point_in_multisegment,
                            segment_in_multisegment)
@@ -21,27 +23,53 @@ from reprit.base import generate_repr
 from sect.decomposition import Graph
 
 from .angle import Angle
+from .box_clipping import clip_segments_by_box
+from .boxes_tree import (SegmentsTree,
+                         segments_trees_squared_distance,
+                         to_intersecting_segments_pairs,
+                         to_point_nearest_segment_in_tree,
+                         to_segment_nearest_segment_in_tree,
+                         to_segments_tree)
+from .complexity import monitored
 from .compound import (Compound,
                        Indexable,
                        Linear,
                        Location,
                        Relation)
 from .geometry import Geometry
-from .iterable import non_negative_min
+from .iterable import (flatten,
+                       non_negative_min)
 from .multipoint import Multipoint
 from .packing import pack_mix
 from .point import Point
+from .predicates import (geometry_covers,
+                         may_cover)
+from .rasterization import (Run,
+                            rasterize_segments,
+                            validate_grid)
 from .segment import Segment
+from .similarity import (to_curves_frechet_distance,
+                         to_hausdorff_distance,
+                         to_sample_points)
+from .simplification import (SimplificationMethod,
+                             segments_to_chains,
+                             simplify_chains)
 from .utils import (relate_multipoint_to_linear_compound,
                     to_point_nearest_segment,
                     to_segment_nearest_segment)
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations,
+                         to_repeats_indices)
 
 MIN_MULTISEGMENT_SEGMENTS_COUNT = 2
 
 
 class Multisegment(Indexable[Scalar], Linear[Scalar]):
     __slots__ = ('_locate', '_point_nearest_segment',
-                 '_segment_nearest_segment', '_segments', '_segments_set')
+                 '_segment_nearest_segment', '_segments', '_segments_set',
+                 '_segments_tree')
 
     def __init__(self, segments: Sequence[Segment]) -> None:
         """
@@ -55,6 +83,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         where ``segments_count = len(segments)``.
         """
         self._segments, self._segments_set = segments, frozenset(segments)
+        self._segments_tree = None  # type: Optional[SegmentsTree]
         context = self._context
         self._locate = partial(point_in_multisegment,
                                multisegment=self,
@@ -66,6 +95,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
 
     __repr__ = generate_repr(__init__)
 
+    @monitored
     def __and__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns intersection of the multisegment with the other geometry.
@@ -169,7 +199,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return (other is self._context.empty
                 or self == other
-                or ((self.relate(other) is Relation.COMPONENT
+                or ((geometry_covers(self, other)
                      if isinstance(other, (Multipoint, Multisegment, Segment))
                      else (other <= self
                            if isinstance(other, Linear)
@@ -204,7 +234,8 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return (other is self._context.empty
                 or self != other
-                and ((self.relate(other) is Relation.COMPONENT
+                and ((may_cover(self, other)
+                      and self.relate(other) is Relation.COMPONENT
                       if isinstance(other, (Multipoint, Multisegment, Segment))
                       else (other < self
                             if isinstance(other, Linear)
@@ -256,7 +287,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return (self == other
                 or not isinstance(other, Multipoint)
-                and (self.relate(other) in (Relation.EQUAL, Relation.COMPOSITE)
+                and (geometry_covers(other, self)
                      if isinstance(other, Linear)
                      else NotImplemented))
 
@@ -286,10 +317,12 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return (self != other
                 and not isinstance(other, Multipoint)
-                and (self.relate(other) is Relation.COMPOSITE
+                and (may_cover(other, self)
+                     and self.relate(other) is Relation.COMPOSITE
                      if isinstance(other, Linear)
                      else NotImplemented))
 
+    @monitored
     def __or__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns union of the multisegment with the other geometry.
@@ -319,6 +352,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
 
     __ror__ = __or__
 
+    @monitored
     def __rsub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the other geometry with the multisegment.
@@ -335,6 +369,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
                 if isinstance(other, Segment)
                 else NotImplemented)
 
+    @monitored
     def __sub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the multisegment with the other geometry.
@@ -362,6 +397,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
                             if isinstance(other, Multisegment)
                             else NotImplemented)))
 
+    @monitored
     def __xor__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns symmetric difference of the multisegment
@@ -452,6 +488,28 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return list(self._segments)
 
+    def clip_by_box(self, box: Box[Scalar]) -> Compound[Scalar]:
+        """
+        Returns intersection of the multisegment with the box.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)``
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count = len(self.segments)``.
+
+        >>> from gon.base import Box, Multisegment, Point, Segment
+        >>> multisegment = Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                              Segment(Point(0, 2), Point(4, 2))])
+        >>> (multisegment.clip_by_box(Box(1, 3, -1, 1))
+        ...  == Segment(Point(1, 0), Point(3, 0)))
+        True
+        >>> multisegment.clip_by_box(Box(0, 4, 0, 4)) == multisegment
+        True
+        """
+        return clip_segments_by_box(self._segments, box, self._context)
+
     def distance_to(self, other: Geometry[Scalar]) -> Scalar:
         """
         Returns distance between the multisegment and the other geometry.
@@ -476,11 +534,84 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
                  else
                  (self._distance_to_segment(other)
                   if isinstance(other, Segment)
-                  else (non_negative_min(self._distance_to_segment(segment)
-                                         for segment in other.segments)
-                        if isinstance(other, Multisegment)
+                  else (self._distance_to_linear(other)
+                        if isinstance(other, Linear)
                         else other.distance_to(self)))))
 
+    def frechet_distance(self,
+                         other: 'Multisegment[Scalar]',
+                         densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Fréchet distance between the multisegment
+        and the other multisegment
+        as the largest of distances between their segments
+        directed from the lesser endpoint & paired in sorted order.
+
+        Multisegments should have the same number of segments.
+        Endpoints are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(self_size * other_size)``
+        Memory complexity:
+            ``O(other_size)``
+
+        where ``self_size``, ``other_size`` --- numbers of sample points
+        of the multisegment & the other geometry respectively.
+
+        >>> from gon.base import Multisegment, Point, Segment
+        >>> multisegment = Multisegment([Segment(Point(0, 0), Point(1, 0)),
+        ...                              Segment(Point(0, 1), Point(1, 1))])
+        >>> multisegment.frechet_distance(multisegment) == 0
+        True
+        >>> multisegment.frechet_distance(multisegment.translate(1, 0)) == 1
+        True
+        """
+        if not isinstance(other, Multisegment):
+            raise TypeError('Fréchet distance is defined only '
+                            'between multisegments, but found {type}.'
+                            .format(type=type(other).__qualname__))
+        return to_curves_frechet_distance(
+                self._to_frechet_curves(densification),
+                other._to_frechet_curves(densification), self._context
+        )
+
+    def hausdorff_distance(self,
+                           other: Geometry[Scalar],
+                           densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Hausdorff distance between the multisegment
+        and the other geometry.
+
+        Vertices of geometries are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(size * log size)`` expected,
+            ``O(size ** 2)`` worst
+        Memory complexity:
+            ``O(size)``
+
+        where ``size`` --- total number of sample points of the geometries.
+
+        >>> from gon.base import Multisegment, Point, Segment
+        >>> multisegment = Multisegment([Segment(Point(0, 0), Point(1, 0)),
+        ...                              Segment(Point(0, 1), Point(1, 1))])
+        >>> multisegment.hausdorff_distance(multisegment) == 0
+        True
+        >>> multisegment.hausdorff_distance(multisegment.translate(1, 0)) == 1
+        True
+        """
+        return to_hausdorff_distance(
+                self._to_sample_points(densification),
+                other._to_sample_points(densification), self._context,
+                second_tree=(other._points_tree
+                             if isinstance(other, Multipoint)
+                             else None)
+        )
+
     def index(self) -> None:
         """
         Pre-processes the multisegment to potentially improve queries.
@@ -500,9 +631,12 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         self._locate = Graph.from_multisegment(self,
                                                context=self._context).locate
-        tree = segmental.Tree(self.segments)
-        self._point_nearest_segment = tree.nearest_to_point_segment
-        self._segment_nearest_segment = tree.nearest_segment
+        self._segments_tree = tree = to_segments_tree(self._segments,
+                                                      self._context)
+        self._point_nearest_segment, self._segment_nearest_segment = (
+            partial(to_point_nearest_segment_in_tree, self._context, tree),
+            partial(to_segment_nearest_segment_in_tree, self._context, tree)
+        )
 
     def locate(self, point: Point[Scalar]) -> Location:
         """
@@ -527,6 +661,40 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return self._locate(point)
 
+    def rasterize(self,
+                  box: Box[Scalar],
+                  columns: int,
+                  rows: int) -> List[Run]:
+        """
+        Returns runs of cells of the regular grid over the box
+        which the multisegment passes through,
+        cells are half-open except for the last row & column
+        which include top & right sides of the box respectively.
+
+        Time complexity:
+            ``O(segments_count + spans_count * log spans_count)``
+        Memory complexity:
+            ``O(spans_count)``
+
+        where ``segments_count = len(self.segments)``,
+        ``spans_count`` is the number of pairs of segments
+        & rows of cells they pass through.
+
+        :param box: box to cover with the grid.
+        :param columns: number of columns of the grid.
+        :param rows: number of rows of the grid.
+        :returns: runs of cells as triplets of row index along with start
+            & stop (exclusive) indices of columns sorted by rows & columns.
+
+        >>> from gon.base import Box, Multisegment, Point, Segment
+        >>> multisegment = Multisegment([Segment(Point(0, 1), Point(4, 1)),
+        ...                              Segment(Point(2, 0), Point(2, 4))])
+        >>> multisegment.rasterize(Box(0, 4, 0, 4), 4, 4)
+        [(0, 2, 3), (1, 0, 4), (2, 2, 3), (3, 2, 3)]
+        """
+        validate_grid(box, columns, rows)
+        return rasterize_segments(self._segments, box, columns, rows)
+
     def relate(self, other: Compound[Scalar]) -> Relation:
         """
         Finds relation between the multisegment and the other geometry.
@@ -611,6 +779,47 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
                 self, factor_x, factor_x if factor_y is None else factor_y
         )
 
+    def simplify(self,
+                 tolerance: Scalar,
+                 method: SimplificationMethod
+                 = SimplificationMethod.DOUGLAS_PEUCKER) -> Linear[Scalar]:
+        """
+        Returns the multisegment simplified by given method
+        within given tolerance (distance for Douglas-Peucker method,
+        area for Visvalingam-Whyatt one) so that it stays valid.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)`` expected,
+            ``O(segments_count ** 2)`` worst
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count = len(self.segments)``.
+
+        >>> from gon.base import Multisegment, Point, Segment
+        >>> multisegment = Multisegment([Segment(Point(0, 0), Point(1, 1)),
+        ...                              Segment(Point(1, 1), Point(2, 0))])
+        >>> multisegment.simplify(0) == multisegment
+        True
+        >>> multisegment.simplify(1) == Segment(Point(0, 0), Point(2, 0))
+        True
+        """
+        context = self._context
+        chains, closures = segments_to_chains(self._segments)
+        segment_cls = context.segment_cls
+        segments = []
+        for vertices, is_closed in zip(
+                simplify_chains(chains, closures, [], tolerance, method,
+                                context),
+                closures):
+            segments.extend(segment_cls(start, end)
+                            for start, end in zip(vertices, vertices[1:]))
+            if is_closed:
+                segments.append(segment_cls(vertices[-1], vertices[0]))
+        return (context.multisegment_cls(segments)
+                if len(segments) > 1
+                else segments[0])
+
     def translate(self,
                   step_x: Scalar,
                   step_y: Scalar) -> 'Multisegment[Scalar]':
@@ -634,7 +843,7 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         """
         return self._context.translate_multisegment(self, step_x, step_y)
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if the multisegment is valid.
 
@@ -650,20 +859,40 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
         ...                              Segment(Point(0, 1), Point(1, 1))])
         >>> multisegment.validate()
         """
-        segments = self.segments
-        if len(segments) < MIN_MULTISEGMENT_SEGMENTS_COUNT:
-            raise ValueError('Multisegment should have '
-                             'at least {min_size} segments, '
-                             'but found {size}.'
-                             .format(min_size=MIN_MULTISEGMENT_SEGMENTS_COUNT,
-                                     size=len(segments)))
-        elif len(segments) > len(self._segments_set):
-            raise ValueError('Duplicate segments found.')
-        for segment in segments:
-            segment.validate()
-        if segments_cross_or_overlap(segments,
-                                     context=self._context):
-            raise ValueError('Crossing or overlapping segments found.')
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of the multisegment's constraints.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)``
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count = len(self.segments)``.
+
+        >>> from gon.base import (Multisegment, Point, Segment,
+        ...                       ValidationLevel, Violation)
+        >>> multisegment = Multisegment([Segment(Point(0, 0), Point(2, 0)),
+        ...                              Segment(Point(1, 0), Point(3, 0))])
+        >>> (multisegment.violations()
+        ...  == [Violation(ValidationLevel.TOPOLOGY,
+        ...                'Crossing or overlapping segments found.',
+        ...                ('segments', index))
+        ...      for index in range(2)])
+        True
+        >>> multisegment.violations(ValidationLevel.BASIC) == []
+        True
+        """
+        return list(self._to_violations(level))
+
+    def _distance_to_linear(self, other: Linear[Scalar]) -> Scalar:
+        return self._context.sqrt(segments_trees_squared_distance(
+                self._to_segments_tree(), other._to_segments_tree(),
+                self._context
+        ))
 
     def _distance_to_point(self, other: Point[Scalar]) -> Scalar:
         return self._context.sqrt(self._context.segment_point_squared_distance(
@@ -675,6 +904,57 @@ class Multisegment(Indexable[Scalar], Linear[Scalar]):
                 self._segment_nearest_segment(other), other
         ))
 
+    def _to_frechet_curves(self, densification: Optional[Scalar]
+                           ) -> List[List[Point[Scalar]]]:
+        segment_cls = self._context.segment_cls
+        return [to_sample_points([segment_cls(*endpoints)], densification)
+                for endpoints in sorted(sorted([segment.start, segment.end])
+                                        for segment in self._segments)]
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point[Scalar]]:
+        return to_sample_points(self._segments, densification)
+
+    def _to_segments_tree(self) -> SegmentsTree:
+        return (to_segments_tree(self._segments, self._context)
+                if self._segments_tree is None
+                else self._segments_tree)
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        segments = self._segments
+        is_valid = len(segments) >= MIN_MULTISEGMENT_SEGMENTS_COUNT
+        if not is_valid:
+            yield Violation(ValidationLevel.BASIC,
+                            'Multisegment should have '
+                            'at least {min_size} segments, '
+                            'but found {size}.'
+                            .format(min_size=MIN_MULTISEGMENT_SEGMENTS_COUNT,
+                                    size=len(segments)))
+        elif len(segments) > len(self._segments_set):
+            is_valid = False
+            for index in to_repeats_indices(segments):
+                yield Violation(ValidationLevel.BASIC,
+                                'Duplicate segments found.',
+                                ('segments', index))
+        for index, segment in enumerate(segments):
+            for violation in to_prefixed_violations(
+                    segment._to_violations(level), 'segments', index):
+                is_valid = False
+                yield violation
+        if (level >= ValidationLevel.TOPOLOGY
+                and is_valid
+                and segments_cross_or_overlap(segments,
+                                              context=self._context)):
+            for index in sorted(set(flatten(
+                    (first_index, second_index)
+                    for first_index, second_index, relation
+                    in to_intersecting_segments_pairs(segments,
+                                                      self._context)
+                    if relation is not Relation.TOUCH))):
+                yield Violation(ValidationLevel.TOPOLOGY,
+                                'Crossing or overlapping segments found.',
+                                ('segments', index))
+
     def _unite_with_multipoint(self, other: Multipoint[Scalar]
                                ) -> Compound[Scalar]:
         return pack_mix(other - self, self, self._context.empty,
@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import (Executor,
+                                ProcessPoolExecutor)
+from functools import partial
+from math import ceil
+from operator import methodcaller
+from typing import (Callable,
+                    List,
+                    Optional,
+                    Sequence,
+                    TypeVar)
+
+from ground.base import Context
+
+from .geometry import Geometry
+from .iterable import flatten
+from .raw import (RawGeometry,
+                  from_raw,
+                  to_raw)
+from .validation import (ValidationLevel,
+                         Violation)
+
+CHUNKS_PER_WORKER = 4
+
+_T = TypeVar('_T')
+
+
+def map_raw(function: Callable[[Geometry], _T],
+            geometries: Sequence[Geometry],
+            executor: Executor) -> List[_T]:
+    """
+    Returns results of applying the function to each geometry
+    in executor's workers with geometries sent in chunks of raw coordinates.
+    """
+    if not geometries:
+        return []
+    chunk_size = ceil(len(geometries)
+                      / (_to_workers_count(executor) * CHUNKS_PER_WORKER))
+    chunks = [[to_raw(geometry)
+               for geometry in geometries[start:start + chunk_size]]
+              for start in range(0, len(geometries), chunk_size)]
+    return list(flatten(executor.map(partial(_apply_to_raw_chunk, function,
+                                             geometries[0]._context),
+                                     chunks)))
+
+
+def validate_all(geometries: Sequence[Geometry],
+                 *,
+                 level: ValidationLevel = ValidationLevel.FULL,
+                 workers: Optional[int] = None) -> List[List[Violation]]:
+    """
+    Returns violations of each geometry in order of geometries
+    validating them in parallel processes.
+
+    Geometries are sent to processes in chunks of raw coordinates,
+    so their indices & caches are neither transferred nor rebuilt.
+
+    Time complexity:
+        ``O(validation_time / workers)``
+    Memory complexity:
+        ``O(vertices_count)``
+
+    where ``validation_time`` is the time of serial validation
+    of the geometries,
+    ``vertices_count`` is the total number of vertices in the geometries,
+    ``workers`` is the number of processes which defaults to CPUs count.
+
+    :param geometries: geometries to validate.
+    :param level: level of validation.
+    :param workers: number of processes,
+        geometries are validated in the current process if it equals to 1.
+    :returns: violations of each geometry.
+
+    >>> from gon.base import (Contour, Multipoint, Point, Polygon,
+    ...                       ValidationLevel, Violation, validate_all)
+    >>> validate_all([Polygon(Contour([Point(0, 0), Point(1, 0),
+    ...                                Point(0, 1)]), []),
+    ...               Multipoint([])],
+    ...              workers=1) == [[], [Violation(ValidationLevel.BASIC,
+    ...                                            'Multipoint is empty.')]]
+    True
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError('Workers count should be positive, '
+                         'but found {value}.'.format(value=workers))
+    if workers == 1 or len(geometries) <= 1:
+        return [geometry.violations(level) for geometry in geometries]
+    with ProcessPoolExecutor(workers) as executor:
+        return map_raw(methodcaller('violations', level), geometries,
+                       executor)
+
+
+def _apply_to_raw_chunk(function: Callable[[Geometry], _T],
+                        context: Context,
+                        chunk: Sequence[RawGeometry]) -> List[_T]:
+    return [function(from_raw(raw, context)) for raw in chunk]
+
+
+def _to_workers_count(executor: Executor) -> int:
+    # standard library executors do not expose workers count publicly
+    return getattr(executor, '_max_workers', None) or os.cpu_count() or 1
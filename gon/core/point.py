@@ -1,6 +1,8 @@
 import math
 from numbers import Real
-from typing import Optional
+from typing import (Iterator,
+                    List,
+                    Optional)
 
 from ground.hints import Scalar
 from reprit.base import generate_repr
@@ -8,6 +10,9 @@ from symba.base import Expression
 
 from .angle import Angle
 from .geometry import Geometry
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first)
 
 
 class Point(Geometry[Scalar]):
@@ -227,7 +232,7 @@ class Point(Geometry[Scalar]):
         """
         return self._context.translate_point(self, step_x, step_y)
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if coordinates are finite.
 
@@ -239,8 +244,32 @@ class Point(Geometry[Scalar]):
         >>> from gon.base import Point
         >>> Point(0, 0).validate()
         """
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of coordinates finiteness.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Point
+        >>> Point(0, 0).violations() == []
+        True
+        """
+        return list(self._to_violations(level))
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List['Point[Scalar]']:
+        return [self]
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
         if not (is_finite(self.x) and is_finite(self.y)):
-            raise ValueError('NaN/infinity coordinates are not supported.')
+            yield Violation(ValidationLevel.BASIC,
+                            'NaN/infinity coordinates are not supported.')
 
 
 def is_finite(value: Scalar) -> bool:
@@ -1,13 +1,16 @@
+from array import array
 from functools import partial
 from itertools import chain
-from typing import (Optional,
-                    Sequence)
+from typing import (Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
 from clipping.planar import (complete_intersect_multisegment_with_polygon,
                              complete_intersect_polygons,
                              complete_intersect_regions,
                              complete_intersect_segment_with_polygon,
-                             subtract_multipolygon_from_polygon,
                              subtract_polygon_from_multisegment,
                              subtract_polygon_from_segment,
                              subtract_polygons,
@@ -17,18 +20,25 @@ from clipping.planar import (complete_intersect_multisegment_with_polygon,
                              unite_multisegment_with_polygon,
                              unite_polygons,
                              unite_segment_with_polygon)
-from ground.hints import Scalar
-from locus import segmental
+from ground.hints import (Box,
+                          Scalar)
 from orient.planar import (multisegment_in_polygon,
                            point_in_polygon,
                            polygon_in_polygon,
-                           region_in_multiregion,
                            segment_in_polygon)
 from reprit.base import generate_repr
 from sect.decomposition import Graph
 from sect.triangulation import Triangulation
 
 from .angle import Angle
+from .box_clipping import (box_to_polygon,
+                          clip_polygons_by_box)
+from .boxes_tree import (SegmentsTree,
+                         segments_trees_squared_distance,
+                         to_point_nearest_segment_in_tree,
+                         to_segment_nearest_segment_in_tree,
+                         to_segments_tree)
+from .complexity import monitored
 from .compound import (Compound,
                        Indexable,
                        Linear,
@@ -36,22 +46,52 @@ from .compound import (Compound,
                        Relation,
                        Shaped)
 from .contour import Contour
+from .convex import (intersect_convex_polygons,
+                     locate_point_in_convex_region,
+                     relate_convex_polygons,
+                     to_convex_polygons_separation)
 from .geometry import Geometry
+from .holes import to_holes_violations
 from .iterable import (flatten,
                        non_negative_min)
+from .locating import (SWEEP_POINTS_COUNT_THRESHOLD,
+                       FlatGraph,
+                       locate_point_in_flat_graph,
+                       locate_points_in_regions)
 from .multipoint import Multipoint
 from .packing import pack_mix
 from .point import Point
+from .predicates import (geometry_covers,
+                         may_cover)
+from .rasterization import (Run,
+                            rasterize_regions,
+                            validate_grid)
 from .segment import Segment
+from .similarity import (to_curves_frechet_distance,
+                         to_hausdorff_distance,
+                         to_sample_points)
+from .simplification import (SimplificationMethod,
+                             simplify_rings)
+from .triangular import (TriangularArrays,
+                         sample_triangular_arrays,
+                         to_cumulative_areas,
+                         to_readonly_buffers,
+                         to_triangular_arrays)
 from .utils import (to_point_nearest_segment,
                     to_segment_nearest_segment)
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations)
 
 Triangulation = Triangulation
 
 
 class Polygon(Indexable[Scalar], Shaped[Scalar]):
-    __slots__ = ('_border', '_holes', '_holes_set', '_locate',
-                 '_point_nearest_edge', '_segment_nearest_edge')
+    __slots__ = ('_border', '_hash', '_holes', '_holes_set', '_is_canonical',
+                 '_is_convex', '_locate', '_point_nearest_edge',
+                 '_segment_nearest_edge', '_segments_tree',
+                 '_triangles_cumulative_areas', '_triangulation_arrays')
 
     def __init__(self,
                  border: Contour[Scalar],
@@ -77,6 +117,12 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
             holes = []
         self._border, self._holes, self._holes_set = (border, holes,
                                                       frozenset(holes))
+        self._hash = None  # type: Optional[int]
+        self._is_canonical = False
+        self._is_convex = None  # type: Optional[bool]
+        self._segments_tree = None  # type: Optional[SegmentsTree]
+        self._triangles_cumulative_areas = None  # type: Optional[array]
+        self._triangulation_arrays = None  # type: Optional[TriangularArrays]
         context = self._context
         self._locate = partial(point_in_polygon,
                                polygon=self,
@@ -89,12 +135,14 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
 
     __repr__ = generate_repr(__init__)
 
+    @monitored
     def __and__(self, other: Compound) -> Compound:
         """
         Returns intersection of the polygon with the other geometry.
 
         Time complexity:
-            ``O(vertices_count * log vertices_count)``
+            ``O(vertices_count * log vertices_count)``,
+            ``O(vertices_count)`` for convex polygons in general position
         Memory complexity:
             ``O(vertices_count)``
 
@@ -124,15 +172,18 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
                     other, self,
                     context=self._context
             )
+        elif isinstance(other, Polygon):
+            if self.is_convex and other.is_convex:
+                result = intersect_convex_polygons(self, other, self._context)
+                if result is not None:
+                    return result
+            return (complete_intersect_polygons(self, other,
+                                                context=self._context)
+                    if self.holes or other.holes
+                    else complete_intersect_regions(self.border, other.border,
+                                                    context=self._context))
         else:
-            return ((complete_intersect_polygons(self, other,
-                                                 context=self._context)
-                     if self.holes or other.holes
-                     else complete_intersect_regions(self.border,
-                                                     other.border,
-                                                     context=self._context))
-                    if isinstance(other, Polygon)
-                    else NotImplemented)
+            return NotImplemented
 
     __rand__ = __and__
 
@@ -142,7 +193,9 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
 
         Time complexity:
             ``O(log vertices_count)`` expected after indexing,
-            ``O(vertices_count)`` worst after indexing or without it
+            ``O(vertices_count)`` worst after indexing or without it,
+            ``O(log vertices_count)`` for convex polygon
+            after checking its convexity
         Memory complexity:
             ``O(1)``
 
@@ -183,7 +236,8 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         Checks if polygons are equal.
 
         Time complexity:
-            ``O(vertices_count)``
+            ``O(vertices_count)``,
+            ``O(1)`` for canonical polygons with different hash values
         Memory complexity:
             ``O(1)``
 
@@ -203,8 +257,14 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         >>> polygon == polygon
         True
         """
-        return self is other or (self.border == other.border
-                                 and self._holes_set == other._holes_set
+        return self is other or (((hash(self) == hash(other)
+                                   and self._border == other._border
+                                   and self._holes == other._holes)
+                                  if (self._is_canonical
+                                      and other._is_canonical)
+                                  else (self.border == other.border
+                                        and (self._holes_set
+                                             == other._holes_set)))
                                  if isinstance(other, Polygon)
                                  else NotImplemented)
 
@@ -235,8 +295,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (other is self._context.empty
                 or self == other
-                or (self.relate(other) in (Relation.EQUAL, Relation.COMPONENT,
-                                           Relation.ENCLOSED, Relation.WITHIN)
+                or (geometry_covers(self, other)
                     if isinstance(other, Compound)
                     else NotImplemented))
 
@@ -267,8 +326,10 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (other is self._context.empty
                 or self != other
-                and (self.relate(other) in (Relation.COMPONENT,
-                                            Relation.ENCLOSED, Relation.WITHIN)
+                and (may_cover(self, other)
+                     and self.relate(other) in (Relation.COMPONENT,
+                                                Relation.ENCLOSED,
+                                                Relation.WITHIN)
                      if isinstance(other, Compound)
                      else NotImplemented))
 
@@ -277,7 +338,8 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         Returns hash value of the polygon.
 
         Time complexity:
-            ``O(vertices_count)``
+            ``O(vertices_count)`` for the first call,
+            ``O(1)`` for subsequent ones
         Memory complexity:
             ``O(1)``
 
@@ -297,7 +359,9 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         >>> hash(polygon) == hash(polygon)
         True
         """
-        return hash((self.border, self._holes_set))
+        if self._hash is None:
+            self._hash = hash((self._border, self._holes_set))
+        return self._hash
 
     def __le__(self, other: Compound) -> bool:
         """
@@ -326,10 +390,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (self == other
                 or not isinstance(other, (Multipoint, Linear))
-                and (self.relate(other) in (Relation.COVER,
-                                            Relation.ENCLOSES,
-                                            Relation.COMPOSITE,
-                                            Relation.EQUAL)
+                and (geometry_covers(other, self)
                      if isinstance(other, Shaped)
                      else NotImplemented))
 
@@ -360,12 +421,14 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return (self != other
                 and not isinstance(other, (Multipoint, Linear))
-                and (self.relate(other) in (Relation.COVER,
-                                            Relation.ENCLOSES,
-                                            Relation.COMPOSITE)
+                and (may_cover(other, self)
+                     and self.relate(other) in (Relation.COVER,
+                                                Relation.ENCLOSES,
+                                                Relation.COMPOSITE)
                      if isinstance(other, Shaped)
                      else NotImplemented))
 
+    @monitored
     def __or__(self, other: Compound) -> Compound:
         """
         Returns union of the polygon with the other geometry.
@@ -408,6 +471,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
 
     __ror__ = __or__
 
+    @monitored
     def __rsub__(self, other: Compound) -> Compound:
         """
         Returns difference of the other geometry with the polygon.
@@ -433,6 +497,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
                       if isinstance(other, Linear)
                       else NotImplemented))
 
+    @monitored
     def __sub__(self, other: Compound) -> Compound:
         """
         Returns difference of the polygon with the other geometry.
@@ -465,6 +530,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
                       if isinstance(other, Polygon)
                       else NotImplemented))
 
+    @monitored
     def __xor__(self, other: Compound) -> Compound:
         """
         Returns symmetric difference of the polygon with the other geometry.
@@ -687,7 +753,8 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         Checks if the polygon is convex.
 
         Time complexity:
-            ``O(len(self.border.vertices))``
+            ``O(len(self.border.vertices))`` for the first call,
+            ``O(1)`` for subsequent ones
         Memory complexity:
             ``O(1)``
 
@@ -701,7 +768,10 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         >>> polygon.convex_hull.is_convex
         True
         """
-        return not self.holes and self._context.is_region_convex(self.border)
+        if self._is_convex is None:
+            self._is_convex = (not self.holes
+                               and self._context.is_region_convex(self.border))
+        return self._is_convex
 
     @property
     def perimeter(self) -> Scalar:
@@ -731,6 +801,71 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         """
         return self.border.length + sum(hole.length for hole in self.holes)
 
+    def clip_by_box(self, box: Box[Scalar]) -> Compound[Scalar]:
+        """
+        Returns intersection of the polygon with the box.
+
+        Time complexity:
+            ``O(vertices_count)`` for polygons in general position
+            relative to the box, ``O(vertices_count * log vertices_count)``
+            otherwise
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count = len(self.border.vertices)\
+ + sum(len(hole.vertices) for hole in self.holes)``.
+
+        >>> from gon.base import Box, Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> (polygon.clip_by_box(Box(-1, 3, -1, 3))
+        ...  == Polygon(Contour([Point(0, 0), Point(3, 0), Point(3, 2),
+        ...                      Point(2, 2), Point(2, 3), Point(0, 3)]), []))
+        True
+        >>> polygon.clip_by_box(Box(0, 6, 0, 6)) == polygon
+        True
+        """
+        result = clip_polygons_by_box([self], box, self._context)
+        return (self & box_to_polygon(box, self._context)
+                if result is None
+                else result)
+
+    def disjoint(self, other: Compound) -> bool:
+        """
+        Checks if the polygon is disjoint from the other geometry.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)``,
+            ``O(vertices_count)`` for convex polygons
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+
+        >>> from gon.base import Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]))
+        >>> polygon.disjoint(polygon)
+        False
+        >>> polygon.disjoint(polygon.translate(7, 0))
+        True
+        """
+        if (isinstance(other, Polygon) and self.is_convex
+                and other.is_convex):
+            separation = to_convex_polygons_separation(self, other,
+                                                       self._context)
+            if separation:
+                return separation < 0
+        return super().disjoint(other)
+
     def distance_to(self, other: Geometry) -> Scalar:
         """
         Returns distance between the polygon and the other geometry.
@@ -766,17 +901,91 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
                  (self._distance_to_segment(other)
                   if isinstance(other, Segment)
                   else
-                  (non_negative_min(self._distance_to_segment(segment)
-                                    for segment in other.segments)
+                  (self._distance_to_linear(other)
                    if isinstance(other, Linear)
                    else
-                   ((non_negative_min(self._linear_distance_to_segment(edge)
-                                      for edge in other.edges)
-                     if self.disjoint(other)
-                     else 0)
+                   (self._distance_to_polygon(other)
                     if isinstance(other, Polygon)
                     else other.distance_to(self))))))
 
+    def frechet_distance(self,
+                         other: 'Polygon[Scalar]',
+                         densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Fréchet distance between the polygon
+        and the other polygon
+        as the largest of distances between their borders
+        & holes paired in order of their canonical forms.
+
+        Polygons should have the same number of holes.
+        Vertices are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(self_size * other_size)``
+        Memory complexity:
+            ``O(other_size)``
+
+        where ``self_size``, ``other_size`` --- numbers of sample points
+        of the polygon & the other geometry respectively.
+
+        >>> from gon.base import Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> polygon.frechet_distance(polygon) == 0
+        True
+        >>> polygon.frechet_distance(polygon.translate(1, 0)) == 1
+        True
+        """
+        if not isinstance(other, Polygon):
+            raise TypeError('Fréchet distance is defined only '
+                            'between polygons, but found {type}.'
+                            .format(type=type(other).__qualname__))
+        return to_curves_frechet_distance(
+                self._to_frechet_curves(densification),
+                other._to_frechet_curves(densification), self._context
+        )
+
+    def hausdorff_distance(self,
+                           other: Geometry,
+                           densification: Optional[Scalar] = None) -> Scalar:
+        """
+        Returns discrete Hausdorff distance between the polygon
+        and the other geometry.
+
+        Vertices of geometries are used with points added by densification:
+        each segment gets split into equal parts which length does not exceed
+        ``densification`` fraction of its length.
+
+        Time complexity:
+            ``O(size * log size)`` expected,
+            ``O(size ** 2)`` worst
+        Memory complexity:
+            ``O(size)``
+
+        where ``size`` --- total number of sample points of the geometries.
+
+        >>> from gon.base import Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> polygon.hausdorff_distance(polygon) == 0
+        True
+        >>> polygon.hausdorff_distance(polygon.translate(1, 0)) == 1
+        True
+        """
+        return to_hausdorff_distance(
+                self._to_sample_points(densification),
+                other._to_sample_points(densification), self._context,
+                second_tree=(other._points_tree
+                             if isinstance(other, Multipoint)
+                             else None)
+        )
+
     def index(self) -> None:
         """
         Pre-processes the polygon to potentially improve queries.
@@ -804,9 +1013,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         """
         self._locate = Graph.from_polygon(self,
                                           context=self._context).locate
-        tree = segmental.Tree(self.edges)
-        self._point_nearest_edge, self._segment_nearest_edge = (
-            tree.nearest_to_point_segment, tree.nearest_segment)
+        self._index_edges()
 
     def locate(self, point: Point) -> Location:
         """
@@ -814,7 +1021,9 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
 
         Time complexity:
             ``O(log vertices_count)`` expected after indexing,
-            ``O(vertices_count)`` worst after indexing or without it
+            ``O(vertices_count)`` worst after indexing or without it,
+            ``O(log vertices_count)`` for convex polygon
+            after checking its convexity
         Memory complexity:
             ``O(1)``
 
@@ -848,14 +1057,64 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         >>> polygon.locate(Point(7, 0)) is Location.EXTERIOR
         True
         """
-        return self._locate(point)
+        return (locate_point_in_convex_region(point, self._border,
+                                              self._context)
+                if self.is_convex
+                else self._locate(point))
+
+    def rasterize(self,
+                  box: Box[Scalar],
+                  columns: int,
+                  rows: int) -> List[Run]:
+        """
+        Returns runs of cells of the regular grid over the box
+        which centers lie inside of the polygon
+        (cells with centers on its boundary may be included),
+        found by scanning rows of cells centers over the table of edges.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count + rows\
+ + crossings_count)``
+        Memory complexity:
+            ``O(vertices_count + runs_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+                runs_count = len(self.rasterize(box, columns, rows))
+
+        and ``crossings_count`` is the number of crossings of edges
+        with lines of cells centers.
+
+        :param box: box to cover with the grid.
+        :param columns: number of columns of the grid.
+        :param rows: number of rows of the grid.
+        :returns: runs of cells as triplets of row index along with start
+            & stop (exclusive) indices of columns sorted by rows & columns.
+
+        >>> from gon.base import Box, Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> polygon.rasterize(Box(0, 6, 0, 6), 3, 3)
+        [(0, 0, 3), (1, 0, 1), (1, 2, 3), (2, 0, 3)]
+        """
+        validate_grid(box, columns, rows)
+        return rasterize_regions([self._border, *self._holes],
+                                 box, columns, rows)
 
     def relate(self, other: Compound) -> Relation:
         """
         Finds relation between the polygon and the other geometry.
 
         Time complexity:
-            ``O(vertices_count * log vertices_count)``
+            ``O(vertices_count * log vertices_count)``,
+            ``O(vertices_count)`` for convex polygons in general position
         Memory complexity:
             ``O(vertices_count)``
 
@@ -875,6 +1134,11 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         >>> polygon.relate(polygon) is Relation.EQUAL
         True
         """
+        if (isinstance(other, Polygon) and self.is_convex
+                and other.is_convex):
+            result = relate_convex_polygons(other, self, self._context)
+            if result is not None:
+                return result
         return (segment_in_polygon(other, self)
                 if isinstance(other, Segment)
                 else (multisegment_in_polygon(other, self)
@@ -920,6 +1184,60 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
                 else self._context.rotate_polygon(self, angle.cosine,
                                                   angle.sine, point))
 
+    def sample(self,
+               count: int,
+               *,
+               seed: Optional[int] = None) -> List[Point[float]]:
+        """
+        Returns uniformly distributed random points
+        with ``float`` coordinates inside of the polygon.
+
+        Triangles of the cached triangulation are chosen
+        by binary search over their cumulative areas,
+        so no points are rejected.
+
+        Time complexity:
+            ``O(vertices_count ** 2 + count * log vertices_count)``
+            for the first call,
+            ``O(count * log vertices_count)`` for subsequent ones
+        Memory complexity:
+            ``O(vertices_count + count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+
+        :param count: number of points to sample.
+        :param seed: seed of random numbers generator,
+            same seeds give same points.
+        :returns: sampled points.
+
+        >>> from gon.base import Contour, Location, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> points = polygon.sample(10, seed=0)
+        >>> len(points)
+        10
+        >>> all(polygon.locate(point) is not Location.EXTERIOR
+        ...     for point in points)
+        True
+        >>> polygon.sample(10, seed=0) == points
+        True
+        """
+        if self._triangles_cumulative_areas is None:
+            self._triangles_cumulative_areas = to_cumulative_areas(
+                    self._to_triangulation_arrays()
+            )
+        return sample_triangular_arrays(self._to_triangulation_arrays(),
+                                        self._triangles_cumulative_areas,
+                                        count, seed, self._context)
+
     def scale(self,
               factor_x: Scalar,
               factor_y: Optional[Scalar] = None) -> 'Polygon':
@@ -957,6 +1275,133 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
                 self, factor_x, factor_x if factor_y is None else factor_y
         )
 
+    def simplify(self,
+                 tolerance: Scalar,
+                 method: SimplificationMethod
+                 = SimplificationMethod.DOUGLAS_PEUCKER) -> 'Polygon[Scalar]':
+        """
+        Returns the polygon simplified by given method within given tolerance
+        (distance for Douglas-Peucker method, area for Visvalingam-Whyatt one)
+        so that it stays valid.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)`` expected,
+            ``O(vertices_count ** 2)`` worst
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+
+        >>> from gon.base import Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(3, 7), Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> polygon.simplify(0) == polygon
+        True
+        >>> (polygon.simplify(1)
+        ...  == Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]))
+        True
+        """
+        context = self._context
+        contour_cls = context.contour_cls
+        border, *holes = simplify_rings(
+                [self._border.vertices,
+                 *[hole.vertices for hole in self._holes]],
+                tolerance, method, context
+        )
+        return context.polygon_cls(contour_cls(border),
+                                   [contour_cls(hole) for hole in holes])
+
+    def to_canonical(self) -> 'Polygon[Scalar]':
+        """
+        Returns the polygon in canonical form:
+        with canonical border & holes, holes are sorted by vertices.
+
+        Canonical polygons are compared for equality
+        by hash values and contours directly.
+
+        Time complexity:
+            ``O(1)`` if canonical already,
+            ``O(vertices_count + holes_count * log holes_count)`` -- otherwise
+        Memory complexity:
+            ``O(1)`` if canonical already,
+            ``O(vertices_count)`` -- otherwise
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+                holes_count = len(self.holes)
+
+        >>> from gon.base import Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                             Point(4, 2)])])
+        >>> polygon.to_canonical() == polygon
+        True
+        >>> (polygon.to_canonical().holes
+        ...  == [Contour([Point(2, 2), Point(4, 2), Point(4, 4),
+        ...               Point(2, 4)])])
+        True
+        """
+        if self._is_canonical:
+            return self
+        result = self._context.polygon_cls(
+                self._border.to_canonical(),
+                sorted([hole.to_canonical() for hole in self._holes],
+                       key=_to_vertices)
+        )
+        result._is_canonical = True
+        return result
+
+    def to_triangulation_buffers(self) -> Tuple[memoryview, memoryview]:
+        """
+        Returns triangulation of the polygon as flat read-only buffers:
+        interleaved ``float`` coordinates of the polygon's vertices
+        (border's ones first, then holes' ones in order)
+        along with ``unsigned int`` indices of the vertices,
+        each consecutive triplet of which forms counterclockwise triangle.
+
+        Time complexity:
+            ``O(vertices_count ** 2)`` for the first call,
+            ``O(1)`` for subsequent ones
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+
+        >>> from gon.base import Contour, Point, Polygon
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]))
+        >>> coordinates, indices = polygon.to_triangulation_buffers()
+        >>> coordinates.tolist() == [0., 0., 6., 0., 6., 6., 0., 6.]
+        True
+        >>> sorted(indices.tolist()[index:index + 3]
+        ...        for index in range(0, len(indices), 3))
+        [[0, 1, 3], [3, 1, 2]]
+        """
+        return to_readonly_buffers(self._to_triangulation_arrays())
+
     def translate(self, step_x: Scalar, step_y: Scalar) -> 'Polygon[Scalar]':
         """
         Translates the polygon by given step.
@@ -1025,7 +1470,7 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         return Triangulation.constrained_delaunay(self,
                                                   context=self._context)
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if the polygon is valid.
 
@@ -1049,54 +1494,164 @@ class Polygon(Indexable[Scalar], Shaped[Scalar]):
         ...                             Point(4, 2)])])
         >>> polygon.validate()
         """
-        self.border.validate()
-        if self.holes:
-            for hole in self.holes:
-                hole.validate()
-            context = self._context
-            relation = region_in_multiregion(self.border, self.holes,
-                                             context=context)
-            if not (relation is Relation.COVER
-                    or relation is Relation.ENCLOSES):
-                raise ValueError('Holes should lie inside the border.')
-            border_minus_holes = (
-                subtract_multipolygon_from_polygon(
-                        context.polygon_cls(self.border, []),
-                        context.multipolygon_cls([context.polygon_cls(hole, [])
-                                                  for hole in self.holes])
-                )
-                if len(self.holes) > 1
-                else subtract_polygons(
-                        context.polygon_cls(self.border, []),
-                        context.polygon_cls(self.holes[0], [])
-                )
-            )
-            if border_minus_holes != self:
-                raise ValueError('Holes should not tear polygon apart.')
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of the polygon's constraints.
+
+        Time complexity:
+            ``O(vertices_count * log (vertices_count))``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = (len(self.border.vertices)
+                                  + sum(len(hole.vertices)\
+ for hole in self.holes))
+
+        >>> from gon.base import (Contour, Point, Polygon, ValidationLevel,
+        ...                       Violation)
+        >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                            Point(0, 6)]),
+        ...                   [Contour([Point(0, 3), Point(3, 0),
+        ...                             Point(3, 3)])])
+        >>> (polygon.violations()
+        ...  == [Violation(ValidationLevel.FULL,
+        ...                'Holes should not tear polygon apart.',
+        ...                ('holes',))])
+        True
+        >>> polygon.violations(ValidationLevel.TOPOLOGY) == []
+        True
+        """
+        return list(self._to_violations(level))
+
+    def _distance_to_linear(self, other: Linear) -> Scalar:
+        squared_distance = segments_trees_squared_distance(
+                self._to_segments_tree(), other._to_segments_tree(),
+                self._context
+        )
+        return (0
+                if (not squared_distance
+                    or any(self.locate(point) is Location.INTERIOR
+                           for point in ([other.vertices[0]]
+                                         if isinstance(other, Contour)
+                                         else [segment.start
+                                               for segment
+                                               in other.segments])))
+                else self._context.sqrt(squared_distance))
 
     def _distance_to_point(self, other: Point) -> Scalar:
         return self._context.sqrt(
                 self._squared_distance_to_exterior_point(other)
-                if self._locate(other) is Location.EXTERIOR
+                if self.locate(other) is Location.EXTERIOR
                 else 0
         )
 
+    def _distance_to_polygon(self, other: 'Polygon') -> Scalar:
+        squared_distance = segments_trees_squared_distance(
+                self._to_segments_tree(), other._to_segments_tree(),
+                self._context
+        )
+        return (0
+                if (not squared_distance
+                    or (self.locate(other.border.vertices[0])
+                        is Location.INTERIOR)
+                    or (other.locate(self.border.vertices[0])
+                        is Location.INTERIOR))
+                else self._context.sqrt(squared_distance))
+
     def _distance_to_segment(self, other: Segment) -> Scalar:
-        return (self._linear_distance_to_segment(other)
-                if (self._locate(other.start) is Location.EXTERIOR
-                    and self._locate(other.end) is Location.EXTERIOR)
-                else 0)
+        return self._context.sqrt(
+                self._linear_distance_to_segment(other)
+                if (self.locate(other.start) is Location.EXTERIOR
+                    and self.locate(other.end) is Location.EXTERIOR)
+                else 0
+        )
+
+    def _index_edges(self) -> None:
+        self._segments_tree = tree = to_segments_tree(self.edges,
+                                                      self._context)
+        self._point_nearest_edge, self._segment_nearest_edge = (
+            partial(to_point_nearest_segment_in_tree, self._context, tree),
+            partial(to_segment_nearest_segment_in_tree, self._context, tree)
+        )
+
+    def _index_with_flat_graph(self, graph: FlatGraph) -> None:
+        """
+        Indexes the polygon with its flat trapezoidal map built elsewhere.
+        """
+        self._locate = partial(
+                locate_point_in_flat_graph, graph,
+                list(chain(self._border.vertices,
+                           *[hole.vertices for hole in self._holes])),
+                context=self._context
+        )
+        self._index_edges()
 
     def _linear_distance_to_segment(self, other: Segment) -> Scalar:
         return self._context.segments_squared_distance(
                 self._segment_nearest_edge(other), other
         )
 
+    def _locate_points(self, points: Sequence[Point]) -> List[Location]:
+        return (locate_points_in_regions(points, [self._border, *self._holes],
+                                         self._context)
+                if (self._segments_tree is None
+                    and len(points) >= SWEEP_POINTS_COUNT_THRESHOLD)
+                else [self.locate(point) for point in points])
+
     def _squared_distance_to_exterior_point(self, other: Point) -> Scalar:
         return self._context.segment_point_squared_distance(
                 self._point_nearest_edge(other), other
         )
 
+    def _to_frechet_curves(self, densification: Optional[Scalar]
+                           ) -> List[List[Point]]:
+        canonical = self.to_canonical()
+        return [contour._to_sample_points(densification)
+                for contour in [canonical.border, *canonical.holes]]
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point]:
+        return to_sample_points(self.edges, densification)
+
+    def _to_segments_tree(self) -> SegmentsTree:
+        return (to_segments_tree(self.edges, self._context)
+                if self._segments_tree is None
+                else self._segments_tree)
+
+    def _to_triangulation_arrays(self) -> TriangularArrays:
+        if self._triangulation_arrays is None:
+            self._triangulation_arrays = to_triangular_arrays(
+                    self, self.triangulate()
+            )
+        return self._triangulation_arrays
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        is_valid = True
+        for violation in to_prefixed_violations(
+                self.border._to_violations(level), 'border'):
+            is_valid = False
+            yield violation
+        for index, hole in enumerate(self.holes):
+            for violation in to_prefixed_violations(hole._to_violations(level),
+                                                    'holes', index):
+                is_valid = False
+                yield violation
+        if level < ValidationLevel.FULL or not is_valid or not self.holes:
+            return
+        yield from to_holes_violations(self.border, self.holes,
+                                       self._context)
+
     def _unite_with_multipoint(self, other: Multipoint) -> Compound:
         return pack_mix(other - self, self._context.empty, self,
                         self._context.empty, self._context.mix_cls)
+
+
+def _to_vertices(contour: Contour) -> Sequence[Point]:
+    return contour.vertices
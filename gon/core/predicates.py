@@ -0,0 +1,159 @@
+from itertools import islice
+from typing import (Iterable,
+                    List)
+
+from ground.base import Location
+from ground.hints import (Box,
+                          Point)
+
+from .boxes_tree import (SegmentsTree,
+                         boxes_disjoint,
+                         segments_trees_intersect,
+                         to_segments_tree)
+from .geometry import Geometry
+from .iterable import flatten
+from .relating import to_locations_pairs
+
+#: maximum number of points of the geometry
+#: checked to lie in the other one before computing their relation
+MAX_COVER_PROBES_COUNT = 16
+
+
+def geometries_intersect(first: Geometry, second: Geometry) -> bool:
+    """
+    Checks if compound geometries intersect
+    rejecting ones with disjoint boxes
+    & stopping at the first pair of intersecting edges.
+
+    If edges do not intersect then each contour & segment
+    lies either inside or outside of the other geometry,
+    so it is enough to locate one point of each of them.
+    """
+    context = first._context
+    if first is context.empty or second is context.empty:
+        return False
+    elif isinstance(first, context.mix_cls):
+        return any(geometries_intersect(component, second)
+                   for component in _to_mix_components(first))
+    elif isinstance(second, context.mix_cls):
+        return any(geometries_intersect(first, component)
+                   for component in _to_mix_components(second))
+    if boxes_disjoint(to_box(first), to_box(second)):
+        return False
+    elif isinstance(first, context.multipoint_cls):
+        return _has_non_exterior_point(second, first.points)
+    elif isinstance(second, context.multipoint_cls):
+        return _has_non_exterior_point(first, second.points)
+    elif segments_trees_intersect(_to_segments_tree(first),
+                                  _to_segments_tree(second), context):
+        return True
+    return ((_is_shaped(first)
+             and _has_non_exterior_point(first, _to_probe_points(second)))
+            or (_is_shaped(second)
+                and _has_non_exterior_point(second,
+                                            _to_probe_points(first))))
+
+
+def geometry_covers(first: Geometry, second: Geometry) -> bool:
+    """
+    Checks if the first compound geometry covers the second one
+    checking necessary conditions first
+    & stopping at the first part of the second geometry
+    found in the exterior of the first one.
+    """
+    return (may_cover(first, second)
+            and all(first_location is not Location.EXTERIOR
+                    or second_location is Location.EXTERIOR
+                    for first_location, second_location
+                    in to_locations_pairs(first, second)))
+
+
+def may_cover(first: Geometry, second: Geometry) -> bool:
+    """
+    Checks necessary conditions for the first compound geometry
+    to cover the second one: inclusion of boxes
+    & absence of few points of the second geometry
+    in the exterior of the first one.
+    """
+    context = first._context
+    if second is context.empty:
+        return True
+    elif first is context.empty:
+        return False
+    elif (isinstance(first, context.mix_cls)
+          or isinstance(second, context.mix_cls)):
+        return True
+    first_box, second_box = to_box(first), to_box(second)
+    return (first_box.min_x <= second_box.min_x
+            and second_box.max_x <= first_box.max_x
+            and first_box.min_y <= second_box.min_y
+            and second_box.max_y <= first_box.max_y
+            and all(first.locate(point) is not Location.EXTERIOR
+                    for point in islice(_to_probe_points(second),
+                                        MAX_COVER_PROBES_COUNT)))
+
+
+def to_box(geometry: Geometry) -> Box:
+    """
+    Returns bounding box of the compound geometry.
+    """
+    context = geometry._context
+    if isinstance(geometry, context.multipoint_cls):
+        return context.points_box(geometry.points)
+    elif isinstance(geometry, context.segment_cls):
+        return context.segment_box(geometry)
+    elif isinstance(geometry, context.multisegment_cls):
+        return context.segments_box(geometry.segments)
+    elif isinstance(geometry, context.contour_cls):
+        return context.contour_box(geometry)
+    elif isinstance(geometry, context.polygon_cls):
+        return context.polygon_box(geometry)
+    elif isinstance(geometry, context.multipolygon_cls):
+        return context.polygons_box(geometry.polygons)
+    else:
+        raise TypeError('Unsupported geometry type: {type}.'
+                        .format(type=type(geometry).__qualname__))
+
+
+def _has_non_exterior_point(geometry: Geometry,
+                            points: List[Point]) -> bool:
+    return any(location is not Location.EXTERIOR
+               for location in geometry._locate_points(points))
+
+
+def _is_shaped(geometry: Geometry) -> bool:
+    context = geometry._context
+    return isinstance(geometry, (context.polygon_cls,
+                                 context.multipolygon_cls))
+
+
+def _to_mix_components(mix: Geometry) -> Iterable[Geometry]:
+    return mix.discrete, mix.linear, mix.shaped
+
+
+def _to_probe_points(geometry: Geometry) -> List[Point]:
+    # points of each connected component of the geometry's boundary
+    context = geometry._context
+    if isinstance(geometry, context.multipoint_cls):
+        return geometry.points
+    elif isinstance(geometry, context.segment_cls):
+        return [geometry.start]
+    elif isinstance(geometry, context.multisegment_cls):
+        return [segment.start for segment in geometry.segments]
+    elif isinstance(geometry, context.contour_cls):
+        return [geometry.vertices[0]]
+    elif isinstance(geometry, context.polygon_cls):
+        return [geometry.border.vertices[0],
+                *[hole.vertices[0] for hole in geometry.holes]]
+    elif isinstance(geometry, context.multipolygon_cls):
+        return list(flatten(_to_probe_points(polygon)
+                            for polygon in geometry.polygons))
+    else:
+        raise TypeError('Unsupported geometry type: {type}.'
+                        .format(type=type(geometry).__qualname__))
+
+
+def _to_segments_tree(geometry: Geometry) -> SegmentsTree:
+    return (to_segments_tree([geometry], geometry._context)
+            if isinstance(geometry, geometry._context.segment_cls)
+            else geometry._to_segments_tree())
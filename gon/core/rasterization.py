@@ -0,0 +1,193 @@
+from fractions import Fraction
+from functools import partial
+from heapq import merge
+from math import (ceil,
+                  floor)
+from typing import (Dict,
+                    Iterable,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from ground.hints import (Box,
+                          Contour,
+                          Point,
+                          Segment)
+
+#: row index along with start & stop (exclusive) indices of columns
+Run = Tuple[int, int, int]
+
+_GridPoint = Tuple[Fraction, Fraction]
+#: crossing with the line of cells centers, inverse slope & stop row
+_Edge = Tuple[Fraction, Fraction, int]
+_HALF = Fraction(1, 2)
+
+
+def rasterize_regions(regions: Iterable[Contour],
+                      box: Box,
+                      columns: int,
+                      rows: int) -> List[Run]:
+    """
+    Returns runs of grid cells with centers inside of regions
+    (with even-odd rule for nested ones like holes)
+    scanning rows of cells centers over the table of edges.
+    """
+    to_grid_point = partial(_to_grid_point, *_to_grid_scaling(box, columns,
+                                                              rows))
+    rows_edges = {}  # type: Dict[int, List[_Edge]]
+    for region in regions:
+        vertices = [to_grid_point(vertex) for vertex in region.vertices]
+        for index, start in enumerate(vertices):
+            end = vertices[index - 1]
+            if start[1] == end[1]:
+                continue
+            elif start[1] > end[1]:
+                start, end = end, start
+            start_row, stop_row = (max(ceil(start[1] - _HALF), 0),
+                                   min(ceil(end[1] - _HALF), rows))
+            if start_row < stop_row:
+                (start_x, start_y), (end_x, end_y) = start, end
+                inverse_slope = (end_x - start_x) / (end_y - start_y)
+                rows_edges.setdefault(start_row, []).append(
+                        (start_x + (start_row + _HALF - start_y)
+                         * inverse_slope, inverse_slope, stop_row)
+                )
+    result = []  # type: List[Run]
+    # edges crossing the current row's line of cells centers
+    # ordered by crossings, since valid regions' edges do not cross
+    # each other the order is kept from row to row
+    active_edges = []  # type: List[_Edge]
+    for row in range(min(rows_edges, default=rows), rows):
+        active_edges = [(crossing + inverse_slope, inverse_slope, stop_row)
+                        for crossing, inverse_slope, stop_row in active_edges
+                        if stop_row > row]
+        if any(active_edges[index][0] > active_edges[index + 1][0]
+               for index in range(len(active_edges) - 1)):
+            # edges of invalid regions may cross each other
+            active_edges.sort()
+        row_edges = rows_edges.pop(row, None)
+        if row_edges is not None:
+            row_edges.sort()
+            active_edges = list(merge(active_edges, row_edges))
+        elif not active_edges:
+            if not rows_edges:
+                break
+            continue
+        _append_row_runs(result, row,
+                         [(max(ceil(active_edges[index][0] - _HALF), 0),
+                           min(floor(active_edges[index + 1][0] - _HALF) + 1,
+                               columns))
+                          for index in range(0, len(active_edges), 2)])
+    return result
+
+
+def rasterize_segments(segments: Iterable[Segment],
+                       box: Box,
+                       columns: int,
+                       rows: int) -> List[Run]:
+    """
+    Returns runs of grid cells which segments pass through
+    splitting each segment by rows of cells.
+    """
+    to_grid_point = partial(_to_grid_point, *_to_grid_scaling(box, columns,
+                                                              rows))
+    rows_spans = {}  # type: Dict[int, List[Tuple[int, int]]]
+    for segment in segments:
+        (start_x, start_y), (end_x, end_y) = (to_grid_point(segment.start),
+                                              to_grid_point(segment.end))
+        if start_y > end_y:
+            start_x, start_y, end_x, end_y = end_x, end_y, start_x, start_y
+        for row in range(max(_to_cell_index(start_y, rows), 0),
+                         min(_to_cell_index(end_y, rows) + 1, rows)):
+            if start_y == end_y:
+                min_x, max_x = sorted((start_x, end_x))
+                start_column, stop_column = (
+                    _to_cell_index(min_x, columns),
+                    _to_cell_index(max_x, columns) + 1
+                )
+            else:
+                low_x, high_x = (
+                    start_x + ((max(start_y, row) - start_y)
+                               * (end_x - start_x) / (end_y - start_y)),
+                    start_x + ((min(end_y, row + 1) - start_y)
+                               * (end_x - start_x) / (end_y - start_y))
+                )
+                if low_x == high_x or end_y < row + 1 or row + 1 == rows:
+                    # part of the segment in the row is closed
+                    min_x, max_x = sorted((low_x, high_x))
+                    start_column, stop_column = (
+                        _to_cell_index(min_x, columns),
+                        _to_cell_index(max_x, columns) + 1
+                    )
+                elif low_x < high_x:
+                    # high end lies on the next row
+                    start_column, stop_column = (
+                        _to_cell_index(low_x, columns), ceil(high_x)
+                    )
+                else:
+                    start_column, stop_column = (
+                        floor(high_x), _to_cell_index(low_x, columns) + 1
+                    )
+            start_column, stop_column = (max(start_column, 0),
+                                         min(stop_column, columns))
+            if start_column < stop_column:
+                rows_spans.setdefault(row, []).append((start_column,
+                                                       stop_column))
+    result = []  # type: List[Run]
+    for row in sorted(rows_spans):
+        _append_row_runs(result, row, rows_spans[row])
+    return result
+
+
+def validate_grid(box: Box, columns: int, rows: int) -> None:
+    """
+    Checks if the grid is non-degenerate.
+    """
+    if columns <= 0 or rows <= 0:
+        raise ValueError('Columns & rows counts should be positive, '
+                         'but found {columns} & {rows}.'
+                         .format(columns=columns,
+                                 rows=rows))
+    elif box.min_x >= box.max_x or box.min_y >= box.max_y:
+        raise ValueError('Box should have positive width & height, '
+                         'but found {box}.'.format(box=box))
+
+
+def _append_row_runs(runs: List[Run],
+                     row: int,
+                     spans: Sequence[Tuple[int, int]]) -> None:
+    previous_start = previous_stop = None
+    for start, stop in sorted(spans):
+        if start >= stop:
+            continue
+        elif previous_stop is not None and start <= previous_stop:
+            previous_stop = max(previous_stop, stop)
+        else:
+            if previous_stop is not None:
+                runs.append((row, previous_start, previous_stop))
+            previous_start, previous_stop = start, stop
+    if previous_stop is not None:
+        runs.append((row, previous_start, previous_stop))
+
+
+def _to_cell_index(value: Fraction, count: int) -> int:
+    result = floor(value)
+    return count - 1 if result == count and value == count else result
+
+
+def _to_grid_point(min_x: Fraction,
+                   min_y: Fraction,
+                   x_scale: Fraction,
+                   y_scale: Fraction,
+                   point: Point) -> _GridPoint:
+    return ((Fraction(point.x) - min_x) * x_scale,
+            (Fraction(point.y) - min_y) * y_scale)
+
+
+def _to_grid_scaling(box: Box,
+                     columns: int,
+                     rows: int
+                     ) -> Tuple[Fraction, Fraction, Fraction, Fraction]:
+    min_x, min_y = Fraction(box.min_x), Fraction(box.min_y)
+    return (min_x, min_y, columns / (Fraction(box.max_x) - min_x),
+            rows / (Fraction(box.max_y) - min_y))
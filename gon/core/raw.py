@@ -0,0 +1,118 @@
+from typing import (Any,
+                    Tuple)
+
+from ground.base import Context
+from ground.hints import (Contour,
+                          Point,
+                          Polygon,
+                          Segment)
+
+from .geometry import Geometry
+
+#: geometry kind along with its coordinates in nested tuples & lists
+RawGeometry = Tuple[int, Any]
+
+(EMPTY_KIND, POINT_KIND, SEGMENT_KIND, CONTOUR_KIND, MULTIPOINT_KIND,
+ MULTISEGMENT_KIND, POLYGON_KIND, MULTIPOLYGON_KIND, MIX_KIND) = range(9)
+
+
+def from_raw(raw: RawGeometry, context: Context) -> Geometry:
+    """
+    Restores geometry from its raw representation.
+    """
+    kind, coordinates = raw
+    if kind == EMPTY_KIND:
+        return context.empty
+    elif kind == POINT_KIND:
+        return _point_from_raw(coordinates, context)
+    elif kind == SEGMENT_KIND:
+        return _segment_from_raw(coordinates, context)
+    elif kind == CONTOUR_KIND:
+        return _contour_from_raw(coordinates, context)
+    elif kind == MULTIPOINT_KIND:
+        return context.multipoint_cls([_point_from_raw(point, context)
+                                       for point in coordinates])
+    elif kind == MULTISEGMENT_KIND:
+        return context.multisegment_cls([_segment_from_raw(segment, context)
+                                         for segment in coordinates])
+    elif kind == POLYGON_KIND:
+        return _polygon_from_raw(coordinates, context)
+    elif kind == MULTIPOLYGON_KIND:
+        return context.multipolygon_cls([_polygon_from_raw(polygon, context)
+                                         for polygon in coordinates])
+    else:
+        discrete, linear, shaped = coordinates
+        return context.mix_cls(from_raw(discrete, context),
+                               from_raw(linear, context),
+                               from_raw(shaped, context))
+
+
+def to_raw(geometry: Geometry) -> RawGeometry:
+    """
+    Returns compact representation of the geometry
+    as its kind along with coordinates in nested tuples & lists
+    which is cheap to pickle unlike geometry with its indices & caches.
+    """
+    context = geometry._context
+    if geometry is context.empty:
+        return EMPTY_KIND, None
+    elif isinstance(geometry, context.point_cls):
+        return POINT_KIND, _point_to_raw(geometry)
+    elif isinstance(geometry, context.segment_cls):
+        return SEGMENT_KIND, _segment_to_raw(geometry)
+    elif isinstance(geometry, context.contour_cls):
+        return CONTOUR_KIND, _contour_to_raw(geometry)
+    elif isinstance(geometry, context.multipoint_cls):
+        return MULTIPOINT_KIND, [_point_to_raw(point)
+                                 for point in geometry.points]
+    elif isinstance(geometry, context.multisegment_cls):
+        return MULTISEGMENT_KIND, [_segment_to_raw(segment)
+                                   for segment in geometry.segments]
+    elif isinstance(geometry, context.polygon_cls):
+        return POLYGON_KIND, _polygon_to_raw(geometry)
+    elif isinstance(geometry, context.multipolygon_cls):
+        return MULTIPOLYGON_KIND, [_polygon_to_raw(polygon)
+                                   for polygon in geometry.polygons]
+    else:
+        return MIX_KIND, (to_raw(geometry.discrete), to_raw(geometry.linear),
+                          to_raw(geometry.shaped))
+
+
+def _contour_from_raw(coordinates: Any, context: Context) -> Contour:
+    return context.contour_cls([_point_from_raw(vertex, context)
+                                for vertex in coordinates])
+
+
+def _contour_to_raw(contour: Contour) -> Any:
+    return [_point_to_raw(vertex) for vertex in contour.vertices]
+
+
+def _point_from_raw(coordinates: Any, context: Context) -> Point:
+    x, y = coordinates
+    return context.point_cls(x, y)
+
+
+def _point_to_raw(point: Point) -> Any:
+    return point.x, point.y
+
+
+def _polygon_from_raw(coordinates: Any, context: Context) -> Polygon:
+    border, holes = coordinates
+    return context.polygon_cls(_contour_from_raw(border, context),
+                               [_contour_from_raw(hole, context)
+                                for hole in holes])
+
+
+def _polygon_to_raw(polygon: Polygon) -> Any:
+    return (_contour_to_raw(polygon.border),
+            [_contour_to_raw(hole) for hole in polygon.holes])
+
+
+def _segment_from_raw(coordinates: Any, context: Context) -> Segment:
+    start, end = coordinates
+    return context.segment_cls(_point_from_raw(start, context),
+                               _point_from_raw(end, context))
+
+
+def _segment_to_raw(segment: Segment) -> Any:
+    return _point_to_raw(segment.start), _point_to_raw(segment.end)
@@ -0,0 +1,337 @@
+from typing import (Dict,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
+                    Set,
+                    Tuple)
+
+from ground.base import (Context,
+                         Location,
+                         Orientation,
+                         Relation)
+from ground.hints import (Contour,
+                          Point,
+                          Scalar,
+                          Segment)
+
+from .boxes_tree import (BoxesTree,
+                         SegmentsTree,
+                         to_boxes_tree,
+                         to_overlapping_items_pairs,
+                         to_point_containing_items,
+                         to_segments_tree)
+from .geometry import Geometry
+
+#: flags of intersection of each location relative to the first geometry
+#: with each location relative to the second one
+#: indexed by locations relative to the first & the second geometry
+RelationMatrix = Tuple[Tuple[bool, bool, bool],
+                       Tuple[bool, bool, bool],
+                       Tuple[bool, bool, bool]]
+
+#: segment along with the side of the shaped interior:
+#: ``True`` for the left one, ``False`` for the right one
+#: & ``None`` for linear segments
+Edge = Tuple[Segment, Optional[bool]]
+#: start & end of the part of the edge along with the side of its interior
+Piece = Tuple[Point, Point, Optional[bool]]
+#: points of the discrete component, tree of segments of the linear one
+#: & the shaped one
+_Operand = Tuple[Set[Point], Optional[SegmentsTree], Optional[Geometry]]
+_LocationsPair = Tuple[Location, Location]
+
+
+def split_edges_pairwise(first_edges: Sequence[Edge],
+                         second_edges: Sequence[Edge],
+                         context: Context
+                         ) -> Tuple[List[Piece], List[Piece], Set[Point]]:
+    """
+    Returns pieces of edges split at points of their intersections
+    found in a single traversal of edges' trees
+    along with the intersection points.
+
+    Overlapping edges are also split at each other's split points,
+    so their common parts become equal pieces
+    even if one of them is split by an edge of its own geometry
+    (like a segment of a mix touching its polygon).
+    """
+    first_splits = [[] for _ in first_edges]  # type: List[List[Point]]
+    second_splits = [[] for _ in second_edges]  # type: List[List[Point]]
+    common_points = set()  # type: Set[Point]
+    overlaps = []  # type: List[Tuple[int, int]]
+    if first_edges and second_edges:
+        segment_contains_point, segments_relation = (
+            context.segment_contains_point, context.segments_relation)
+        for first_index, second_index in to_overlapping_items_pairs(
+                _to_edges_tree(first_edges, context),
+                _to_edges_tree(second_edges, context)):
+            first_segment, _ = first_edges[first_index]
+            second_segment, _ = second_edges[second_index]
+            relation = segments_relation(first_segment, second_segment)
+            if relation is Relation.DISJOINT:
+                continue
+            elif relation is Relation.CROSS:
+                point = context.segments_intersection(first_segment,
+                                                      second_segment)
+                first_splits[first_index].append(point)
+                second_splits[second_index].append(point)
+                common_points.add(point)
+                continue
+            elif relation is not Relation.TOUCH:
+                overlaps.append((first_index, second_index))
+            for endpoint in (first_segment.start, first_segment.end):
+                if segment_contains_point(second_segment, endpoint):
+                    second_splits[second_index].append(endpoint)
+                    common_points.add(endpoint)
+            for endpoint in (second_segment.start, second_segment.end):
+                if segment_contains_point(first_segment, endpoint):
+                    first_splits[first_index].append(endpoint)
+                    common_points.add(endpoint)
+        for first_index, second_index in overlaps:
+            first_segment, _ = first_edges[first_index]
+            second_segment, _ = second_edges[second_index]
+            first_points = first_splits[first_index]
+            second_points = second_splits[second_index]
+            first_points.extend([point
+                                 for point in second_points
+                                 if segment_contains_point(first_segment,
+                                                           point)])
+            second_points.extend([point
+                                  for point in first_points
+                                  if segment_contains_point(second_segment,
+                                                            point)])
+    return (_split_edges(first_edges, first_splits),
+            _split_edges(second_edges, second_splits), common_points)
+
+
+def to_aligned_side(piece: Piece, other_piece: Piece) -> Optional[bool]:
+    """
+    Returns side of the interior relative to the other piece
+    which lies on the same segment as the piece
+    aligned with the piece's direction.
+    """
+    start, _, _ = piece
+    other_start, _, other_side = other_piece
+    return (other_side
+            if other_side is None or other_start == start
+            else not other_side)
+
+
+def to_piece_key(piece: Piece) -> Tuple[Point, Point]:
+    """
+    Returns endpoints of the piece in lexicographical order.
+    """
+    start, end, _ = piece
+    return ((start, end)
+            if _to_point_key(start) < _to_point_key(end)
+            else (end, start))
+
+
+def to_locations_pairs(first: Geometry,
+                       second: Geometry) -> Iterator[_LocationsPair]:
+    """
+    Yields pairs of intersecting locations relative to geometries
+    splitting their edges at intersection points
+    found in a single traversal of edges' trees,
+    locating characteristic points of resulting pieces
+    & faces adjacent to them by sides of shaped interiors,
+    parts of the second geometry first.
+    """
+    context = first._context
+    first_points, first_segments, first_shaped = _decompose(first)
+    second_points, second_segments, second_shaped = _decompose(second)
+    first_edges = _to_edges(first_segments, first_shaped, context)
+    second_edges = _to_edges(second_segments, second_shaped, context)
+    first_pieces, second_pieces, common_points = split_edges_pairwise(
+            first_edges, second_edges, context)
+    if common_points:
+        yield Location.BOUNDARY, Location.BOUNDARY
+    for second_location, first_location in _to_locations_pairs(
+            second_points, second_pieces,
+            (set(first_points), _to_linear_tree(first_segments, context),
+             first_shaped),
+            {to_piece_key(piece): piece for piece in first_pieces},
+            common_points, context):
+        yield first_location, second_location
+    yield from _to_locations_pairs(
+            first_points, first_pieces,
+            (set(second_points), _to_linear_tree(second_segments, context),
+             second_shaped),
+            {to_piece_key(piece): piece for piece in second_pieces},
+            common_points, context)
+
+
+def to_relation_matrix(first: Geometry, second: Geometry) -> RelationMatrix:
+    """
+    Returns matrix of intersections of locations relative to geometries
+    collected from all pairs of intersecting locations.
+    """
+    result = [[False] * len(Location) for _ in Location]
+    result[Location.EXTERIOR][Location.EXTERIOR] = True
+    for first_location, second_location in to_locations_pairs(first, second):
+        result[first_location][second_location] = True
+    return tuple(tuple(row) for row in result)
+
+
+def to_shaped_edges(shaped: Geometry, context: Context) -> List[Edge]:
+    """
+    Returns edges of the shaped geometry
+    along with sides of the interior relative to them.
+    """
+    result = []  # type: List[Edge]
+    for polygon in (shaped.polygons
+                    if isinstance(shaped, context.multipolygon_cls)
+                    else [shaped]):
+        result.extend(_to_contour_edges(polygon.border, True))
+        for hole in polygon.holes:
+            result.extend(_to_contour_edges(hole, False))
+    return result
+
+
+def _decompose(geometry: Geometry
+               ) -> Tuple[Sequence[Point], Sequence[Segment],
+                          Optional[Geometry]]:
+    context = geometry._context
+    if isinstance(geometry, context.mix_cls):
+        points, _, _ = _decompose(geometry.discrete)
+        _, segments, _ = _decompose(geometry.linear)
+        _, _, shaped = _decompose(geometry.shaped)
+        return points, segments, shaped
+    elif isinstance(geometry, context.multipoint_cls):
+        return geometry.points, [], None
+    elif isinstance(geometry, context.segment_cls):
+        return [], [geometry], None
+    elif isinstance(geometry, (context.contour_cls,
+                               context.multisegment_cls)):
+        return [], geometry.segments, None
+    elif isinstance(geometry, (context.polygon_cls,
+                               context.multipolygon_cls)):
+        return [], [], geometry
+    else:
+        return [], [], None
+
+
+def _is_point_on_segments(tree: SegmentsTree,
+                          point: Point,
+                          context: Context) -> bool:
+    segments, _ = to_point_containing_items(tree, point)
+    return any(context.segment_contains_point(segment, point)
+               for segment in segments)
+
+
+def _locate_points(operand: _Operand,
+                   points: Sequence[Point],
+                   with_discrete: bool,
+                   context: Context) -> List[Location]:
+    discrete_points, linear_tree, shaped = operand
+    result = ([Location.EXTERIOR] * len(points)
+              if shaped is None or not points
+              else list(shaped._locate_points(points)))
+    for index, location in enumerate(result):
+        if location is Location.EXTERIOR:
+            point = points[index]
+            if ((with_discrete and point in discrete_points)
+                    or (linear_tree is not None
+                        and _is_point_on_segments(linear_tree, point,
+                                                  context))):
+                result[index] = Location.BOUNDARY
+    return result
+
+
+def _split_edges(edges: Sequence[Edge],
+                 splits: Sequence[Sequence[Point]]) -> List[Piece]:
+    result = []  # type: List[Piece]
+    for (segment, side), points in zip(edges, splits):
+        start, end = segment.start, segment.end
+        for point in sorted({point
+                             for point in points
+                             if point != start and point != end},
+                            key=_to_point_key,
+                            reverse=_to_point_key(end) < _to_point_key(start)):
+            result.append((start, point, side))
+            start = point
+        result.append((start, end, side))
+    return result
+
+
+def _to_contour_edges(contour: Contour, is_border: bool) -> List[Edge]:
+    is_interior_on_left = ((contour.orientation
+                            is Orientation.COUNTERCLOCKWISE)
+                           is is_border)
+    return [(segment, is_interior_on_left) for segment in contour.segments]
+
+
+def _to_edges(segments: Sequence[Segment],
+              shaped: Optional[Geometry],
+              context: Context) -> List[Edge]:
+    result = [(segment, None) for segment in segments]  # type: List[Edge]
+    if shaped is not None:
+        result.extend(to_shaped_edges(shaped, context))
+    return result
+
+
+def _to_edges_tree(edges: Sequence[Edge], context: Context) -> BoxesTree:
+    return to_boxes_tree([context.segment_box(segment)
+                          for segment, _ in edges], range(len(edges)),
+                         context)
+
+
+def _to_linear_tree(segments: Sequence[Segment],
+                    context: Context) -> Optional[SegmentsTree]:
+    return to_segments_tree(segments, context) if segments else None
+
+
+def _to_locations_pairs(points: Sequence[Point],
+                        pieces: Sequence[Piece],
+                        other: _Operand,
+                        other_pieces_by_keys: Dict[Tuple[Point, Point],
+                                                   Piece],
+                        common_points: Set[Point],
+                        context: Context) -> Iterator[_LocationsPair]:
+    # yields locations relative to the geometry & the other one
+    # of pieces, faces on both sides of them & vertices,
+    # sides of pieces shared with the other geometry
+    # are located by orientations of both geometries' edges
+    segment_cls = context.segment_cls
+    not_shared_pieces = []
+    for piece in pieces:
+        other_piece = other_pieces_by_keys.get(to_piece_key(piece))
+        if other_piece is None:
+            not_shared_pieces.append(piece)
+            continue
+        yield Location.BOUNDARY, Location.BOUNDARY
+        _, _, side = piece
+        yield from zip(_to_sides_locations(side),
+                       _to_sides_locations(to_aligned_side(piece,
+                                                           other_piece)))
+    for (_, _, side), location in zip(
+            not_shared_pieces,
+            _locate_points(other,
+                           [context.segment_centroid(segment_cls(start, end))
+                            for start, end, _ in not_shared_pieces],
+                           False, context)):
+        yield Location.BOUNDARY, location
+        face_location = (Location.INTERIOR
+                         if location is Location.INTERIOR
+                         else Location.EXTERIOR)
+        for side_location in _to_sides_locations(side):
+            yield side_location, face_location
+    vertices = list({*[start for start, _, _ in pieces],
+                     *[end for _, end, _ in pieces]}
+                    .difference(common_points)
+                    .union(points))
+    for location in _locate_points(other, vertices, True, context):
+        yield Location.BOUNDARY, location
+
+
+def _to_point_key(point: Point) -> Tuple[Scalar, Scalar]:
+    return point.x, point.y
+
+
+def _to_sides_locations(side: Optional[bool]) -> Tuple[Location, Location]:
+    return ((Location.EXTERIOR, Location.EXTERIOR)
+            if side is None
+            else ((Location.INTERIOR, Location.EXTERIOR)
+                  if side
+                  else (Location.EXTERIOR, Location.INTERIOR)))
@@ -1,15 +1,20 @@
-from typing import Optional
+from typing import (Iterator,
+                    List,
+                    Optional)
 
 from clipping.planar import (intersect_segments,
                              subtract_segments,
                              symmetric_subtract_segments,
                              unite_segments)
-from ground.hints import Scalar
+from ground.hints import (Box,
+                          Scalar)
 from orient.planar import (point_in_segment,
                            segment_in_segment)
 from reprit.base import generate_repr
 
 from .angle import Angle
+from .box_clipping import clip_segments_by_box
+from .complexity import monitored
 from .compound import (Compound,
                        Linear,
                        Location,
@@ -19,7 +24,14 @@ from .iterable import non_negative_min
 from .multipoint import Multipoint
 from .packing import pack_mix
 from .point import Point
+from .predicates import (geometry_covers,
+                         may_cover)
+from .similarity import to_sample_points
 from .utils import relate_multipoint_to_linear_compound
+from .validation import (ValidationLevel,
+                         Violation,
+                         raise_first,
+                         to_prefixed_violations)
 
 
 class Segment(Compound[Scalar], Linear[Scalar]):
@@ -40,6 +52,7 @@ class Segment(Compound[Scalar], Linear[Scalar]):
 
     __repr__ = generate_repr(__init__)
 
+    @monitored
     def __and__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns intersection of the segment with the other geometry.
@@ -203,7 +216,7 @@ class Segment(Compound[Scalar], Linear[Scalar]):
         """
         return (self == other
                 or not isinstance(other, Multipoint)
-                and (self.relate(other) in (Relation.EQUAL, Relation.COMPOSITE)
+                and (geometry_covers(other, self)
                      if isinstance(other, Linear)
                      else NotImplemented))
 
@@ -229,10 +242,12 @@ class Segment(Compound[Scalar], Linear[Scalar]):
         """
         return (self != other
                 and not isinstance(other, Multipoint)
-                and (self.relate(other) is Relation.COMPOSITE
+                and (may_cover(other, self)
+                     and self.relate(other) is Relation.COMPOSITE
                      if isinstance(other, Linear)
                      else NotImplemented))
 
+    @monitored
     def __or__(self, other: Compound) -> Compound:
         """
         Returns union of the segment with the other geometry.
@@ -258,6 +273,7 @@ class Segment(Compound[Scalar], Linear[Scalar]):
 
     __ror__ = __or__
 
+    @monitored
     def __sub__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns difference of the segment with the other geometry.
@@ -279,6 +295,7 @@ class Segment(Compound[Scalar], Linear[Scalar]):
                       if isinstance(other, Segment)
                       else NotImplemented))
 
+    @monitored
     def __xor__(self, other: Compound[Scalar]) -> Compound[Scalar]:
         """
         Returns symmetric difference of the segment with the other geometry.
@@ -406,6 +423,25 @@ class Segment(Compound[Scalar], Linear[Scalar]):
         """
         return self._start
 
+    def clip_by_box(self, box: Box[Scalar]) -> Compound[Scalar]:
+        """
+        Returns intersection of the segment with the box.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Box, Point, Segment
+        >>> segment = Segment(Point(0, 0), Point(4, 0))
+        >>> (segment.clip_by_box(Box(1, 3, -1, 1))
+        ...  == Segment(Point(1, 0), Point(3, 0)))
+        True
+        >>> segment.clip_by_box(Box(0, 4, 0, 4)) == segment
+        True
+        """
+        return clip_segments_by_box([self], box, self._context)
+
     def distance_to(self, other: Geometry[Scalar]) -> Scalar:
         """
         Returns distance between the segment and the other geometry.
@@ -542,7 +578,7 @@ class Segment(Compound[Scalar], Linear[Scalar]):
         """
         return self._context.translate_segment(self, step_x, step_y)
 
-    def validate(self) -> None:
+    def validate(self, level: ValidationLevel = ValidationLevel.FULL) -> None:
         """
         Checks if endpoints are valid and unequal.
 
@@ -555,7 +591,34 @@ class Segment(Compound[Scalar], Linear[Scalar]):
         >>> segment = Segment(Point(0, 0), Point(2, 0))
         >>> segment.validate()
         """
-        self.start.validate()
-        self.end.validate()
+        raise_first(self._to_violations(level))
+
+    def violations(self, level: ValidationLevel = ValidationLevel.FULL
+                   ) -> List[Violation]:
+        """
+        Returns violations of endpoints validity and inequality.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import Point, Segment, ValidationLevel, Violation
+        >>> segment = Segment(Point(0, 0), Point(0, 0))
+        >>> segment.violations() == [Violation(ValidationLevel.BASIC,
+        ...                                    'Segment is degenerate.')]
+        True
+        """
+        return list(self._to_violations(level))
+
+    def _to_sample_points(self, densification: Optional[Scalar]
+                          ) -> List[Point[Scalar]]:
+        return to_sample_points([self], densification)
+
+    def _to_violations(self, level: ValidationLevel) -> Iterator[Violation]:
+        yield from to_prefixed_violations(self.start._to_violations(level),
+                                          'start')
+        yield from to_prefixed_violations(self.end._to_violations(level),
+                                          'end')
         if self.start == self.end:
-            raise ValueError('Segment is degenerate.')
+            yield Violation(ValidationLevel.BASIC, 'Segment is degenerate.')
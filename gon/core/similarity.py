@@ -0,0 +1,155 @@
+from fractions import Fraction
+from heapq import (heappop,
+                   heappush)
+from itertools import count
+from math import ceil
+from typing import (List,
+                    Optional,
+                    Sequence)
+
+from ground.base import Context
+from ground.hints import (Box,
+                          Point,
+                          Scalar,
+                          Segment)
+
+from .boxes_tree import (BoxesTree,
+                         to_points_tree)
+
+
+def to_discrete_frechet_distance(first: Sequence[Point],
+                                 second: Sequence[Point],
+                                 context: Context) -> Scalar:
+    """
+    Returns discrete Fréchet distance between sequences of points
+    filling coupling distances matrix row by row.
+    """
+    points_squared_distance = context.points_squared_distance
+    previous_row = []  # type: List[Scalar]
+    for first_point in first:
+        row = []
+        for index, second_point in enumerate(second):
+            squared_distance = points_squared_distance(first_point,
+                                                       second_point)
+            if not previous_row:
+                if row:
+                    squared_distance = max(row[-1], squared_distance)
+            elif not row:
+                squared_distance = max(previous_row[0], squared_distance)
+            else:
+                squared_distance = max(min(previous_row[index - 1],
+                                           previous_row[index], row[-1]),
+                                       squared_distance)
+            row.append(squared_distance)
+        previous_row = row
+    return context.sqrt(previous_row[-1])
+
+
+def to_curves_frechet_distance(first: Sequence[Sequence[Point]],
+                               second: Sequence[Sequence[Point]],
+                               context: Context) -> Scalar:
+    """
+    Returns the largest of discrete Fréchet distances
+    between curves of the sequences paired by their positions.
+    """
+    if len(first) != len(second):
+        raise ValueError('Geometries should consist of the same number '
+                         'of curves, but found {first} and {second}.'
+                         .format(first=len(first),
+                                 second=len(second)))
+    return max(to_discrete_frechet_distance(first_curve, second_curve,
+                                            context)
+               for first_curve, second_curve in zip(first, second))
+
+
+def to_hausdorff_distance(first: Sequence[Point],
+                          second: Sequence[Point],
+                          context: Context,
+                          first_tree: Optional[BoxesTree] = None,
+                          second_tree: Optional[BoxesTree] = None) -> Scalar:
+    """
+    Returns Hausdorff distance between sets of points
+    searching for the nearest neighbours in packed boxes trees.
+    """
+    return context.sqrt(max(
+            _to_directed_hausdorff_squared_distance(
+                    first, (to_points_tree(second, context)
+                            if second_tree is None
+                            else second_tree), context
+            ),
+            _to_directed_hausdorff_squared_distance(
+                    second, (to_points_tree(first, context)
+                             if first_tree is None
+                             else first_tree), context
+            )
+    ))
+
+
+def to_sample_points(segments: Sequence[Segment],
+                     densification: Optional[Scalar]) -> List[Point]:
+    """
+    Returns endpoints of the segments in order of traversal
+    with points splitting each segment into equal parts
+    which length does not exceed given fraction of segment's length.
+    """
+    if densification is None:
+        parts_count = 1
+    elif 0 < densification <= 1:
+        parts_count = ceil(1 / densification)
+    else:
+        raise ValueError('Densification should be in (0, 1] range, '
+                         'but found {value}.'.format(value=densification))
+    result = []
+    for segment in segments:
+        start, end = segment.start, segment.end
+        if not result or result[-1] != start:
+            result.append(start)
+        if parts_count > 1:
+            point_cls = type(start)
+            step_x, step_y = end.x - start.x, end.y - start.y
+            for index in range(1, parts_count):
+                fraction = Fraction(index, parts_count)
+                result.append(point_cls(start.x + step_x * fraction,
+                                        start.y + step_y * fraction))
+        result.append(end)
+    return result
+
+
+def _to_box_point_max_squared_distance(box: Box,
+                                       point: Point,
+                                       context: Context) -> Scalar:
+    point_cls, points_squared_distance = (context.point_cls,
+                                          context.points_squared_distance)
+    return max(points_squared_distance(point, point_cls(x, y))
+               for x in (box.min_x, box.max_x)
+               for y in (box.min_y, box.max_y))
+
+
+def _to_directed_hausdorff_squared_distance(points: Sequence[Point],
+                                            tree: BoxesTree,
+                                            context: Context) -> Scalar:
+    """
+    Returns directed Hausdorff squared distance from the points
+    to the points of the tree with early break:
+    search of the nearest neighbour stops
+    once there is a box of points which is not farther than current maximum.
+    """
+    box_point_squared_distance = context.box_point_squared_distance
+    counter = count()
+    result = 0
+    for point in points:
+        queue = [(box_point_squared_distance(tree[0], point), next(counter),
+                  tree)]
+        while queue:
+            lower_bound, _, node = heappop(queue)
+            if (_to_box_point_max_squared_distance(node[0], point, context)
+                    <= result):
+                break
+            children = node[1]
+            if children is None:
+                result = lower_bound
+                break
+            for child in children:
+                heappush(queue, (box_point_squared_distance(child[0], point),
+                                 next(counter), child))
+    return result
@@ -0,0 +1,755 @@
+from bisect import (bisect_left,
+                    insort)
+from enum import (IntEnum,
+                  unique)
+from heapq import (heapify,
+                   heappop,
+                   heappush)
+from typing import (Dict,
+                    List,
+                    Optional,
+                    Sequence,
+                    Set,
+                    Tuple)
+
+from ground.base import (Context,
+                         Location,
+                         Orientation,
+                         Relation)
+from ground.hints import (Box,
+                          Point,
+                          Polygon,
+                          Scalar,
+                          Segment)
+from locus import kd
+from orient.planar import point_in_region
+
+from .boxes_tree import (BoxesTree,
+                         to_boxes_tree,
+                         to_overlapping_items_pairs,
+                         to_point_containing_items)
+from .iterable import flatten
+from .vertices import MIN_COUNT as MIN_RING_VERTICES_COUNT
+
+MIN_CHAIN_VERTICES_COUNT = 2
+
+
+@unique
+class SimplificationMethod(IntEnum):
+    """
+    Represents methods of vertices simplification.
+    """
+    #: removes vertices which lie not farther than tolerance
+    #: from the segment between the nearest kept vertices
+    DOUGLAS_PEUCKER = 0
+    #: removes vertices which form with their neighbours
+    #: triangles of area less than tolerance
+    VISVALINGAM_WHYATT = 1
+
+    def __repr__(self) -> str:
+        return type(self).__qualname__ + '.' + self.name
+
+
+Chain = Sequence[Point]
+#: ring as a sequence of chains' indices with flags
+#: whether they are traversed in their own direction
+Ring = Sequence[Tuple[int, bool]]
+_Span = Tuple[int, int, int]
+#: shortcuts along with their chords' & regions' boxes
+#: and packed trees of these boxes
+_ShortcutsLevel = Tuple[List[_Span], Tuple[List[Box], List[Box]], BoxesTree,
+                        BoxesTree]
+
+
+def simplify_coverage(polygons: Sequence[Polygon],
+                      tolerance: Scalar,
+                      method: SimplificationMethod
+                      = SimplificationMethod.DOUGLAS_PEUCKER
+                      ) -> List[Polygon]:
+    """
+    Returns polygons of the coverage (polygons with disjoint interiors
+    which share borders in common vertices) simplified by given method
+    within given tolerance (distance for Douglas-Peucker method,
+    area for Visvalingam-Whyatt one), where each chain of edges
+    shared between polygons is simplified once,
+    so that the coverage stays free of gaps & overlaps.
+
+    Time complexity:
+        ``O(vertices_count * log vertices_count)`` expected,
+        ``O(vertices_count ** 2)`` worst
+    Memory complexity:
+        ``O(vertices_count)``
+
+    where ``vertices_count`` is a total number of polygons' vertices.
+
+    >>> from gon.base import Contour, Point, Polygon, simplify_coverage
+    >>> polygons = [Polygon(Contour([Point(0, 0), Point(4, 0), Point(5, 2),
+    ...                              Point(4, 4), Point(0, 4)])),
+    ...             Polygon(Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                              Point(4, 4), Point(5, 2)]))]
+    >>> simplify_coverage(polygons, 0) == polygons
+    True
+    >>> (simplify_coverage(polygons, 1)
+    ...  == [Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                       Point(0, 4)])),
+    ...      Polygon(Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                       Point(4, 4)]))])
+    True
+    """
+    if not polygons:
+        return []
+    context = polygons[0]._context
+    rings = list(flatten([polygon.border.vertices,
+                          *[hole.vertices for hole in polygon.holes]]
+                         for polygon in polygons))
+    chains, closures, rings_pieces = _rings_to_chains(rings, context)
+    simplified_chains = simplify_chains(chains, closures, rings_pieces,
+                                        tolerance, method, context)
+    contour_cls, polygon_cls = context.contour_cls, context.polygon_cls
+    contours = iter([contour_cls(_pieces_to_vertices(pieces,
+                                                     simplified_chains,
+                                                     closures))
+                     for pieces in rings_pieces])
+    return [polygon_cls(next(contours),
+                        [next(contours) for _ in polygon.holes])
+            for polygon in polygons]
+
+
+def simplify_rings(rings: Sequence[Chain],
+                   tolerance: Scalar,
+                   method: SimplificationMethod,
+                   context: Context) -> List[List[Point]]:
+    return simplify_chains(rings, [True] * len(rings),
+                           [[(index, True)] for index in range(len(rings))],
+                           tolerance, method, context)
+
+
+def simplify_chains(chains: Sequence[Chain],
+                    closures: Sequence[bool],
+                    rings: Sequence[Ring],
+                    tolerance: Scalar,
+                    method: SimplificationMethod,
+                    context: Context) -> List[List[Point]]:
+    """
+    Simplifies chains of vertices (closed ones are cyclic)
+    keeping their endpoints & vertices shared between chains,
+    so that simplified chains do not cross, overlap or touch
+    each other in new points and do not sweep over kept vertices,
+    chains composing rings are also kept free of collinear vertices.
+    """
+    shared_points = _to_shared_points(chains)
+    simplifier = (_douglas_peucker
+                  if method is SimplificationMethod.DOUGLAS_PEUCKER
+                  else _visvalingam_whyatt)
+    kept, pinned = [], []
+    for chain, is_closed in zip(chains, closures):
+        chain_pinned = {index
+                        for index, point in enumerate(chain)
+                        if point in shared_points}
+        if not is_closed:
+            chain_pinned.update((0, len(chain) - 1))
+        kept.append(simplifier(chain, is_closed, chain_pinned, tolerance,
+                               context))
+        pinned.append(chain_pinned)
+    _repair_conflicts(chains, closures, rings, kept, pinned, context)
+    return [[chain[index] for index in chain_kept]
+            for chain, chain_kept in zip(chains, kept)]
+
+
+def _douglas_peucker(chain: Chain,
+                     is_closed: bool,
+                     pinned: Set[int],
+                     tolerance: Scalar,
+                     context: Context) -> List[int]:
+    size = len(chain)
+    anchors = sorted(pinned)
+    if is_closed:
+        if not anchors:
+            anchors = [min(range(size),
+                           key=chain.__getitem__)]
+        if len(anchors) == 1:
+            anchor_point = chain[anchors[0]]
+            anchors.append(max(
+                    range(size),
+                    key=lambda index: context.points_squared_distance(
+                            anchor_point, chain[index])
+            ))
+            anchors.sort()
+        anchors.append(anchors[0] + size)
+    result = {anchor % size for anchor in anchors}
+    squared_tolerance = tolerance * tolerance
+    spans = list(zip(anchors, anchors[1:]))
+    while spans:
+        start, end = spans.pop()
+        if end - start < 2:
+            continue
+        index = _to_farthest_index(chain, start, end, context)
+        if (_to_chord_squared_distance(chain, start, end, index, context)
+                > squared_tolerance):
+            result.add(index % size)
+            spans.append((start, index))
+            spans.append((index, end))
+    if is_closed and len(result) < MIN_RING_VERTICES_COUNT:
+        start, end = anchors[0], anchors[1]
+        result.add(max((index for index in range(size) if index not in result),
+                       key=lambda index: _to_chord_squared_distance(
+                               chain, start, end, index, context)))
+    return sorted(result)
+
+
+def _visvalingam_whyatt(chain: Chain,
+                        is_closed: bool,
+                        pinned: Set[int],
+                        tolerance: Scalar,
+                        context: Context) -> List[int]:
+    size = len(chain)
+    previous_indices = [index - 1 for index in range(size)]
+    next_indices = [index + 1 for index in range(size)]
+    if is_closed:
+        previous_indices[0], next_indices[-1] = size - 1, 0
+    removable = [index not in pinned for index in range(size)]
+
+    def to_doubled_area(index: int) -> Scalar:
+        previous_point = chain[previous_indices[index]]
+        return abs(context.cross_product(previous_point, chain[index],
+                                         previous_point,
+                                         chain[next_indices[index]]))
+
+    versions = [0] * size
+    queue = [(to_doubled_area(index), index, 0)
+             for index in range(size)
+             if removable[index]]
+    heapify(queue)
+    removed = [False] * size
+    doubled_tolerance = 2 * tolerance
+    rest_count = size
+    min_count = (MIN_RING_VERTICES_COUNT
+                 if is_closed
+                 else MIN_CHAIN_VERTICES_COUNT)
+    while queue and rest_count > min_count:
+        doubled_area, index, version = heappop(queue)
+        if removed[index] or version != versions[index]:
+            continue
+        elif doubled_area >= doubled_tolerance:
+            break
+        removed[index] = True
+        rest_count -= 1
+        previous_index, next_index = (previous_indices[index],
+                                      next_indices[index])
+        next_indices[previous_index], previous_indices[next_index] = (
+            next_index, previous_index
+        )
+        for neighbour_index in (previous_index, next_index):
+            if removable[neighbour_index]:
+                versions[neighbour_index] += 1
+                heappush(queue, (to_doubled_area(neighbour_index),
+                                 neighbour_index, versions[neighbour_index]))
+    return [index for index in range(size) if not removed[index]]
+
+
+def _repair_conflicts(chains: Sequence[Chain],
+                      closures: Sequence[bool],
+                      rings: Sequence[Ring],
+                      kept: Sequence[List[int]],
+                      pinned: Sequence[Set[int]],
+                      context: Context) -> None:
+    """
+    Restores vertices of chains until spans between kept vertices
+    do not conflict with each other & kept vertices,
+    checking only spans which are changed by the previous restorations
+    along with restored vertices against the rest.
+    """
+    rings_chains_indices = {chain_index
+                            for ring in rings
+                            for chain_index, _ in ring}
+    joints = _to_rings_joints(chains, rings)
+    spans = set(flatten(_to_chain_spans(chain_index, chains[chain_index],
+                                        closures[chain_index],
+                                        kept[chain_index])
+                        for chain_index in range(len(chains))))
+    kept_counts = {}  # type: Dict[Point, int]
+    for chain, chain_kept in zip(chains, kept):
+        for index in chain_kept:
+            point = chain[index]
+            kept_counts[point] = kept_counts.get(point, 0) + 1
+    dirty_spans = set(spans)
+    dirty_vertices = [(chain_index, index)
+                      for chain_index in sorted(rings_chains_indices,
+                                                reverse=True)
+                      for index in reversed(kept[chain_index])]
+    restored_points = []  # type: List[Point]
+    # packed trees of shortcuts checked on previous iterations
+    # with sizes decreasing geometrically, so every shortcut
+    # takes part in logarithmic number of trees' rebuilds
+    shortcuts_levels = []  # type: List[_ShortcutsLevel]
+    edges_tree = points_tree = None
+
+    def to_vertex_spans(chain_index: int,
+                        index: int) -> Tuple[Optional[_Span],
+                                             Optional[_Span]]:
+        chain_kept = kept[chain_index]
+        size = len(chains[chain_index])
+        is_closed = closures[chain_index]
+        position = bisect_left(chain_kept, index)
+        return ((chain_index, chain_kept[position - 1], index)
+                if position
+                else ((chain_index, chain_kept[-1], index + size)
+                      if is_closed
+                      else None),
+                (chain_index, index, chain_kept[position + 1])
+                if position + 1 < len(chain_kept)
+                else ((chain_index, index, chain_kept[0] + size)
+                      if is_closed
+                      else None))
+
+    def to_turns(chain_index: int, index: int) -> List[Tuple[_Span, _Span]]:
+        if closures[chain_index] or 0 < index < len(chains[chain_index]) - 1:
+            previous_span, next_span = to_vertex_spans(chain_index, index)
+            return [(previous_span, next_span)]
+        own_span = to_end_span(chain_index, index)
+        return [(own_span, to_end_span(other_chain_index, other_index))
+                for other_chain_index, other_index
+                in joints.get((chain_index, index), ())]
+
+    def to_end_span(chain_index: int, index: int) -> _Span:
+        chain_kept = kept[chain_index]
+        return ((chain_index, chain_kept[0], chain_kept[1])
+                if index == 0
+                else (chain_index, chain_kept[-2], chain_kept[-1]))
+
+    def drop_collinear_vertex(chain_index: int, index: int) -> None:
+        chain_kept = kept[chain_index]
+        position = bisect_left(chain_kept, index)
+        if (position == len(chain_kept) or chain_kept[position] != index
+                or index in pinned[chain_index]
+                or len(chain_kept) <= (MIN_RING_VERTICES_COUNT
+                                       if closures[chain_index]
+                                       else MIN_CHAIN_VERTICES_COUNT)):
+            return
+        previous_span, next_span = to_vertex_spans(chain_index, index)
+        if previous_span is None or next_span is None:
+            return
+        chain = chains[chain_index]
+        size = len(chain)
+        previous_index, next_index = (previous_span[1] % size,
+                                      next_span[2] % size)
+        previous_point, point, next_point = (chain[previous_index],
+                                             chain[index], chain[next_index])
+        if (context.angle_orientation(previous_point, point, next_point)
+                is Orientation.COLLINEAR
+                and context.segment_contains_point(
+                        context.segment_cls(previous_point, next_point),
+                        point)):
+            del chain_kept[position]
+            kept_counts[point] -= 1
+            for span in (previous_span, next_span):
+                spans.discard(span)
+                dirty_spans.discard(span)
+            _, merged_span = to_vertex_spans(chain_index, previous_index)
+            spans.add(merged_span)
+            dirty_spans.add(merged_span)
+            dirty_vertices.append((chain_index, next_index))
+            dirty_vertices.append((chain_index, previous_index))
+
+    while True:
+        while dirty_vertices:
+            drop_collinear_vertex(*dirty_vertices.pop())
+        conflicts = set()  # type: Set[_Span]
+
+        def add_conflict(span: _Span) -> None:
+            if _is_shortcut(span):
+                conflicts.add(span)
+
+        def check_pair(span: _Span, other_span: _Span) -> None:
+            segment, other_segment = (_span_to_segment(span, chains, context),
+                                      _span_to_segment(other_span, chains,
+                                                       context))
+            relation = context.segments_relation(segment, other_segment)
+            if relation is Relation.DISJOINT or (
+                    relation is Relation.TOUCH
+                    and (segment.start == other_segment.start
+                         or segment.start == other_segment.end
+                         or segment.end == other_segment.start
+                         or segment.end == other_segment.end)
+                    and _are_spans_allowed_to_touch(span, other_span,
+                                                    chains)):
+                return
+            add_conflict(span)
+            add_conflict(other_span)
+
+        for span in dirty_spans:
+            chain_index, start, end = span
+            if chain_index not in rings_chains_indices:
+                continue
+            chain = chains[chain_index]
+            for index in (start, end % len(chain)):
+                vertex = chain[index]
+                for previous_span, next_span in to_turns(chain_index, index):
+                    if (context.angle_orientation(
+                            _to_other_endpoint(previous_span, vertex, chains),
+                            vertex,
+                            _to_other_endpoint(next_span, vertex, chains))
+                            is Orientation.COLLINEAR):
+                        add_conflict(previous_span)
+                        add_conflict(next_span)
+        dirty_shortcuts = [span for span in dirty_spans if _is_shortcut(span)]
+        if dirty_shortcuts:
+            if edges_tree is None:
+                edges = list(flatten(
+                        _to_chain_spans(chain_index, chain, is_closed,
+                                        range(len(chain)))
+                        for chain_index, (chain, is_closed)
+                        in enumerate(zip(chains, closures))))
+                edges_tree = to_boxes_tree(
+                        [_to_chord_box(edge, chains, context)
+                         for edge in edges], edges, context
+                )
+                points_tree = kd.Tree(list({point
+                                            for chain in chains
+                                            for point in chain}),
+                                      context=context)
+            dirty_shortcuts_tree = to_boxes_tree(
+                    [_to_chord_box(span, chains, context)
+                     for span in dirty_shortcuts], dirty_shortcuts, context
+            )
+            for span, other_span in to_overlapping_items_pairs(
+                    dirty_shortcuts_tree, edges_tree):
+                if other_span in spans:
+                    check_pair(span, other_span)
+            for span, other_span in to_overlapping_items_pairs(
+                    dirty_shortcuts_tree, dirty_shortcuts_tree):
+                if span < other_span:
+                    check_pair(span, other_span)
+        dirty_edges = [span for span in dirty_spans if not _is_shortcut(span)]
+        if dirty_edges and shortcuts_levels:
+            dirty_edges_tree = to_boxes_tree(
+                    [_to_chord_box(span, chains, context)
+                     for span in dirty_edges], dirty_edges, context
+            )
+        else:
+            dirty_edges_tree = None
+        for _, _, chords_tree, regions_tree in shortcuts_levels:
+            if dirty_shortcuts:
+                for span, other_span in to_overlapping_items_pairs(
+                        dirty_shortcuts_tree, chords_tree):
+                    if other_span in spans:
+                        check_pair(span, other_span)
+            if dirty_edges_tree is not None:
+                for span, other_span in to_overlapping_items_pairs(
+                        dirty_edges_tree, chords_tree):
+                    if other_span in spans:
+                        check_pair(span, other_span)
+            for point in restored_points:
+                candidates, _ = to_point_containing_items(regions_tree, point)
+                for span in candidates:
+                    if (span in spans and span not in conflicts
+                            and _does_shortcut_sweep_over(span, [point],
+                                                          chains, context)):
+                        conflicts.add(span)
+        for span in dirty_shortcuts:
+            if span in conflicts:
+                continue
+            chain_index, start, end = span
+            chain = chains[chain_index]
+            size = len(chain)
+            candidates = [
+                candidate
+                for candidate in points_tree.find_box_points(
+                        context.points_box([chain[index % size]
+                                            for index in range(start,
+                                                               end + 1)]))
+                if kept_counts.get(candidate, 0)
+            ]
+            if _does_shortcut_sweep_over(span, candidates, chains, context):
+                conflicts.add(span)
+        if dirty_shortcuts:
+            _push_shortcuts_level(shortcuts_levels, dirty_shortcuts, spans,
+                                  chains, context)
+        if not conflicts:
+            break
+        dirty_spans, restored_points = set(), []
+        for span in conflicts:
+            chain_index, start, end = span
+            chain = chains[chain_index]
+            size = len(chain)
+            index = _to_farthest_index(chain, start, end, context) % size
+            insort(kept[chain_index], index)
+            pinned[chain_index].add(index)
+            point = chain[index]
+            kept_counts[point] = kept_counts.get(point, 0) + 1
+            restored_points.append(point)
+            spans.discard(span)
+            for new_span in to_vertex_spans(chain_index, index):
+                spans.add(new_span)
+                dirty_spans.add(new_span)
+            if chain_index in rings_chains_indices:
+                dirty_vertices.append((chain_index, end % size))
+                dirty_vertices.append((chain_index, start))
+
+
+def _does_shortcut_sweep_over(span: _Span,
+                              points: Sequence[Point],
+                              chains: Sequence[Chain],
+                              context: Context) -> bool:
+    chain_index, start, end = span
+    chain = chains[chain_index]
+    size = len(chain)
+    vertices = [chain[index % size] for index in range(start, end + 1)]
+    start_point, end_point = vertices[0], vertices[-1]
+    candidates = [point
+                  for point in points
+                  if point != start_point and point != end_point]
+    if not candidates:
+        return False
+    region = context.contour_cls(vertices)
+    return any(point_in_region(candidate, region,
+                               context=context) is not Location.EXTERIOR
+               for candidate in candidates)
+
+
+def _push_shortcuts_level(levels: List[_ShortcutsLevel],
+                          shortcuts: List[_Span],
+                          spans: Set[_Span],
+                          chains: Sequence[Chain],
+                          context: Context) -> None:
+    chords_boxes = [_to_chord_box(span, chains, context) for span in shortcuts]
+    regions_boxes = [_to_region_box(span, chains, context)
+                     for span in shortcuts]
+    while levels and len(levels[-1][0]) <= len(shortcuts):
+        level_shortcuts, level_boxes, _, _ = levels.pop()
+        level_chords_boxes, level_regions_boxes = level_boxes
+        for span, chord_box, region_box in zip(level_shortcuts,
+                                               level_chords_boxes,
+                                               level_regions_boxes):
+            if span in spans:
+                shortcuts.append(span)
+                chords_boxes.append(chord_box)
+                regions_boxes.append(region_box)
+    levels.append((shortcuts, (chords_boxes, regions_boxes),
+                   to_boxes_tree(chords_boxes, shortcuts, context),
+                   to_boxes_tree(regions_boxes, shortcuts, context)))
+
+
+def _is_shortcut(span: _Span) -> bool:
+    _, start, end = span
+    return end - start > 1
+
+
+def _span_to_segment(span: _Span,
+                     chains: Sequence[Chain],
+                     context: Context) -> Segment:
+    start, end = _span_to_endpoints(span, True, chains)
+    return context.segment_cls(start, end)
+
+
+def _to_chain_spans(chain_index: int,
+                    chain: Chain,
+                    is_closed: bool,
+                    chain_kept: Sequence[int]) -> List[_Span]:
+    result = [(chain_index, start, end)
+              for start, end in zip(chain_kept, chain_kept[1:])]
+    if is_closed:
+        result.append((chain_index, chain_kept[-1],
+                       chain_kept[0] + len(chain)))
+    return result
+
+
+def _to_chord_box(span: _Span,
+                  chains: Sequence[Chain],
+                  context: Context) -> Box:
+    return context.segment_box(_span_to_segment(span, chains, context))
+
+
+def _to_other_endpoint(span: _Span,
+                       point: Point,
+                       chains: Sequence[Chain]) -> Point:
+    start, end = _span_to_endpoints(span, True, chains)
+    return end if start == point else start
+
+
+def _to_region_box(span: _Span,
+                   chains: Sequence[Chain],
+                   context: Context) -> Box:
+    chain_index, start, end = span
+    chain = chains[chain_index]
+    size = len(chain)
+    return context.points_box([chain[index % size]
+                               for index in range(start, end + 1)])
+
+
+def _to_rings_joints(chains: Sequence[Chain],
+                     rings: Sequence[Ring]
+                     ) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+    result = {}  # type: Dict[Tuple[int, int], List[Tuple[int, int]]]
+    for ring in rings:
+        if len(ring) < 2:
+            continue
+        for position, (chain_index, is_forward) in enumerate(ring):
+            next_chain_index, is_next_forward = ring[(position + 1)
+                                                     % len(ring)]
+            end_index = len(chains[chain_index]) - 1 if is_forward else 0
+            next_start_index = (0
+                                if is_next_forward
+                                else len(chains[next_chain_index]) - 1)
+            result.setdefault((chain_index, end_index), []).append(
+                    (next_chain_index, next_start_index)
+            )
+            result.setdefault((next_chain_index, next_start_index),
+                              []).append((chain_index, end_index))
+    return result
+
+
+def _are_spans_allowed_to_touch(first: _Span,
+                                second: _Span,
+                                chains: Sequence[Chain]) -> bool:
+    first_chain_index, first_start, first_end = first
+    second_chain_index, second_start, second_end = second
+    if first_chain_index != second_chain_index:
+        return True
+    size = len(chains[first_chain_index])
+    return (first_end % size == second_start % size
+            or second_end % size == first_start % size)
+
+
+def _span_to_endpoints(span: _Span,
+                       is_forward: bool,
+                       chains: Sequence[Chain]) -> Tuple[Point, Point]:
+    chain_index, start, end = span
+    chain = chains[chain_index]
+    start_point, end_point = chain[start], chain[end % len(chain)]
+    return ((start_point, end_point)
+            if is_forward
+            else (end_point, start_point))
+
+
+def _to_chord_squared_distance(chain: Chain,
+                               start: int,
+                               end: int,
+                               index: int,
+                               context: Context) -> Scalar:
+    size = len(chain)
+    start_point, end_point, point = (chain[start % size], chain[end % size],
+                                     chain[index % size])
+    return (context.points_squared_distance(start_point, point)
+            if start_point == end_point
+            else context.segment_point_squared_distance(
+                    context.segment_cls(start_point, end_point), point))
+
+
+def _to_farthest_index(chain: Chain,
+                       start: int,
+                       end: int,
+                       context: Context) -> int:
+    return max(range(start + 1, end),
+               key=lambda index: _to_chord_squared_distance(chain, start, end,
+                                                            index, context))
+
+
+def _to_shared_points(chains: Sequence[Chain]) -> Set[Point]:
+    counts = {}  # type: Dict[Point, int]
+    for chain in chains:
+        for point in chain:
+            counts[point] = counts.get(point, 0) + 1
+    return {point for point, count in counts.items() if count > 1}
+
+
+def _rings_to_chains(rings: Sequence[Chain],
+                     context: Context
+                     ) -> Tuple[List[List[Point]], List[bool], List[Ring]]:
+    edges = {}  # type: Dict[Tuple[Point, Point], None]
+    degrees = {}  # type: Dict[Point, int]
+    for ring in rings:
+        for index, vertex in enumerate(ring):
+            edge = _to_edge(ring[index - 1], vertex)
+            if edge not in edges:
+                edges[edge] = None
+                for endpoint in edge:
+                    degrees[endpoint] = degrees.get(endpoint, 0) + 1
+    segment_cls = context.segment_cls
+    chains, closures = segments_to_chains([segment_cls(start, end)
+                                           for start, end in edges])
+    edges_positions = {}  # type: Dict[Tuple[Point, Point], Tuple[int, int]]
+    for chain_index, (chain, is_closed) in enumerate(zip(chains, closures)):
+        for position in range(len(chain) - (not is_closed)):
+            edges_positions[_to_edge(chain[position],
+                                     chain[(position + 1) % len(chain)])] = (
+                chain_index, position
+            )
+    rings_pieces = []
+    for ring in rings:
+        size = len(ring)
+        start = next((index
+                      for index, vertex in enumerate(ring)
+                      if degrees[vertex] != 2),
+                     0)
+        pieces = []
+        offset = 0
+        while offset < size:
+            vertex = ring[(start + offset) % size]
+            chain_index, position = edges_positions[
+                _to_edge(vertex, ring[(start + offset + 1) % size])
+            ]
+            chain = chains[chain_index]
+            pieces.append((chain_index, chain[position] == vertex))
+            offset += len(chain) - (not closures[chain_index])
+        rings_pieces.append(pieces)
+    return chains, closures, rings_pieces
+
+
+def _pieces_to_vertices(pieces: Ring,
+                        chains: Sequence[Chain],
+                        closures: Sequence[bool]) -> List[Point]:
+    result = []
+    for chain_index, is_forward in pieces:
+        chain = chains[chain_index]
+        if closures[chain_index]:
+            result.extend(chain
+                          if is_forward
+                          else [chain[0], *chain[:0:-1]])
+        else:
+            result.extend((chain if is_forward else chain[::-1])[:-1])
+    return result
+
+
+def _to_edge(start: Point, end: Point) -> Tuple[Point, Point]:
+    return (start, end) if start < end else (end, start)
+
+
+def segments_to_chains(segments: Sequence[Segment]
+                       ) -> Tuple[List[List[Point]], List[bool]]:
+    adjacency = {}  # type: Dict[Point, List[int]]
+    for index, segment in enumerate(segments):
+        adjacency.setdefault(segment.start, []).append(index)
+        adjacency.setdefault(segment.end, []).append(index)
+    visited = [False] * len(segments)
+    chains, closures = [], []
+
+    def walk(point: Point, index: int) -> List[Point]:
+        result = [point]
+        while True:
+            visited[index] = True
+            segment = segments[index]
+            point = segment.end if segment.start == point else segment.start
+            result.append(point)
+            incident = adjacency[point]
+            if len(incident) != 2:
+                break
+            index = incident[0] if incident[1] == index else incident[1]
+            if visited[index]:
+                break
+        return result
+
+    for point, incident in adjacency.items():
+        if len(incident) != 2:
+            for index in incident:
+                if not visited[index]:
+                    chains.append(walk(point, index))
+    for index, segment in enumerate(segments):
+        if not visited[index]:
+            chains.append(walk(segment.start, index))
+    for chain in chains:
+        is_closed = chain[0] == chain[-1]
+        if is_closed:
+            del chain[-1]
+        closures.append(is_closed)
+    return chains, closures
@@ -0,0 +1,129 @@
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+from random import Random
+from typing import (Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Tuple)
+
+from ground.base import Context
+from ground.hints import (Point,
+                          Polygon)
+from sect.triangulation import Triangulation
+
+from .iterable import flatten
+
+#: interleaved coordinates of vertices
+#: along with triplets of indices of triangles vertices
+TriangularArrays = Tuple[array, array]
+
+COORDINATES_TYPECODE = 'd'
+INDICES_TYPECODE = 'I'
+
+
+def merge_triangular_arrays(arrays: Iterable[TriangularArrays]
+                            ) -> TriangularArrays:
+    """
+    Returns concatenation of triangular arrays
+    with indices shifted to refer to merged coordinates.
+    """
+    coordinates, indices = (array(COORDINATES_TYPECODE),
+                            array(INDICES_TYPECODE))
+    for part_coordinates, part_indices in arrays:
+        offset = len(coordinates) // 2
+        indices.extend(index + offset for index in part_indices)
+        coordinates.extend(part_coordinates)
+    return coordinates, indices
+
+
+def sample_triangular_arrays(arrays: TriangularArrays,
+                             cumulative_areas: array,
+                             count: int,
+                             seed: Optional[int],
+                             context: Context) -> List[Point]:
+    """
+    Returns uniformly distributed points inside of triangles
+    chosen by binary search over their cumulative areas.
+    """
+    if count < 0:
+        raise ValueError('Count should be non-negative, '
+                         'but found {value}.'.format(value=count))
+    coordinates, indices = arrays
+    point_cls, random = context.point_cls, Random(seed).random
+    total_area, last_triangle_index = (cumulative_areas[-1],
+                                       len(cumulative_areas) - 1)
+    result = []  # type: List[Point]
+    for _ in range(count):
+        offset = 3 * min(bisect_right(cumulative_areas,
+                                      random() * total_area),
+                         last_triangle_index)
+        first_index, second_index, third_index = (2 * indices[offset],
+                                                  2 * indices[offset + 1],
+                                                  2 * indices[offset + 2])
+        first_x, first_y = (coordinates[first_index],
+                            coordinates[first_index + 1])
+        first_factor, second_factor = random(), random()
+        if first_factor + second_factor > 1:
+            first_factor, second_factor = 1 - first_factor, 1 - second_factor
+        result.append(point_cls(
+                first_x
+                + first_factor * (coordinates[second_index] - first_x)
+                + second_factor * (coordinates[third_index] - first_x),
+                first_y
+                + first_factor * (coordinates[second_index + 1] - first_y)
+                + second_factor * (coordinates[third_index + 1] - first_y)
+        ))
+    return result
+
+
+def to_cumulative_areas(arrays: TriangularArrays) -> array:
+    """
+    Returns prefix sums of doubled areas of triangles.
+    """
+    coordinates, indices = arrays
+    return array(COORDINATES_TYPECODE,
+                 accumulate(_to_doubled_area(coordinates, indices, offset)
+                            for offset in range(0, len(indices), 3)))
+
+
+def to_readonly_buffers(arrays: TriangularArrays
+                        ) -> Tuple[memoryview, memoryview]:
+    """
+    Returns read-only views of copies of triangular arrays.
+    """
+    return tuple(memoryview(values.tobytes()).cast(values.typecode)
+                 for values in arrays)
+
+
+def to_triangular_arrays(polygon: Polygon,
+                         triangulation: Triangulation) -> TriangularArrays:
+    """
+    Returns coordinates of the polygon's vertices (border's ones first)
+    along with indices of counterclockwise triangles' vertices.
+    """
+    vertices = [*polygon.border.vertices,
+                *flatten(hole.vertices for hole in polygon.holes)]
+    vertices_indices = {}  # type: Dict[Point, int]
+    for index, vertex in enumerate(vertices):
+        vertices_indices.setdefault(vertex, index)
+    return (array(COORDINATES_TYPECODE,
+                  flatten((float(vertex.x), float(vertex.y))
+                          for vertex in vertices)),
+            array(INDICES_TYPECODE,
+                  [vertices_indices[vertex]
+                   for triangle in triangulation.triangles()
+                   for vertex in triangle.vertices]))
+
+
+def _to_doubled_area(coordinates: array, indices: array, offset: int
+                     ) -> float:
+    first_index, second_index, third_index = (2 * indices[offset],
+                                              2 * indices[offset + 1],
+                                              2 * indices[offset + 2])
+    first_x, first_y = coordinates[first_index], coordinates[first_index + 1]
+    return ((coordinates[second_index] - first_x)
+            * (coordinates[third_index + 1] - first_y)
+            - (coordinates[second_index + 1] - first_y)
+            * (coordinates[third_index] - first_x))
@@ -0,0 +1,175 @@
+from enum import (IntEnum,
+                  unique)
+from typing import (Hashable,
+                    Iterable,
+                    Iterator,
+                    Set,
+                    Tuple,
+                    Union)
+
+from reprit.base import generate_repr
+
+#: sequence of attributes names & indices
+#: which leads from validated geometry to its violating part
+Path = Tuple[Union[int, str], ...]
+
+
+@unique
+class ValidationLevel(IntEnum):
+    """
+    Represents levels of geometries validation,
+    each level includes checks of the previous ones.
+    """
+    #: checks coordinates finiteness, elements counts & duplicates
+    BASIC = 0
+    #: additionally checks orientation of consecutive vertices
+    #: & self-intersections
+    TOPOLOGY = 1
+    #: additionally checks relations between components
+    #: like holes tearing polygons apart
+    FULL = 2
+
+    def __repr__(self) -> str:
+        return type(self).__qualname__ + '.' + self.name
+
+
+class Violation:
+    __slots__ = '_level', '_message', '_path'
+
+    def __init__(self,
+                 level: ValidationLevel,
+                 message: str,
+                 path: Path = ()) -> None:
+        """
+        Initializes violation.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+        """
+        self._level, self._message, self._path = level, message, path
+
+    __repr__ = generate_repr(__init__)
+
+    def __eq__(self, other: 'Violation') -> bool:
+        """
+        Checks if violations are equal.
+
+        Time complexity:
+            ``O(len(self.path))``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import ValidationLevel, Violation
+        >>> (Violation(ValidationLevel.BASIC, 'Multipoint is empty.')
+        ...  == Violation(ValidationLevel.BASIC, 'Multipoint is empty.'))
+        True
+        """
+        return ((self._level, self._message, self._path)
+                == (other._level, other._message, other._path)
+                if isinstance(other, Violation)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        """
+        Returns hash value of the violation.
+
+        Time complexity:
+            ``O(len(self.path))``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import ValidationLevel, Violation
+        >>> (hash(Violation(ValidationLevel.BASIC, 'Multipoint is empty.'))
+        ...  == hash(Violation(ValidationLevel.BASIC, 'Multipoint is empty.')))
+        True
+        """
+        return hash((self._level, self._message, self._path))
+
+    @property
+    def level(self) -> ValidationLevel:
+        """
+        Returns level of validation which found the violation.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import ValidationLevel, Violation
+        >>> violation = Violation(ValidationLevel.BASIC,
+        ...                       'Multipoint is empty.')
+        >>> violation.level is ValidationLevel.BASIC
+        True
+        """
+        return self._level
+
+    @property
+    def message(self) -> str:
+        """
+        Returns description of the violation.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import ValidationLevel, Violation
+        >>> violation = Violation(ValidationLevel.BASIC,
+        ...                       'Multipoint is empty.')
+        >>> violation.message == 'Multipoint is empty.'
+        True
+        """
+        return self._message
+
+    @property
+    def path(self) -> Path:
+        """
+        Returns attributes names & indices
+        which lead from validated geometry to its violating part,
+        empty for violations of the geometry as a whole.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from gon.base import ValidationLevel, Violation
+        >>> violation = Violation(ValidationLevel.BASIC,
+        ...                       'Duplicate points found.', ('points', 1))
+        >>> violation.path == ('points', 1)
+        True
+        """
+        return self._path
+
+
+def raise_first(violations: Iterable[Violation]) -> None:
+    """
+    Raises error with description of the first violation if any.
+    """
+    for violation in violations:
+        raise ValueError(violation.message)
+
+
+def to_prefixed_violations(violations: Iterable[Violation],
+                           *prefix: Union[int, str]) -> Iterator[Violation]:
+    """
+    Yields violations of the part of the geometry
+    with paths starting from the geometry itself.
+    """
+    for violation in violations:
+        yield Violation(violation.level, violation.message,
+                        prefix + violation.path)
+
+
+def to_repeats_indices(values: Iterable[Hashable]) -> Iterator[int]:
+    """
+    Yields indices of values which are equal to some preceding ones.
+    """
+    visited = set()  # type: Set[Hashable]
+    for index, value in enumerate(values):
+        if value in visited:
+            yield index
+        else:
+            visited.add(value)
@@ -36,6 +36,14 @@ indexables_factories = strategies.sampled_from([coordinates_to_multisegments,
                                                 coordinates_to_polygons,
                                                 coordinates_to_multipolygons,
                                                 coordinates_to_mixes])
+segmental_compounds_factories = strategies.sampled_from(
+        [coordinates_to_multisegments, coordinates_to_contours,
+         coordinates_to_polygons, coordinates_to_multipolygons]
+)
+sampleable_compounds_factories = (
+        strategies.just(coordinates_to_multipoints)
+        | segmental_compounds_factories
+)
 non_empty_compounds_factories = (
         strategies.sampled_from([coordinates_to_multipoints,
                                  coordinates_to_segments])
@@ -53,11 +61,44 @@ indexables_with_non_empty_geometries = (
 )
 non_empty_compounds = factories_to_values(non_empty_compounds_factories,
                                           coordinates_strategies)
+segmental_compounds_pairs = factories_to_values(
+        combine_factories(*repeat(segmental_compounds_factories,
+                                  times=2)),
+        coordinates_strategies
+)
+sampleable_compounds = factories_to_values(sampleable_compounds_factories,
+                                           coordinates_strategies)
+sampleable_compounds_pairs = factories_to_values(
+        combine_factories(*repeat(sampleable_compounds_factories,
+                                  times=2)),
+        coordinates_strategies
+)
+sampleable_compounds_with_coordinates_pairs = factories_to_values(
+        combine_factories(sampleable_compounds_factories,
+                          *repeat(strategies.just(identity),
+                                  times=2)),
+        coordinates_strategies
+)
+sampleable_compounds_with_non_empty_geometries = factories_to_values(
+        combine_factories(sampleable_compounds_factories,
+                          non_empty_geometries_factories),
+        coordinates_strategies
+)
+sampleable_compounds_with_other_geometries = (
+    sampleable_compounds_with_non_empty_geometries
+    .filter(lambda pair: type(pair[0]) is not type(pair[1]))
+)
+parts_counts = strategies.integers(1, 3)
 non_empty_compounds_pairs = factories_to_values(
         combine_factories(*repeat(non_empty_compounds_factories,
                                   times=2)),
         coordinates_strategies
 )
+non_empty_compounds_with_segments = factories_to_values(
+        combine_factories(non_empty_compounds_factories,
+                          strategies.just(coordinates_to_segments)),
+        coordinates_strategies
+)
 compounds = factories_to_values(compounds_factories, coordinates_strategies)
 non_empty_compounds_with_coordinates_pairs = (
     factories_to_values(combine_factories(non_empty_compounds_factories,
@@ -0,0 +1,46 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (EMPTY,
+                      Compound,
+                      Relation)
+from tests.utils import (equivalence,
+                         implication)
+from . import strategies
+
+
+@given(strategies.compounds)
+def test_reflexivity(compound: Compound) -> None:
+    assert compound.covers(compound)
+
+
+@given(strategies.compounds_pairs)
+def test_intersects(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    assert implication(first.covers(second) and second is not EMPTY,
+                       first.intersects(second))
+
+
+@given(strategies.compounds_pairs)
+def test_equivalents(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.covers(second)
+
+    assert equivalence(result, first >= second)
+    assert equivalence(result, second.within(first))
+
+
+@given(strategies.compounds_pairs)
+def test_connection_with_relate(compounds_pair: Tuple[Compound, Compound]
+                                ) -> None:
+    first, second = compounds_pair
+
+    assert equivalence(first.covers(second),
+                       second is EMPTY
+                       or first.relate(second) in (Relation.EQUAL,
+                                                   Relation.COMPONENT,
+                                                   Relation.ENCLOSED,
+                                                   Relation.WITHIN))
@@ -5,7 +5,8 @@ from hypothesis import given
 from gon.base import (Compound,
                       Geometry,
                       Indexable,
-                      Point)
+                      Point,
+                      Segment)
 from tests.utils import equivalence
 from . import strategies
 
@@ -30,6 +31,17 @@ def test_connection_with_disjoint(compounds_pair: Tuple[Compound, Compound]
     assert equivalence(bool(result), first.disjoint(second))
 
 
+@given(strategies.non_empty_compounds_with_segments)
+def test_segment_endpoints(compound_with_segment: Tuple[Compound, Segment]
+                           ) -> None:
+    compound, segment = compound_with_segment
+
+    result = compound.distance_to(segment)
+
+    assert result <= min(compound.distance_to(segment.start),
+                         compound.distance_to(segment.end))
+
+
 @given(strategies.indexables_with_non_empty_geometries)
 def test_indexing(indexable_with_geometry: Tuple[Indexable, Geometry]) -> None:
     indexable, geometry = indexable_with_geometry
@@ -41,3 +53,10 @@ def test_indexing(indexable_with_geometry: Tuple[Indexable, Geometry]) -> None:
     after_indexing = indexable.distance_to(geometry)
 
     assert before_indexing == after_indexing
+
+
+@given(strategies.segmental_compounds_pairs)
+def test_symmetry(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    assert first.distance_to(second) == second.distance_to(first)
@@ -0,0 +1,50 @@
+from typing import Tuple
+
+import pytest
+from cfractions import Fraction
+from hypothesis import given
+
+from gon.base import (Compound,
+                      Geometry)
+from gon.hints import Scalar
+from . import strategies
+
+
+@given(strategies.sampleable_compounds)
+def test_reflexivity(compound: Compound) -> None:
+    assert compound.frechet_distance(compound) == 0
+
+
+@given(strategies.sampleable_compounds_with_coordinates_pairs)
+def test_symmetry(compound_with_steps: Tuple[Compound, Scalar, Scalar]
+                  ) -> None:
+    compound, step_x, step_y = compound_with_steps
+
+    translated = compound.translate(step_x, step_y)
+
+    assert (compound.frechet_distance(translated)
+            == translated.frechet_distance(compound))
+
+
+@given(strategies.sampleable_compounds_with_coordinates_pairs,
+       strategies.parts_counts)
+def test_connection_with_hausdorff_distance(
+        compound_with_steps: Tuple[Compound, Scalar, Scalar],
+        parts_count: int
+) -> None:
+    compound, step_x, step_y = compound_with_steps
+
+    translated = compound.translate(step_x, step_y)
+
+    assert all(compound.hausdorff_distance(translated, densification)
+               <= compound.frechet_distance(translated, densification)
+               for densification in [None, Fraction(1, parts_count)])
+
+
+@given(strategies.sampleable_compounds_with_other_geometries)
+def test_other_types(compound_with_geometry: Tuple[Compound, Geometry]
+                     ) -> None:
+    compound, geometry = compound_with_geometry
+
+    with pytest.raises(TypeError):
+        compound.frechet_distance(geometry)
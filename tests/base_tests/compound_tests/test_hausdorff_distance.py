@@ -0,0 +1,103 @@
+from typing import (List,
+                    Tuple)
+
+from cfractions import Fraction
+from hypothesis import given
+
+from gon.base import (Compound,
+                      Contour,
+                      Geometry,
+                      Multipoint,
+                      Multipolygon,
+                      Multisegment,
+                      Point,
+                      Polygon,
+                      Segment)
+from . import strategies
+
+
+@given(strategies.sampleable_compounds)
+def test_reflexivity(compound: Compound) -> None:
+    assert compound.hausdorff_distance(compound) == 0
+
+
+@given(strategies.sampleable_compounds_pairs)
+def test_symmetry(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    assert first.hausdorff_distance(second) == second.hausdorff_distance(first)
+
+
+@given(strategies.sampleable_compounds_with_non_empty_geometries)
+def test_connection_with_distance_to(
+        compound_with_geometry: Tuple[Compound, Geometry]
+) -> None:
+    compound, geometry = compound_with_geometry
+
+    result = compound.hausdorff_distance(geometry)
+
+    assert compound.distance_to(geometry) <= result
+
+
+@given(strategies.sampleable_compounds_pairs, strategies.parts_counts)
+def test_densification(compounds_pair: Tuple[Compound, Compound],
+                       parts_count: int) -> None:
+    first, second = compounds_pair
+
+    result = first.hausdorff_distance(second, Fraction(1, parts_count))
+
+    first_points, second_points = (to_sample_points(first, parts_count),
+                                   to_sample_points(second, parts_count))
+    assert result == max(max(min(point.distance_to(other_point)
+                                 for other_point in second_points)
+                             for point in first_points),
+                         max(min(point.distance_to(other_point)
+                                 for other_point in first_points)
+                             for point in second_points))
+
+
+@given(strategies.sampleable_compounds_pairs)
+def test_indexing(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    before_indexing = first.hausdorff_distance(second)
+
+    for compound in compounds_pair:
+        if isinstance(compound, Multipoint):
+            compound.index()
+
+    after_indexing = first.hausdorff_distance(second)
+
+    assert before_indexing == after_indexing
+
+
+def to_sample_points(compound: Compound, parts_count: int) -> List[Point]:
+    if isinstance(compound, Multipoint):
+        return list(compound.points)
+    return [point
+            for segment in to_segments(compound)
+            for point in to_segment_sample_points(segment, parts_count)]
+
+
+def to_segment_sample_points(segment: Segment,
+                             parts_count: int) -> List[Point]:
+    start, end = segment.start, segment.end
+    return [start,
+            *[Point(start.x + (end.x - start.x) * Fraction(index, parts_count),
+                    start.y + (end.y - start.y) * Fraction(index, parts_count))
+              for index in range(1, parts_count)],
+            end]
+
+
+def to_segments(compound: Compound) -> List[Segment]:
+    if isinstance(compound, (Contour, Multisegment)):
+        return list(compound.segments)
+    elif isinstance(compound, Polygon):
+        return [segment
+                for contour in [compound.border, *compound.holes]
+                for segment in contour.segments]
+    else:
+        assert isinstance(compound, Multipolygon)
+        return [segment
+                for polygon in compound.polygons
+                for segment in to_segments(polygon)]
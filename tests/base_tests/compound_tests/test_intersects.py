@@ -0,0 +1,45 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (EMPTY,
+                      Compound,
+                      Relation)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.compounds_pairs)
+def test_basic(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.intersects(second)
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.compounds)
+def test_reflexivity_criteria(compound: Compound) -> None:
+    assert equivalence(compound.intersects(compound), compound is not EMPTY)
+
+
+@given(strategies.compounds_pairs)
+def test_symmetry(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    assert equivalence(first.intersects(second), second.intersects(first))
+
+
+@given(strategies.compounds_pairs)
+def test_relation_criteria(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    assert equivalence(first.intersects(second),
+                       first.relate(second) is not Relation.DISJOINT)
+
+
+@given(strategies.compounds_pairs)
+def test_disjoint(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    assert equivalence(first.intersects(second), not first.disjoint(second))
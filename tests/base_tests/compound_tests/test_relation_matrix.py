@@ -0,0 +1,76 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Compound,
+                      Location)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.compounds_pairs)
+def test_basic(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.relation_matrix(second)
+
+    assert isinstance(result, tuple)
+    assert len(result) == len(Location)
+    assert all(isinstance(row, tuple) for row in result)
+    assert all(len(row) == len(Location) for row in result)
+    assert all(isinstance(flag, bool) for row in result for flag in row)
+    assert result[Location.EXTERIOR][Location.EXTERIOR]
+
+
+@given(strategies.compounds)
+def test_self(compound: Compound) -> None:
+    result = compound.relation_matrix(compound)
+
+    assert not any(result[first_location][second_location]
+                   for first_location in Location
+                   for second_location in Location
+                   if first_location is not second_location)
+
+
+@given(strategies.compounds_pairs)
+def test_transposition(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.relation_matrix(second)
+
+    assert result == tuple(zip(*second.relation_matrix(first)))
+
+
+@given(strategies.compounds_pairs)
+def test_intersects(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.relation_matrix(second)
+
+    assert equivalence(first.intersects(second),
+                       any(result[first_location][second_location]
+                           for first_location in (Location.BOUNDARY,
+                                                  Location.INTERIOR)
+                           for second_location in (Location.BOUNDARY,
+                                                   Location.INTERIOR)))
+
+
+@given(strategies.compounds_pairs)
+def test_covers(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.relation_matrix(second)
+
+    assert equivalence(first.covers(second),
+                       not (result[Location.EXTERIOR][Location.BOUNDARY]
+                            or result[Location.EXTERIOR][Location.INTERIOR]))
+
+
+@given(strategies.compounds_pairs)
+def test_union(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = (first | second).relation_matrix(first)
+
+    assert not (result[Location.EXTERIOR][Location.BOUNDARY]
+                or result[Location.EXTERIOR][Location.INTERIOR])
@@ -0,0 +1,22 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import Compound
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.compounds)
+def test_reflexivity(compound: Compound) -> None:
+    assert compound.within(compound)
+
+
+@given(strategies.compounds_pairs)
+def test_equivalents(compounds_pair: Tuple[Compound, Compound]) -> None:
+    first, second = compounds_pair
+
+    result = first.within(second)
+
+    assert equivalence(result, first <= second)
+    assert equivalence(result, second.covers(first))
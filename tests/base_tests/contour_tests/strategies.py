@@ -6,13 +6,18 @@ from gon.base import (Contour,
                       Point)
 from gon.hints import Scalar
 from tests.strategies import (coordinates_strategies,
+                              coordinates_to_boxes,
                               coordinates_to_contours,
                               coordinates_to_points,
                               invalid_contours,
+                              simplification_methods,
+                              to_non_negative_coordinates,
                               to_non_zero_coordinates,
                               to_zero_coordinates)
 from tests.utils import (Strategy,
                          cleave_in_tuples,
+                         is_box_non_degenerate,
+                         to_compound_with_bounding_box,
                          to_pairs,
                          to_triplets)
 
@@ -35,3 +40,16 @@ contours_with_zero_non_zero_coordinates = coordinates_strategies.flatmap(
 contours_strategies = coordinates_strategies.map(coordinates_to_contours)
 contours_pairs = contours_strategies.flatmap(to_pairs)
 contours_triplets = contours_strategies.flatmap(to_triplets)
+contours_with_tolerances = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_contours, to_non_negative_coordinates)
+)
+simplification_methods = simplification_methods
+contours_with_boxes = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_contours, coordinates_to_boxes)
+)
+contours_with_non_degenerate_boxes = (
+        contours_with_boxes
+        | contours.map(to_compound_with_bounding_box)
+).filter(lambda geometry_with_box: is_box_non_degenerate(geometry_with_box[1]))
+grid_sizes = strategies.integers(1, 10)
+invalid_grid_sizes = strategies.integers(max_value=0)
@@ -0,0 +1,37 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Box,
+                      Compound,
+                      Contour)
+from tests.utils import box_to_polygon
+from . import strategies
+
+
+@given(strategies.contours_with_boxes)
+def test_basic(contour_with_box: Tuple[Contour, Box]) -> None:
+    contour, box = contour_with_box
+
+    result = contour.clip_by_box(box)
+
+    assert isinstance(result, Compound)
+
+
+@given(strategies.contours_with_boxes)
+def test_validity(contour_with_box: Tuple[Contour, Box]) -> None:
+    contour, box = contour_with_box
+
+    result = contour.clip_by_box(box)
+
+    result.validate()
+
+
+@given(strategies.contours_with_boxes)
+def test_connection_with_intersection(contour_with_box: Tuple[Contour, Box]
+                                      ) -> None:
+    contour, box = contour_with_box
+
+    result = contour.clip_by_box(box)
+
+    assert result == contour & box_to_polygon(box)
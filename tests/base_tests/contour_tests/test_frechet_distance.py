@@ -0,0 +1,16 @@
+from hypothesis import given
+
+from gon.base import Contour
+from tests.utils import shift_contour
+from . import strategies
+
+
+@given(strategies.contours)
+def test_reversals(contour: Contour) -> None:
+    assert contour.frechet_distance(contour.reverse()) == 0
+
+
+@given(strategies.contours)
+def test_shifts(contour: Contour) -> None:
+    assert all(contour.frechet_distance(shift_contour(contour, step)) == 0
+               for step in range(1, len(contour.vertices)))
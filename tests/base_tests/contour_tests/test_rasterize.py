@@ -0,0 +1,67 @@
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from gon.base import (Box,
+                      Contour)
+from tests.utils import (box_to_polygon,
+                         compound_to_points,
+                         point_to_grid_cell,
+                         runs_to_cells,
+                         to_grid_cells_boxes,
+                         to_rational_box,
+                         to_rational_contour)
+from . import strategies
+
+
+@given(strategies.contours_with_non_degenerate_boxes,
+       strategies.grid_sizes, strategies.grid_sizes)
+def test_basic(contour_with_box: Tuple[Contour, Box],
+               columns: int,
+               rows: int) -> None:
+    contour, box = contour_with_box
+
+    result = contour.rasterize(box, columns, rows)
+
+    assert isinstance(result, list)
+    assert all(isinstance(element, tuple) and len(element) == 3
+               for element in result)
+    assert all(0 <= row < rows and 0 <= start < stop <= columns
+               for row, start, stop in result)
+    assert result == sorted(result)
+    assert all(previous_row < row or previous_stop < start
+               for (previous_row, _, previous_stop), (row, start, _)
+               in zip(result, result[1:]))
+
+
+@given(strategies.contours_with_non_degenerate_boxes,
+       strategies.grid_sizes, strategies.grid_sizes)
+def test_properties(contour_with_box: Tuple[Contour, Box],
+                    columns: int,
+                    rows: int) -> None:
+    contour, box = contour_with_box
+    contour, box = to_rational_contour(contour), to_rational_box(box)
+
+    result = contour.rasterize(box, columns, rows)
+
+    cells = runs_to_cells(result)
+    cells_boxes = to_grid_cells_boxes(box, columns, rows)
+    assert all(not contour.disjoint(box_to_polygon(cells_boxes[cell]))
+               for cell in cells)
+    assert all(cell is None or cell in cells
+               for cell in [point_to_grid_cell(point, box, columns, rows)
+                            for point in compound_to_points(contour)])
+
+
+@given(strategies.contours_with_non_degenerate_boxes,
+       strategies.invalid_grid_sizes, strategies.grid_sizes)
+def test_invalid_sizes(contour_with_box: Tuple[Contour, Box],
+                       columns: int,
+                       rows: int) -> None:
+    contour, box = contour_with_box
+
+    with pytest.raises(ValueError):
+        contour.rasterize(box, columns, rows)
+    with pytest.raises(ValueError):
+        contour.rasterize(box, rows, columns)
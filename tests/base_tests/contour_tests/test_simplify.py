@@ -0,0 +1,47 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Contour,
+                      SimplificationMethod)
+from gon.hints import Scalar
+from tests.utils import compound_to_points
+from . import strategies
+
+
+@given(strategies.contours_with_tolerances, strategies.simplification_methods)
+def test_basic(contour_with_tolerance: Tuple[Contour, Scalar],
+               method: SimplificationMethod) -> None:
+    contour, tolerance = contour_with_tolerance
+
+    result = contour.simplify(tolerance, method)
+
+    assert isinstance(result, Contour)
+
+
+@given(strategies.contours_with_tolerances, strategies.simplification_methods)
+def test_validity(contour_with_tolerance: Tuple[Contour, Scalar],
+                  method: SimplificationMethod) -> None:
+    contour, tolerance = contour_with_tolerance
+
+    result = contour.simplify(tolerance, method)
+
+    result.validate()
+
+
+@given(strategies.contours_with_tolerances, strategies.simplification_methods)
+def test_points_count(contour_with_tolerance: Tuple[Contour, Scalar],
+                      method: SimplificationMethod) -> None:
+    contour, tolerance = contour_with_tolerance
+
+    result = contour.simplify(tolerance, method)
+
+    assert (len(list(compound_to_points(result)))
+            <= len(list(compound_to_points(contour))))
+
+
+@given(strategies.contours, strategies.simplification_methods)
+def test_idempotence(contour: Contour, method: SimplificationMethod) -> None:
+    result = contour.simplify(0, method)
+
+    assert result.simplify(0, method) == result
@@ -0,0 +1,44 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Contour,
+                      Orientation)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.contours)
+def test_basic(contour: Contour) -> None:
+    assert isinstance(contour.to_canonical(), Contour)
+
+
+@given(strategies.contours)
+def test_properties(contour: Contour) -> None:
+    result = contour.to_canonical()
+
+    assert result == contour
+    assert result.vertices[0] == min(contour.vertices)
+    assert result.orientation is Orientation.COUNTERCLOCKWISE
+
+
+@given(strategies.contours)
+def test_idempotence(contour: Contour) -> None:
+    result = contour.to_canonical()
+
+    assert result.to_canonical() is result
+
+
+@given(strategies.contours)
+def test_reversals(contour: Contour) -> None:
+    result = contour.to_canonical()
+
+    assert result.vertices == contour.reverse().to_canonical().vertices
+
+
+@given(strategies.contours_pairs)
+def test_connection_with_eq(contours_pair: Tuple[Contour, Contour]) -> None:
+    first, second = contours_pair
+
+    assert equivalence(first.to_canonical() == second.to_canonical(),
+                       first == second)
@@ -0,0 +1,38 @@
+from typing import (Hashable,
+                    List,
+                    Tuple)
+
+from hypothesis import strategies
+
+from gon.base import (Point,
+                      Polygon)
+from gon.hints import Scalar
+from tests.strategies import (coordinates_strategies,
+                              coordinates_to_points,
+                              coordinates_to_polygons)
+from tests.utils import (Strategy,
+                         cleave_in_tuples)
+
+objects_ids = strategies.integers(0, 2)
+
+
+def to_fences_lists(coordinates: Strategy[Scalar]
+                    ) -> Strategy[List[Polygon]]:
+    return strategies.lists(coordinates_to_polygons(coordinates),
+                            max_size=5)
+
+
+def to_updates_lists(coordinates: Strategy[Scalar]
+                     ) -> Strategy[List[Tuple[Hashable, Point]]]:
+    return strategies.lists(strategies.tuples(objects_ids,
+                                              coordinates_to_points(
+                                                      coordinates)),
+                            max_size=20)
+
+
+fences_lists_with_points = coordinates_strategies.flatmap(
+        cleave_in_tuples(to_fences_lists, coordinates_to_points)
+)
+fences_lists_with_updates_lists = coordinates_strategies.flatmap(
+        cleave_in_tuples(to_fences_lists, to_updates_lists)
+)
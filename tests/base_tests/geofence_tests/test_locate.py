@@ -0,0 +1,33 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from gon.base import (Geofence,
+                      Location,
+                      Point,
+                      Polygon)
+from . import strategies
+
+
+@given(strategies.fences_lists_with_points)
+def test_basic(fences_with_point: Tuple[List[Polygon], Point]) -> None:
+    fences, point = fences_with_point
+    geofence = Geofence(fences)
+
+    result = geofence.locate(point)
+
+    assert isinstance(result, list)
+    assert all(isinstance(element, int) for element in result)
+
+
+@given(strategies.fences_lists_with_points)
+def test_properties(fences_with_point: Tuple[List[Polygon], Point]) -> None:
+    fences, point = fences_with_point
+    geofence = Geofence(fences)
+
+    result = geofence.locate(point)
+
+    assert result == [index
+                      for index, fence in enumerate(fences)
+                      if fence.locate(point) is not Location.EXTERIOR]
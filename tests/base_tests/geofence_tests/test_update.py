@@ -0,0 +1,83 @@
+from typing import (Hashable,
+                    List,
+                    Tuple)
+
+from hypothesis import given
+
+from gon.base import (Geofence,
+                      Location,
+                      Point,
+                      Polygon,
+                      Transition,
+                      TransitionKind)
+from . import strategies
+
+
+@given(strategies.fences_lists_with_updates_lists)
+def test_basic(fences_with_updates: Tuple[List[Polygon],
+                                          List[Tuple[Hashable, Point]]]
+               ) -> None:
+    fences, updates = fences_with_updates
+    geofence = Geofence(fences)
+
+    for object_id, point in updates:
+        result = geofence.update(object_id, point)
+
+        assert isinstance(result, list)
+        assert all(isinstance(element, Transition) for element in result)
+        assert all(element.object_id == object_id for element in result)
+
+
+@given(strategies.fences_lists_with_updates_lists)
+def test_properties(fences_with_updates: Tuple[List[Polygon],
+                                               List[Tuple[Hashable, Point]]]
+                    ) -> None:
+    fences, updates = fences_with_updates
+    geofence = Geofence(fences)
+
+    objects_fences_indices = {}
+    for object_id, point in updates:
+        result = geofence.update(object_id, point)
+
+        previous_indices = objects_fences_indices.get(object_id, set())
+        indices = objects_fences_indices[object_id] = {
+            index
+            for index, fence in enumerate(fences)
+            if fence.locate(point) is not Location.EXTERIOR}
+        assert result == (
+                [Transition(object_id, index, TransitionKind.EXIT)
+                 for index in sorted(previous_indices - indices)]
+                + [Transition(object_id, index, TransitionKind.ENTER)
+                   for index in sorted(indices - previous_indices)]
+        )
+
+
+@given(strategies.fences_lists_with_updates_lists)
+def test_process(fences_with_updates: Tuple[List[Polygon],
+                                            List[Tuple[Hashable, Point]]]
+                 ) -> None:
+    fences, updates = fences_with_updates
+    geofence, other_geofence = Geofence(fences), Geofence(fences)
+
+    result = list(geofence.process(updates))
+
+    assert result == [transition
+                      for object_id, point in updates
+                      for transition in other_geofence.update(object_id,
+                                                              point)]
+
+
+@given(strategies.fences_lists_with_updates_lists)
+def test_remove(fences_with_updates: Tuple[List[Polygon],
+                                           List[Tuple[Hashable, Point]]]
+                ) -> None:
+    fences, updates = fences_with_updates
+    geofence = Geofence(fences)
+
+    for object_id, point in updates:
+        geofence.update(object_id, point)
+        result = geofence.remove(object_id)
+
+        assert result == [Transition(object_id, index, TransitionKind.EXIT)
+                          for index in geofence.locate(point)]
+        assert geofence.remove(object_id) == []
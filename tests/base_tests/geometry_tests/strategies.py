@@ -2,7 +2,8 @@ from itertools import repeat
 
 from hypothesis import strategies
 
-from gon.base import EMPTY
+from gon.base import (EMPTY,
+                      ValidationLevel)
 from tests.strategies import (angles,
                               coordinates_strategies,
                               coordinates_to_contours,
@@ -13,6 +14,13 @@ from tests.strategies import (angles,
                               coordinates_to_points,
                               coordinates_to_polygons,
                               coordinates_to_segments,
+                              invalid_contours,
+                              invalid_multipoints,
+                              invalid_multipolygons,
+                              invalid_multisegments,
+                              invalid_points,
+                              invalid_polygons,
+                              invalid_segments,
                               to_non_zero_coordinates,
                               to_zero_coordinates)
 from tests.utils import (cleave_in_tuples,
@@ -68,3 +76,18 @@ non_empty_geometries_pairs = factories_to_values(
                                   times=2)),
         coordinates_strategies
 )
+validation_levels = strategies.sampled_from(ValidationLevel)
+geometries_with_validation_levels = strategies.tuples(geometries,
+                                                      validation_levels)
+invalid_geometries = (invalid_points | invalid_segments | invalid_contours
+                      | invalid_multipoints | invalid_multisegments
+                      | invalid_polygons | invalid_multipolygons)
+invalid_geometries_with_validation_levels = strategies.tuples(
+        invalid_geometries, validation_levels
+)
+geometries_lists_with_workers_counts = strategies.tuples(
+        strategies.lists(geometries | invalid_geometries,
+                         max_size=10),
+        strategies.integers(1, 2)
+)
+invalid_workers_counts = strategies.integers(max_value=0)
@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from gon.base import (CoordinatesComplexity,
+                      Geometry,
+                      to_coordinates_complexity)
+from . import strategies
+
+
+@given(strategies.geometries)
+def test_basic(geometry: Geometry) -> None:
+    result = to_coordinates_complexity(geometry)
+
+    assert isinstance(result, CoordinatesComplexity)
+
+
+@given(strategies.geometries)
+def test_properties(geometry: Geometry) -> None:
+    result = to_coordinates_complexity(geometry)
+
+    assert 0 <= result.mean_bit_length <= result.max_bit_length
+    assert result.max_depth >= 0
+
+
+@given(strategies.geometries)
+def test_translation_neutral_element(geometry: Geometry) -> None:
+    assert (to_coordinates_complexity(geometry.translate(0, 0))
+            == to_coordinates_complexity(geometry))
@@ -0,0 +1,44 @@
+from typing import (List,
+                    Tuple)
+
+import pytest
+from hypothesis import given
+
+from gon.base import (Geometry,
+                      Violation,
+                      validate_all)
+from . import strategies
+
+
+@given(strategies.geometries_lists_with_workers_counts)
+def test_basic(geometries_with_workers_count: Tuple[List[Geometry], int]
+               ) -> None:
+    geometries, workers = geometries_with_workers_count
+
+    result = validate_all(geometries,
+                          workers=workers)
+
+    assert isinstance(result, list)
+    assert len(result) == len(geometries)
+    assert all(isinstance(element, list) for element in result)
+    assert all(isinstance(violation, Violation)
+               for element in result
+               for violation in element)
+
+
+@given(strategies.geometries_lists_with_workers_counts)
+def test_serial(geometries_with_workers_count: Tuple[List[Geometry], int]
+                ) -> None:
+    geometries, workers = geometries_with_workers_count
+
+    result = validate_all(geometries,
+                          workers=workers)
+
+    assert result == [geometry.violations() for geometry in geometries]
+
+
+@given(strategies.invalid_workers_counts)
+def test_invalid_workers_count(workers: int) -> None:
+    with pytest.raises(ValueError):
+        validate_all([],
+                     workers=workers)
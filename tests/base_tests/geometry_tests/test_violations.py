@@ -0,0 +1,76 @@
+import re
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from gon.base import (Geometry,
+                      ValidationLevel,
+                      Violation)
+from tests.utils import to_path_target
+from . import strategies
+
+
+@given(strategies.geometries_with_validation_levels)
+def test_basic(geometry_with_level: Tuple[Geometry, ValidationLevel]
+               ) -> None:
+    geometry, level = geometry_with_level
+
+    result = geometry.violations(level)
+
+    assert isinstance(result, list)
+    assert all(isinstance(element, Violation) for element in result)
+
+
+@given(strategies.geometries_with_validation_levels)
+def test_valid(geometry_with_level: Tuple[Geometry, ValidationLevel]
+               ) -> None:
+    geometry, level = geometry_with_level
+
+    result = geometry.violations(level)
+
+    assert result == []
+
+
+@given(strategies.invalid_geometries)
+def test_invalid(geometry: Geometry) -> None:
+    result = geometry.violations()
+
+    assert result
+    with pytest.raises(ValueError, match=re.escape(result[0].message)):
+        geometry.validate()
+
+
+@given(strategies.invalid_geometries)
+def test_paths(geometry: Geometry) -> None:
+    result = geometry.violations()
+
+    assert all(to_path_target(geometry, violation.path) is not None
+               for violation in result)
+
+
+@given(strategies.invalid_geometries_with_validation_levels)
+def test_levels(geometry_with_level: Tuple[Geometry, ValidationLevel]
+                ) -> None:
+    geometry, level = geometry_with_level
+
+    result = geometry.violations(level)
+
+    assert result == [violation
+                      for violation in geometry.violations()
+                      if violation.level <= level]
+    assert all(violation.level <= level for violation in result)
+
+
+@given(strategies.invalid_geometries_with_validation_levels)
+def test_validate(geometry_with_level: Tuple[Geometry, ValidationLevel]
+                  ) -> None:
+    geometry, level = geometry_with_level
+
+    result = geometry.violations(level)
+
+    if result:
+        with pytest.raises(ValueError):
+            geometry.validate(level)
+    else:
+        assert geometry.validate(level) is None
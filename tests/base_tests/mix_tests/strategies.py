@@ -129,6 +129,9 @@ invalid_mixes = (shaped_geometries.flatmap(shaped_to_invalid_mix)
 mixes_with_points = (coordinates_strategies
                      .flatmap(cleave_in_tuples(coordinates_to_mixes,
                                                coordinates_to_points)))
+mixes_with_multipoints = (coordinates_strategies
+                          .flatmap(cleave_in_tuples(coordinates_to_mixes,
+                                                    coordinates_to_multipoints)))
 mixes_strategies = coordinates_strategies.map(coordinates_to_mixes)
 
 
@@ -5,6 +5,7 @@ from hypothesis import given
 
 from gon.base import (EMPTY,
                       Mix,
+                      Multipoint,
                       Relation)
 from tests.utils import (equivalence,
                          implication,
@@ -25,6 +26,14 @@ def test_components(mix: Mix) -> None:
                for polygon in mix_to_polygons(mix))
 
 
+@given(strategies.mixes_with_multipoints)
+def test_multipoints_relations(mix_with_multipoint: Tuple[Mix, Multipoint]
+                               ) -> None:
+    mix, multipoint = mix_with_multipoint
+
+    assert mix.relate(multipoint) is multipoint.relate(mix).complement
+
+
 @given(strategies.mixes_pairs)
 def test_mixes_relations(mixes_pair: Tuple[Mix, Mix]) -> None:
     first, second = mixes_pair
@@ -1,8 +1,14 @@
+from hypothesis import strategies
+
 from tests.strategies import (coordinates_strategies,
+                              coordinates_to_boxes,
                               coordinates_to_multipoints,
                               coordinates_to_points,
-                              invalid_multipoints)
+                              coordinates_to_shaped_geometries,
+                              invalid_multipoints,
+                              to_non_negative_coordinates)
 from tests.utils import (cleave_in_tuples,
+                         shaped_to_shaped_with_grid_multipoint,
                          to_pairs,
                          to_triplets)
 
@@ -12,6 +18,23 @@ multipoints_with_points = (
     coordinates_strategies.flatmap(cleave_in_tuples(coordinates_to_multipoints,
                                                     coordinates_to_points))
 )
+multipoints_with_points_and_sizes = strategies.tuples(
+        multipoints_with_points, strategies.integers(1, 100)
+)
+multipoints_with_points_and_radii = (
+    coordinates_strategies.flatmap(cleave_in_tuples(
+            coordinates_to_multipoints, coordinates_to_points,
+            to_non_negative_coordinates
+    ))
+)
+multipoints_with_boxes = (
+    coordinates_strategies.flatmap(cleave_in_tuples(coordinates_to_multipoints,
+                                                    coordinates_to_boxes))
+)
 multipoints_strategies = coordinates_strategies.map(coordinates_to_multipoints)
 multipoints_pairs = multipoints_strategies.flatmap(to_pairs)
 multipoints_triplets = multipoints_strategies.flatmap(to_triplets)
+shaped_geometries_with_multipoints = (
+    coordinates_strategies.flatmap(coordinates_to_shaped_geometries)
+    .map(shaped_to_shaped_with_grid_multipoint)
+)
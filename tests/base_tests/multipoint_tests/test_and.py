@@ -0,0 +1,17 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Multipoint,
+                      Shaped)
+from . import strategies
+
+
+@given(strategies.shaped_geometries_with_multipoints)
+def test_shaped(shaped_with_multipoint: Tuple[Shaped, Multipoint]) -> None:
+    shaped, multipoint = shaped_with_multipoint
+
+    result = multipoint & shaped
+
+    assert (set(result.points if isinstance(result, Multipoint) else [])
+            == {point for point in multipoint.points if point in shaped})
@@ -0,0 +1,67 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Multipoint,
+                      Point)
+from . import strategies
+
+
+@given(strategies.multipoints_with_points_and_sizes)
+def test_basic(
+        multipoint_with_point_and_size: Tuple[Tuple[Multipoint, Point], int]
+) -> None:
+    (multipoint, point), size = multipoint_with_point_and_size
+
+    result = multipoint.nearest(point, size)
+
+    assert isinstance(result, list)
+    assert len(result) == min(size, len(multipoint.points))
+    assert all(multipoint.points[index] == candidate
+               for index, candidate in result)
+
+
+@given(strategies.multipoints_with_points_and_sizes)
+def test_order(
+        multipoint_with_point_and_size: Tuple[Tuple[Multipoint, Point], int]
+) -> None:
+    (multipoint, point), size = multipoint_with_point_and_size
+
+    result = multipoint.nearest(point, size)
+
+    distances = [candidate.distance_to(point) for _, candidate in result]
+    assert distances == sorted(distances)
+    assert all(index < next_index
+               for (index, _), (next_index, _), distance, next_distance
+               in zip(result, result[1:], distances, distances[1:])
+               if distance == next_distance)
+    assert all(distances[-1] <= candidate.distance_to(point)
+               for candidate in multipoint.points
+               if candidate not in {candidate for _, candidate in result})
+
+
+@given(strategies.multipoints_with_points)
+def test_connection_with_distance_to(
+        multipoint_with_point: Tuple[Multipoint, Point]
+) -> None:
+    multipoint, point = multipoint_with_point
+
+    result = multipoint.nearest(point)
+
+    _, nearest_point = result[0]
+    assert nearest_point.distance_to(point) == multipoint.distance_to(point)
+
+
+@given(strategies.multipoints_with_points_and_sizes)
+def test_indexing(
+        multipoint_with_point_and_size: Tuple[Tuple[Multipoint, Point], int]
+) -> None:
+    (multipoint, point), size = multipoint_with_point_and_size
+
+    before_indexing = multipoint.nearest(point, size)
+
+    multipoint.index()
+
+    after_indexing = multipoint.nearest(point, size)
+
+    assert before_indexing == after_indexing
@@ -0,0 +1,20 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Multipoint,
+                      Shaped)
+from . import strategies
+
+
+@given(strategies.shaped_geometries_with_multipoints)
+def test_indexing(shaped_with_multipoint: Tuple[Shaped, Multipoint]) -> None:
+    shaped, multipoint = shaped_with_multipoint
+
+    before_indexing = multipoint.relate(shaped)
+
+    shaped.index()
+
+    after_indexing = multipoint.relate(shaped)
+
+    assert before_indexing is after_indexing
@@ -0,0 +1,42 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Box,
+                      Multipoint)
+from . import strategies
+
+
+@given(strategies.multipoints_with_boxes)
+def test_basic(multipoint_with_box: Tuple[Multipoint, Box]) -> None:
+    multipoint, box = multipoint_with_box
+
+    result = multipoint.within_box(box)
+
+    assert isinstance(result, list)
+    assert all(multipoint.points[index] == point for index, point in result)
+
+
+@given(strategies.multipoints_with_boxes)
+def test_properties(multipoint_with_box: Tuple[Multipoint, Box]) -> None:
+    multipoint, box = multipoint_with_box
+
+    result = multipoint.within_box(box)
+
+    assert result == [(index, point)
+                      for index, point in enumerate(multipoint.points)
+                      if (box.min_x <= point.x <= box.max_x
+                          and box.min_y <= point.y <= box.max_y)]
+
+
+@given(strategies.multipoints_with_boxes)
+def test_indexing(multipoint_with_box: Tuple[Multipoint, Box]) -> None:
+    multipoint, box = multipoint_with_box
+
+    before_indexing = multipoint.within_box(box)
+
+    multipoint.index()
+
+    after_indexing = multipoint.within_box(box)
+
+    assert before_indexing == after_indexing
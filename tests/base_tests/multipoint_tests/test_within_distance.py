@@ -0,0 +1,49 @@
+from typing import Tuple
+
+from ground.hints import Scalar
+from hypothesis import given
+
+from gon.base import (Multipoint,
+                      Point)
+from . import strategies
+
+
+@given(strategies.multipoints_with_points_and_radii)
+def test_basic(
+        multipoint_with_point_and_radius: Tuple[Multipoint, Point, Scalar]
+) -> None:
+    multipoint, point, radius = multipoint_with_point_and_radius
+
+    result = multipoint.within_distance(point, radius)
+
+    assert isinstance(result, list)
+    assert all(multipoint.points[index] == candidate
+               for index, candidate in result)
+
+
+@given(strategies.multipoints_with_points_and_radii)
+def test_properties(
+        multipoint_with_point_and_radius: Tuple[Multipoint, Point, Scalar]
+) -> None:
+    multipoint, point, radius = multipoint_with_point_and_radius
+
+    result = multipoint.within_distance(point, radius)
+
+    assert result == [(index, candidate)
+                      for index, candidate in enumerate(multipoint.points)
+                      if candidate.distance_to(point) <= radius]
+
+
+@given(strategies.multipoints_with_points_and_radii)
+def test_indexing(
+        multipoint_with_point_and_radius: Tuple[Multipoint, Point, Scalar]
+) -> None:
+    multipoint, point, radius = multipoint_with_point_and_radius
+
+    before_indexing = multipoint.within_distance(point, radius)
+
+    multipoint.index()
+
+    after_indexing = multipoint.within_distance(point, radius)
+
+    assert before_indexing == after_indexing
@@ -1,9 +1,17 @@
+from hypothesis import strategies
+
 from tests.strategies import (coordinates_strategies,
+                              coordinates_to_boxes,
                               coordinates_to_multipolygons,
                               coordinates_to_points,
                               coordinates_to_polygons,
-                              invalid_multipolygons)
+                              float_safe_rational_coordinates,
+                              invalid_multipolygons,
+                              simplification_methods,
+                              to_non_negative_coordinates)
 from tests.utils import (cleave_in_tuples,
+                         is_box_non_degenerate,
+                         to_compound_with_bounding_box,
                          to_pairs,
                          to_triplets)
 
@@ -19,3 +27,30 @@ multipolygons_with_points = (
      .flatmap(cleave_in_tuples(coordinates_to_multipolygons,
                                coordinates_to_points)))
 )
+multipolygons_with_tolerances = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_multipolygons,
+                         to_non_negative_coordinates)
+)
+simplification_methods = simplification_methods
+multipolygons_with_boxes = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_multipolygons, coordinates_to_boxes)
+)
+samples_counts = strategies.integers(0, 100)
+rational_multipolygons_with_holes = coordinates_to_multipolygons(
+        float_safe_rational_coordinates,
+        min_holes_size=1
+)
+invalid_samples_counts = strategies.integers(max_value=-1)
+seeds = strategies.integers()
+multipolygons_with_non_degenerate_boxes = (
+        multipolygons_with_boxes
+        | multipolygons.map(to_compound_with_bounding_box)
+).filter(lambda geometry_with_box: is_box_non_degenerate(geometry_with_box[1]))
+grid_sizes = strategies.integers(1, 10)
+invalid_grid_sizes = strategies.integers(max_value=0)
+multipolygons_with_points_lists = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_multipolygons,
+                         lambda coordinates: strategies.lists(
+                                 coordinates_to_points(coordinates),
+                                 max_size=10))
+)
@@ -0,0 +1,37 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Box,
+                      Compound,
+                      Multipolygon)
+from tests.utils import box_to_polygon
+from . import strategies
+
+
+@given(strategies.multipolygons_with_boxes)
+def test_basic(multipolygon_with_box: Tuple[Multipolygon, Box]) -> None:
+    multipolygon, box = multipolygon_with_box
+
+    result = multipolygon.clip_by_box(box)
+
+    assert isinstance(result, Compound)
+
+
+@given(strategies.multipolygons_with_boxes)
+def test_validity(multipolygon_with_box: Tuple[Multipolygon, Box]) -> None:
+    multipolygon, box = multipolygon_with_box
+
+    result = multipolygon.clip_by_box(box)
+
+    result.validate()
+
+
+@given(strategies.multipolygons_with_boxes)
+def test_connection_with_intersection(
+        multipolygon_with_box: Tuple[Multipolygon, Box]) -> None:
+    multipolygon, box = multipolygon_with_box
+
+    result = multipolygon.clip_by_box(box)
+
+    assert result == multipolygon & box_to_polygon(box)
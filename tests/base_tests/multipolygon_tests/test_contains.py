@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple
 
 from hypothesis import given
@@ -30,3 +31,18 @@ def test_indexing(multipolygon_with_point: Tuple[Multipolygon, Point]) -> None:
     after_indexing = point in multipolygon
 
     assert equivalence(before_indexing, after_indexing)
+
+
+@given(strategies.multipolygons_with_points)
+def test_parallel_indexing(multipolygon_with_point: Tuple[Multipolygon, Point]
+                           ) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    before_indexing = point in multipolygon
+
+    with ProcessPoolExecutor(2) as executor:
+        multipolygon.index(executor)
+
+    after_indexing = point in multipolygon
+
+    assert equivalence(before_indexing, after_indexing)
@@ -0,0 +1,62 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from gon.base import (Location,
+                      Multipolygon,
+                      Point)
+from . import strategies
+
+
+@given(strategies.multipolygons_with_points)
+def test_basic(multipolygon_with_point: Tuple[Multipolygon, Point]) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    result = multipolygon.locate_component(point)
+
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    index, location = result
+    assert index is None or isinstance(index, int)
+    assert isinstance(location, Location)
+
+
+@given(strategies.multipolygons_with_points)
+def test_properties(multipolygon_with_point: Tuple[Multipolygon, Point]
+                    ) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    index, location = multipolygon.locate_component(point)
+
+    assert location is multipolygon.locate(point)
+    assert (index is None) is (location is Location.EXTERIOR)
+    assert (index is None
+            or multipolygon.polygons[index].locate(point) is location)
+    assert (index is None
+            or all(polygon.locate(point) is Location.EXTERIOR
+                   for polygon in multipolygon.polygons[:index]))
+
+
+@given(strategies.multipolygons_with_points)
+def test_indexing(multipolygon_with_point: Tuple[Multipolygon, Point]) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    before_indexing = multipolygon.locate_component(point)
+
+    multipolygon.index()
+
+    after_indexing = multipolygon.locate_component(point)
+
+    assert before_indexing == after_indexing
+
+
+@given(strategies.multipolygons_with_points_lists)
+def test_batch(multipolygon_with_points: Tuple[Multipolygon, List[Point]]
+               ) -> None:
+    multipolygon, points = multipolygon_with_points
+
+    result = multipolygon.locate_components(points)
+
+    assert result == [multipolygon.locate_component(point)
+                      for point in points]
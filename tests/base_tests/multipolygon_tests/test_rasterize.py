@@ -0,0 +1,69 @@
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from gon.base import (Box,
+                      Location,
+                      Multipolygon,
+                      Point)
+from tests.utils import (equivalence,
+                         runs_to_cells,
+                         to_grid_cells_boxes,
+                         to_rational_box,
+                         to_rational_multipolygon)
+from . import strategies
+
+
+@given(strategies.multipolygons_with_non_degenerate_boxes,
+       strategies.grid_sizes, strategies.grid_sizes)
+def test_basic(multipolygon_with_box: Tuple[Multipolygon, Box],
+               columns: int,
+               rows: int) -> None:
+    multipolygon, box = multipolygon_with_box
+
+    result = multipolygon.rasterize(box, columns, rows)
+
+    assert isinstance(result, list)
+    assert all(isinstance(element, tuple) and len(element) == 3
+               for element in result)
+    assert all(0 <= row < rows and 0 <= start < stop <= columns
+               for row, start, stop in result)
+    assert result == sorted(result)
+    assert all(previous_row < row or previous_stop < start
+               for (previous_row, _, previous_stop), (row, start, _)
+               in zip(result, result[1:]))
+
+
+@given(strategies.multipolygons_with_non_degenerate_boxes,
+       strategies.grid_sizes, strategies.grid_sizes)
+def test_properties(multipolygon_with_box: Tuple[Multipolygon, Box],
+                    columns: int,
+                    rows: int) -> None:
+    multipolygon, box = multipolygon_with_box
+    multipolygon, box = (to_rational_multipolygon(multipolygon),
+                         to_rational_box(box))
+
+    result = multipolygon.rasterize(box, columns, rows)
+
+    cells = runs_to_cells(result)
+    for cell, cell_box in to_grid_cells_boxes(box, columns, rows).items():
+        location = multipolygon.locate(
+                Point((cell_box.min_x + cell_box.max_x) / 2,
+                      (cell_box.min_y + cell_box.max_y) / 2)
+        )
+        assert (location is Location.BOUNDARY
+                or equivalence(cell in cells, location is Location.INTERIOR))
+
+
+@given(strategies.multipolygons_with_non_degenerate_boxes,
+       strategies.invalid_grid_sizes, strategies.grid_sizes)
+def test_invalid_sizes(multipolygon_with_box: Tuple[Multipolygon, Box],
+                       columns: int,
+                       rows: int) -> None:
+    multipolygon, box = multipolygon_with_box
+
+    with pytest.raises(ValueError):
+        multipolygon.rasterize(box, columns, rows)
+    with pytest.raises(ValueError):
+        multipolygon.rasterize(box, rows, columns)
@@ -0,0 +1,69 @@
+import pytest
+from hypothesis import given
+
+from gon.base import (Location,
+                      Multipolygon,
+                      Point)
+from tests.utils import (are_points_centered_at,
+                         is_point_in_box_approximately,
+                         to_rational_point)
+from . import strategies
+
+
+@given(strategies.multipolygons, strategies.samples_counts)
+def test_basic(multipolygon: Multipolygon, count: int) -> None:
+    result = multipolygon.sample(count)
+
+    assert isinstance(result, list)
+    assert len(result) == count
+    assert all(isinstance(element, Point) for element in result)
+
+
+@given(strategies.multipolygons, strategies.samples_counts)
+def test_properties(multipolygon: Multipolygon, count: int) -> None:
+    result = multipolygon.sample(count)
+
+    boxes = [multipolygon._context.polygon_box(polygon)
+             for polygon in multipolygon.polygons]
+    assert all(any(is_point_in_box_approximately(element, box)
+                   for box in boxes)
+               for element in result)
+
+
+@given(strategies.rational_multipolygons_with_holes,
+       strategies.samples_counts)
+def test_locations(multipolygon: Multipolygon, count: int) -> None:
+    result = multipolygon.sample(count)
+
+    assert all(multipolygon.locate(to_rational_point(element))
+               is not Location.EXTERIOR
+               for element in result)
+
+
+@given(strategies.rational_multipolygons_with_holes, strategies.seeds)
+def test_distribution(multipolygon: Multipolygon, seed: int) -> None:
+    result = multipolygon.sample(1000,
+                                 seed=seed)
+
+    assert are_points_centered_at(
+            result, multipolygon.centroid,
+            multipolygon._context.polygons_box(multipolygon.polygons)
+    )
+
+
+@given(strategies.multipolygons, strategies.samples_counts,
+       strategies.seeds)
+def test_reproducibility(multipolygon: Multipolygon,
+                         count: int,
+                         seed: int) -> None:
+    result = multipolygon.sample(count,
+                                 seed=seed)
+
+    assert result == multipolygon.sample(count,
+                                         seed=seed)
+
+
+@given(strategies.multipolygons, strategies.invalid_samples_counts)
+def test_invalid_count(multipolygon: Multipolygon, count: int) -> None:
+    with pytest.raises(ValueError):
+        multipolygon.sample(count)
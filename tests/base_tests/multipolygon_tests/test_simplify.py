@@ -0,0 +1,51 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Multipolygon,
+                      SimplificationMethod)
+from gon.hints import Scalar
+from tests.utils import compound_to_points
+from . import strategies
+
+
+@given(strategies.multipolygons_with_tolerances,
+       strategies.simplification_methods)
+def test_basic(multipolygon_with_tolerance: Tuple[Multipolygon, Scalar],
+               method: SimplificationMethod) -> None:
+    multipolygon, tolerance = multipolygon_with_tolerance
+
+    result = multipolygon.simplify(tolerance, method)
+
+    assert isinstance(result, Multipolygon)
+
+
+@given(strategies.multipolygons_with_tolerances,
+       strategies.simplification_methods)
+def test_validity(multipolygon_with_tolerance: Tuple[Multipolygon, Scalar],
+                  method: SimplificationMethod) -> None:
+    multipolygon, tolerance = multipolygon_with_tolerance
+
+    result = multipolygon.simplify(tolerance, method)
+
+    result.validate()
+
+
+@given(strategies.multipolygons_with_tolerances,
+       strategies.simplification_methods)
+def test_points_count(multipolygon_with_tolerance: Tuple[Multipolygon, Scalar],
+                      method: SimplificationMethod) -> None:
+    multipolygon, tolerance = multipolygon_with_tolerance
+
+    result = multipolygon.simplify(tolerance, method)
+
+    assert (len(list(compound_to_points(result)))
+            <= len(list(compound_to_points(multipolygon))))
+
+
+@given(strategies.multipolygons, strategies.simplification_methods)
+def test_idempotence(multipolygon: Multipolygon,
+                     method: SimplificationMethod) -> None:
+    result = multipolygon.simplify(0, method)
+
+    assert result.simplify(0, method) == result
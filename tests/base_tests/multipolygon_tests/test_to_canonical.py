@@ -0,0 +1,44 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import Multipolygon
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.multipolygons)
+def test_basic(multipolygon: Multipolygon) -> None:
+    assert isinstance(multipolygon.to_canonical(), Multipolygon)
+
+
+@given(strategies.multipolygons)
+def test_properties(multipolygon: Multipolygon) -> None:
+    result = multipolygon.to_canonical()
+
+    assert result == multipolygon
+    assert all(polygon.to_canonical() is polygon
+               for polygon in result.polygons)
+
+
+@given(strategies.multipolygons)
+def test_idempotence(multipolygon: Multipolygon) -> None:
+    result = multipolygon.to_canonical()
+
+    assert result.to_canonical() is result
+
+
+@given(strategies.multipolygons)
+def test_validity(multipolygon: Multipolygon) -> None:
+    result = multipolygon.to_canonical()
+
+    result.validate()
+
+
+@given(strategies.multipolygons_pairs)
+def test_connection_with_eq(multipolygons_pair: Tuple[Multipolygon,
+                                                      Multipolygon]) -> None:
+    first, second = multipolygons_pair
+
+    assert equivalence(first.to_canonical() == second.to_canonical(),
+                       first == second)
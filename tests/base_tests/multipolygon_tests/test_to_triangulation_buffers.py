@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from gon.base import Multipolygon
+from tests.utils import (to_buffers_triangles,
+                         to_float_triangles)
+from . import strategies
+
+
+@given(strategies.multipolygons)
+def test_basic(multipolygon: Multipolygon) -> None:
+    result = multipolygon.to_triangulation_buffers()
+
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    assert all(isinstance(element, memoryview) and element.readonly
+               for element in result)
+
+
+@given(strategies.multipolygons)
+def test_triangulation(multipolygon: Multipolygon) -> None:
+    coordinates, indices = multipolygon.to_triangulation_buffers()
+
+    assert (to_buffers_triangles(coordinates, indices)
+            == to_float_triangles([triangle
+                                   for triangulation
+                                   in multipolygon.triangulate()
+                                   for triangle in triangulation.triangles()]))
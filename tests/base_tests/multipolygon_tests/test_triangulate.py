@@ -0,0 +1,28 @@
+from functools import reduce
+from operator import or_
+
+from hypothesis import given
+
+from gon.base import (Multipolygon,
+                      Polygon,
+                      Triangulation)
+from . import strategies
+
+
+@given(strategies.multipolygons)
+def test_basic(multipolygon: Multipolygon) -> None:
+    result = multipolygon.triangulate()
+
+    assert isinstance(result, list)
+    assert len(result) == len(multipolygon.polygons)
+    assert all(isinstance(element, Triangulation) for element in result)
+
+
+@given(strategies.multipolygons)
+def test_round_trip(multipolygon: Multipolygon) -> None:
+    result = multipolygon.triangulate()
+
+    assert (reduce(or_, [Polygon(contour)
+                         for triangulation in result
+                         for contour in triangulation.triangles()])
+            == multipolygon)
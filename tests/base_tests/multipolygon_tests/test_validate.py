@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from hypothesis import given
 
@@ -12,7 +14,23 @@ def test_basic(multipolygon: Multipolygon) -> None:
     assert result is None
 
 
+@given(strategies.multipolygons)
+def test_parallel(multipolygon: Multipolygon) -> None:
+    with ProcessPoolExecutor(2) as executor:
+        result = multipolygon.validate(executor=executor)
+
+    assert result is None
+
+
 @given(strategies.invalid_multipolygons)
 def test_invalid_multipolygon(multipolygon: Multipolygon) -> None:
     with pytest.raises(ValueError):
         multipolygon.validate()
+
+
+@given(strategies.invalid_multipolygons)
+def test_parallel_invalid_multipolygon(multipolygon: Multipolygon) -> None:
+    with ProcessPoolExecutor(2) as executor:
+        result = multipolygon.violations(executor=executor)
+
+    assert result == multipolygon.violations()
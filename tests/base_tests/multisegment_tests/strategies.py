@@ -1,9 +1,16 @@
+from hypothesis import strategies
+
 from tests.strategies import (coordinates_strategies,
+                              coordinates_to_boxes,
                               coordinates_to_multisegments,
                               coordinates_to_points,
                               coordinates_to_segments,
-                              invalid_multisegments)
+                              invalid_multisegments,
+                              simplification_methods,
+                              to_non_negative_coordinates)
 from tests.utils import (cleave_in_tuples,
+                         is_box_non_degenerate,
+                         to_compound_with_bounding_box,
                          to_pairs,
                          to_triplets)
 
@@ -19,3 +26,17 @@ multisegments_with_points = (
 )
 multisegments_pairs = multisegments_strategies.flatmap(to_pairs)
 multisegments_triplets = multisegments_strategies.flatmap(to_triplets)
+multisegments_with_tolerances = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_multisegments,
+                         to_non_negative_coordinates)
+)
+simplification_methods = simplification_methods
+multisegments_with_boxes = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_multisegments, coordinates_to_boxes)
+)
+multisegments_with_non_degenerate_boxes = (
+        multisegments_with_boxes
+        | multisegments.map(to_compound_with_bounding_box)
+).filter(lambda geometry_with_box: is_box_non_degenerate(geometry_with_box[1]))
+grid_sizes = strategies.integers(1, 10)
+invalid_grid_sizes = strategies.integers(max_value=0)
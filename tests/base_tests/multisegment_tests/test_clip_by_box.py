@@ -0,0 +1,37 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Box,
+                      Compound,
+                      Multisegment)
+from tests.utils import box_to_polygon
+from . import strategies
+
+
+@given(strategies.multisegments_with_boxes)
+def test_basic(multisegment_with_box: Tuple[Multisegment, Box]) -> None:
+    multisegment, box = multisegment_with_box
+
+    result = multisegment.clip_by_box(box)
+
+    assert isinstance(result, Compound)
+
+
+@given(strategies.multisegments_with_boxes)
+def test_validity(multisegment_with_box: Tuple[Multisegment, Box]) -> None:
+    multisegment, box = multisegment_with_box
+
+    result = multisegment.clip_by_box(box)
+
+    result.validate()
+
+
+@given(strategies.multisegments_with_boxes)
+def test_connection_with_intersection(
+        multisegment_with_box: Tuple[Multisegment, Box]) -> None:
+    multisegment, box = multisegment_with_box
+
+    result = multisegment.clip_by_box(box)
+
+    assert result == multisegment & box_to_polygon(box)
@@ -0,0 +1,54 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Multisegment,
+                      Segment,
+                      SimplificationMethod)
+from gon.hints import Scalar
+from tests.utils import compound_to_points
+from . import strategies
+
+
+@given(strategies.multisegments_with_tolerances,
+       strategies.simplification_methods)
+def test_basic(multisegment_with_tolerance: Tuple[Multisegment, Scalar],
+               method: SimplificationMethod) -> None:
+    multisegment, tolerance = multisegment_with_tolerance
+
+    result = multisegment.simplify(tolerance, method)
+
+    assert isinstance(result, (Multisegment, Segment))
+
+
+@given(strategies.multisegments_with_tolerances,
+       strategies.simplification_methods)
+def test_validity(multisegment_with_tolerance: Tuple[Multisegment, Scalar],
+                  method: SimplificationMethod) -> None:
+    multisegment, tolerance = multisegment_with_tolerance
+
+    result = multisegment.simplify(tolerance, method)
+
+    result.validate()
+
+
+@given(strategies.multisegments_with_tolerances,
+       strategies.simplification_methods)
+def test_points_count(multisegment_with_tolerance: Tuple[Multisegment, Scalar],
+                      method: SimplificationMethod) -> None:
+    multisegment, tolerance = multisegment_with_tolerance
+
+    result = multisegment.simplify(tolerance, method)
+
+    assert (len(list(compound_to_points(result)))
+            <= len(list(compound_to_points(multisegment))))
+
+
+@given(strategies.multisegments, strategies.simplification_methods)
+def test_idempotence(multisegment: Multisegment,
+                     method: SimplificationMethod) -> None:
+    result = multisegment.simplify(0, method)
+
+    assert (result.simplify(0, method) == result
+            if isinstance(result, Multisegment)
+            else isinstance(result, Segment))
@@ -1,16 +1,124 @@
+from functools import partial
+from typing import List
+
+from hypothesis import strategies
+
+from gon.base import (Contour,
+                      Geometry,
+                      Point,
+                      Polygon)
+from gon.hints import Scalar
 from tests.strategies import (coordinates_strategies,
+                              coordinates_to_boxes,
+                              coordinates_to_contours,
+                              coordinates_to_convex_polygons,
                               coordinates_to_points,
                               coordinates_to_polygons,
-                              invalid_polygons)
-from tests.utils import (cleave_in_tuples,
+                              coordinates_to_segments,
+                              float_safe_rational_coordinates,
+                              invalid_polygons,
+                              simplification_methods,
+                              to_non_negative_coordinates)
+from tests.utils import (Strategy,
+                         cleave_in_tuples,
+                         divide_by_int,
+                         is_box_non_degenerate,
+                         sub_lists,
+                         to_compound_with_bounding_box,
                          to_pairs,
                          to_triplets)
 
 polygons = coordinates_strategies.flatmap(coordinates_to_polygons)
 invalid_polygons = invalid_polygons
+
+
+def to_polygons_with_medial_triangles_holes(polygon: Polygon
+                                            ) -> Strategy[Polygon]:
+    return (sub_lists([to_medial_triangle(triangle)
+                       for triangle in polygon.triangulate().triangles()],
+                      min_size=1)
+            .map(partial(to_polygon_with_extra_holes, polygon)))
+
+
+def to_medial_triangle(triangle: Contour) -> Contour:
+    vertices = triangle.vertices
+    return Contour([Point(divide_by_int(vertices[index - 1].x
+                                        + vertices[index].x, 2),
+                          divide_by_int(vertices[index - 1].y
+                                        + vertices[index].y, 2))
+                    for index in range(len(vertices))])
+
+
+def to_polygon_with_extra_holes(polygon: Polygon,
+                                holes: List[Contour]) -> Polygon:
+    return Polygon(polygon.border, [*polygon.holes, *holes])
+
+
+polygons_with_medial_triangles_holes = polygons.flatmap(
+        to_polygons_with_medial_triangles_holes
+)
+
+
+def to_polygons_with_holes_rings(polygon: Polygon) -> Strategy[Polygon]:
+    return (strategies.sampled_from(polygon.triangulate().triangles())
+            .map(to_medial_triangle)
+            .map(to_medial_triangle)
+            .map(to_corner_triangles)
+            .map(partial(to_polygon_with_extra_holes, polygon)))
+
+
+def to_corner_triangles(triangle: Contour) -> List[Contour]:
+    vertices, medial_vertices = (triangle.vertices,
+                                 to_medial_triangle(triangle).vertices)
+    return [Contour([vertices[index - 1], medial_vertices[index - 1],
+                     medial_vertices[index]])
+            for index in range(len(vertices))]
+
+
+polygons_with_holes_rings = polygons.flatmap(to_polygons_with_holes_rings)
 polygons_strategies = coordinates_strategies.map(coordinates_to_polygons)
 polygons_pairs = polygons_strategies.flatmap(to_pairs)
+convex_polygons_with_points = (
+    coordinates_strategies.flatmap(
+            cleave_in_tuples(coordinates_to_convex_polygons,
+                             coordinates_to_points))
+)
+convex_polygons_pairs = (coordinates_strategies
+                         .map(coordinates_to_convex_polygons)
+                         .flatmap(to_pairs))
 polygons_triplets = polygons_strategies.flatmap(to_triplets)
 polygons_with_points = (coordinates_strategies
                         .flatmap(cleave_in_tuples(coordinates_to_polygons,
                                                   coordinates_to_points)))
+
+
+def coordinates_to_non_polygons(coordinates: Strategy[Scalar]
+                                ) -> Strategy[Geometry]:
+    return (coordinates_to_points(coordinates)
+            | coordinates_to_segments(coordinates)
+            | coordinates_to_contours(coordinates))
+
+
+polygons_with_non_polygons = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_polygons, coordinates_to_non_polygons)
+)
+polygons_with_tolerances = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_polygons, to_non_negative_coordinates)
+)
+simplification_methods = simplification_methods
+polygons_with_boxes = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_polygons, coordinates_to_boxes)
+)
+samples_counts = strategies.integers(0, 100)
+rational_polygons_with_holes = coordinates_to_polygons(
+        float_safe_rational_coordinates,
+        min_holes_size=1
+)
+invalid_samples_counts = strategies.integers(max_value=-1)
+seeds = strategies.integers()
+polygons_with_non_degenerate_boxes = (
+        polygons_with_boxes
+        | polygons.map(to_compound_with_bounding_box)
+).filter(lambda geometry_with_box: is_box_non_degenerate(geometry_with_box[1]))
+grid_sizes = strategies.integers(1, 10)
+invalid_grid_sizes = strategies.integers(max_value=0)
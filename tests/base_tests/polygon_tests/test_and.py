@@ -0,0 +1,35 @@
+from typing import Tuple
+
+from clipping.planar import complete_intersect_regions
+from hypothesis import given
+
+from gon.base import (Compound,
+                      Polygon)
+from . import strategies
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_basic(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    result = first & second
+
+    assert isinstance(result, Compound)
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_commutativity(polygons_pair: Tuple[Polygon, Polygon]
+                              ) -> None:
+    first, second = polygons_pair
+
+    assert first & second == second & first
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_connection_with_regions_intersection(
+        polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    result = first & second
+
+    assert result == complete_intersect_regions(first.border, second.border)
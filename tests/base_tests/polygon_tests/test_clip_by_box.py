@@ -0,0 +1,37 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Box,
+                      Compound,
+                      Polygon)
+from tests.utils import box_to_polygon
+from . import strategies
+
+
+@given(strategies.polygons_with_boxes)
+def test_basic(polygon_with_box: Tuple[Polygon, Box]) -> None:
+    polygon, box = polygon_with_box
+
+    result = polygon.clip_by_box(box)
+
+    assert isinstance(result, Compound)
+
+
+@given(strategies.polygons_with_boxes)
+def test_validity(polygon_with_box: Tuple[Polygon, Box]) -> None:
+    polygon, box = polygon_with_box
+
+    result = polygon.clip_by_box(box)
+
+    result.validate()
+
+
+@given(strategies.polygons_with_boxes)
+def test_connection_with_intersection(polygon_with_box: Tuple[Polygon, Box]
+                                      ) -> None:
+    polygon, box = polygon_with_box
+
+    result = polygon.clip_by_box(box)
+
+    assert result == polygon & box_to_polygon(box)
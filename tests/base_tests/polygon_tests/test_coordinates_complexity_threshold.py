@@ -0,0 +1,42 @@
+import warnings
+
+from hypothesis import given
+
+from gon.base import (CoordinatesComplexityWarning,
+                      Polygon,
+                      set_coordinates_complexity_threshold,
+                      to_coordinates_complexity)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_not_exceeded(polygon: Polygon) -> None:
+    complexity = to_coordinates_complexity(polygon)
+
+    set_coordinates_complexity_threshold(complexity.max_bit_length,
+                                         complexity.max_depth)
+    try:
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            polygon & polygon
+    finally:
+        set_coordinates_complexity_threshold()
+
+    assert not any(issubclass(record.category, CoordinatesComplexityWarning)
+                   for record in records)
+
+
+@given(strategies.polygons)
+def test_exceeded(polygon: Polygon) -> None:
+    complexity = to_coordinates_complexity(polygon)
+
+    set_coordinates_complexity_threshold(complexity.max_bit_length - 1)
+    try:
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            polygon & polygon
+    finally:
+        set_coordinates_complexity_threshold()
+
+    assert any(issubclass(record.category, CoordinatesComplexityWarning)
+               for record in records)
@@ -0,0 +1,33 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Polygon,
+                      Relation)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_basic(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    result = first.disjoint(second)
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_symmetry(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    assert first.disjoint(second) is second.disjoint(first)
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_connection_with_relate(polygons_pair: Tuple[Polygon, Polygon]
+                                       ) -> None:
+    first, second = polygons_pair
+
+    assert equivalence(first.disjoint(second),
+                       first.relate(second) is Relation.DISJOINT)
@@ -0,0 +1,34 @@
+from typing import Tuple
+
+from hypothesis import given
+from orient.planar import point_in_polygon
+
+from gon.base import (Location,
+                      Point,
+                      Polygon)
+from . import strategies
+
+
+@given(strategies.polygons_with_points)
+def test_basic(polygon_with_point: Tuple[Polygon, Point]) -> None:
+    polygon, point = polygon_with_point
+
+    result = polygon.locate(point)
+
+    assert isinstance(result, Location)
+
+
+@given(strategies.polygons)
+def test_vertices(polygon: Polygon) -> None:
+    assert all(polygon.locate(vertex) is Location.BOUNDARY
+               for vertex in polygon.border.vertices)
+
+
+@given(strategies.convex_polygons_with_points)
+def test_convex_connection_with_point_in_polygon(
+        polygon_with_point: Tuple[Polygon, Point]) -> None:
+    polygon, point = polygon_with_point
+
+    result = polygon.locate(point)
+
+    assert result is point_in_polygon(point, polygon)
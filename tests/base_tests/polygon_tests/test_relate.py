@@ -0,0 +1,34 @@
+from typing import Tuple
+
+from hypothesis import given
+from orient.planar import region_in_region
+
+from gon.base import (Polygon,
+                      Relation)
+from . import strategies
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_basic(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    result = first.relate(second)
+
+    assert isinstance(result, Relation)
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_complement(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    assert first.relate(second).complement is second.relate(first)
+
+
+@given(strategies.convex_polygons_pairs)
+def test_convex_connection_with_region_in_region(
+        polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    result = first.relate(second)
+
+    assert result is region_in_region(second.border, first.border)
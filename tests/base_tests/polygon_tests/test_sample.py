@@ -0,0 +1,61 @@
+import pytest
+from hypothesis import given
+
+from gon.base import (Location,
+                      Point,
+                      Polygon)
+from tests.utils import (are_points_centered_at,
+                         is_point_in_box_approximately,
+                         to_rational_point)
+from . import strategies
+
+
+@given(strategies.polygons, strategies.samples_counts)
+def test_basic(polygon: Polygon, count: int) -> None:
+    result = polygon.sample(count)
+
+    assert isinstance(result, list)
+    assert len(result) == count
+    assert all(isinstance(element, Point) for element in result)
+
+
+@given(strategies.polygons, strategies.samples_counts)
+def test_properties(polygon: Polygon, count: int) -> None:
+    result = polygon.sample(count)
+
+    box = polygon._context.polygon_box(polygon)
+    assert all(is_point_in_box_approximately(element, box)
+               for element in result)
+
+
+@given(strategies.rational_polygons_with_holes, strategies.samples_counts)
+def test_locations(polygon: Polygon, count: int) -> None:
+    result = polygon.sample(count)
+
+    assert all(polygon.locate(to_rational_point(element))
+               is not Location.EXTERIOR
+               for element in result)
+
+
+@given(strategies.rational_polygons_with_holes, strategies.seeds)
+def test_distribution(polygon: Polygon, seed: int) -> None:
+    result = polygon.sample(1000,
+                            seed=seed)
+
+    assert are_points_centered_at(result, polygon.centroid,
+                                  polygon._context.polygon_box(polygon))
+
+
+@given(strategies.polygons, strategies.samples_counts, strategies.seeds)
+def test_reproducibility(polygon: Polygon, count: int, seed: int) -> None:
+    result = polygon.sample(count,
+                            seed=seed)
+
+    assert result == polygon.sample(count,
+                                    seed=seed)
+
+
+@given(strategies.polygons, strategies.invalid_samples_counts)
+def test_invalid_count(polygon: Polygon, count: int) -> None:
+    with pytest.raises(ValueError):
+        polygon.sample(count)
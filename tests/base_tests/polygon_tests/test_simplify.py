@@ -0,0 +1,47 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Polygon,
+                      SimplificationMethod)
+from gon.hints import Scalar
+from tests.utils import compound_to_points
+from . import strategies
+
+
+@given(strategies.polygons_with_tolerances, strategies.simplification_methods)
+def test_basic(polygon_with_tolerance: Tuple[Polygon, Scalar],
+               method: SimplificationMethod) -> None:
+    polygon, tolerance = polygon_with_tolerance
+
+    result = polygon.simplify(tolerance, method)
+
+    assert isinstance(result, Polygon)
+
+
+@given(strategies.polygons_with_tolerances, strategies.simplification_methods)
+def test_validity(polygon_with_tolerance: Tuple[Polygon, Scalar],
+                  method: SimplificationMethod) -> None:
+    polygon, tolerance = polygon_with_tolerance
+
+    result = polygon.simplify(tolerance, method)
+
+    result.validate()
+
+
+@given(strategies.polygons_with_tolerances, strategies.simplification_methods)
+def test_points_count(polygon_with_tolerance: Tuple[Polygon, Scalar],
+                      method: SimplificationMethod) -> None:
+    polygon, tolerance = polygon_with_tolerance
+
+    result = polygon.simplify(tolerance, method)
+
+    assert (len(list(compound_to_points(result)))
+            <= len(list(compound_to_points(polygon))))
+
+
+@given(strategies.polygons, strategies.simplification_methods)
+def test_idempotence(polygon: Polygon, method: SimplificationMethod) -> None:
+    result = polygon.simplify(0, method)
+
+    assert result.simplify(0, method) == result
@@ -0,0 +1,51 @@
+from itertools import combinations
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Polygon,
+                      Relation,
+                      SimplificationMethod,
+                      simplify_coverage)
+from gon.hints import Scalar
+from . import strategies
+
+
+@given(strategies.polygons_with_tolerances, strategies.simplification_methods)
+def test_basic(polygon_with_tolerance: Tuple[Polygon, Scalar],
+               method: SimplificationMethod) -> None:
+    polygon, tolerance = polygon_with_tolerance
+    coverage = [Polygon(contour)
+                for contour in polygon.triangulate().triangles()]
+
+    result = simplify_coverage(coverage, tolerance, method)
+
+    assert isinstance(result, list)
+    assert len(result) == len(coverage)
+    assert all(isinstance(element, Polygon) for element in result)
+
+
+@given(strategies.polygons_with_tolerances, strategies.simplification_methods)
+def test_validity(polygon_with_tolerance: Tuple[Polygon, Scalar],
+                  method: SimplificationMethod) -> None:
+    polygon, tolerance = polygon_with_tolerance
+    coverage = [Polygon(contour)
+                for contour in polygon.triangulate().triangles()]
+
+    result = simplify_coverage(coverage, tolerance, method)
+
+    for element in result:
+        element.validate()
+    assert all(first.relate(second) in (Relation.DISJOINT, Relation.TOUCH)
+               for first, second in combinations(result, 2))
+
+
+@given(strategies.polygons, strategies.simplification_methods)
+def test_zero_tolerance(polygon: Polygon,
+                        method: SimplificationMethod) -> None:
+    coverage = [Polygon(contour)
+                for contour in polygon.triangulate().triangles()]
+
+    result = simplify_coverage(coverage, 0, method)
+
+    assert result == coverage
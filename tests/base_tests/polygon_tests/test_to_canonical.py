@@ -0,0 +1,57 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Geometry,
+                      Polygon)
+from tests.utils import equivalence
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: Polygon) -> None:
+    assert isinstance(polygon.to_canonical(), Polygon)
+
+
+@given(strategies.polygons)
+def test_properties(polygon: Polygon) -> None:
+    result = polygon.to_canonical()
+
+    assert result == polygon
+    assert result.border.vertices == polygon.border.to_canonical().vertices
+    assert result.holes == sorted([hole.to_canonical()
+                                   for hole in polygon.holes],
+                                  key=lambda hole: hole.vertices)
+
+
+@given(strategies.polygons)
+def test_idempotence(polygon: Polygon) -> None:
+    result = polygon.to_canonical()
+
+    assert result.to_canonical() is result
+
+
+@given(strategies.polygons)
+def test_validity(polygon: Polygon) -> None:
+    result = polygon.to_canonical()
+
+    result.validate()
+
+
+@given(strategies.polygons_pairs)
+def test_connection_with_eq(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    first, second = polygons_pair
+
+    assert equivalence(first.to_canonical() == second.to_canonical(),
+                       first == second)
+
+
+@given(strategies.polygons_with_non_polygons)
+def test_eq_with_non_polygons(polygon_with_geometry: Tuple[Polygon, Geometry]
+                              ) -> None:
+    polygon, geometry = polygon_with_geometry
+
+    result = polygon.to_canonical()
+
+    assert result != geometry
+    assert geometry != result
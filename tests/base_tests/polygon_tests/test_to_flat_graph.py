@@ -0,0 +1,52 @@
+from typing import Tuple
+
+from hypothesis import given
+from sect.core.trapezoidal.leaf import Leaf
+from sect.core.trapezoidal.x_node import XNode
+from sect.core.trapezoidal.y_node import YNode
+from sect.decomposition import Graph
+
+from gon.base import (Point,
+                      Polygon)
+from gon.core.locating import (locate_point_in_flat_graph,
+                               to_flat_graph)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_trapezoidal_map_nodes(polygon: Polygon) -> None:
+    nodes = [Graph.from_polygon(polygon,
+                                context=polygon._context).root]
+    visited_ids = set()
+    while nodes:
+        node = nodes.pop()
+        if id(node) in visited_ids:
+            continue
+        visited_ids.add(id(node))
+        if isinstance(node, Leaf):
+            assert isinstance(node.trapezoid.component, bool)
+        elif isinstance(node, XNode):
+            assert isinstance(node.point, Point)
+            nodes.extend((node.left, node.right))
+        else:
+            assert isinstance(node, YNode)
+            assert isinstance(node.edge.left, Point)
+            assert isinstance(node.edge.right, Point)
+            nodes.extend((node.below, node.above))
+
+
+@given(strategies.polygons_with_points)
+def test_locating(polygon_with_point: Tuple[Polygon, Point]) -> None:
+    polygon, point = polygon_with_point
+
+    result = to_flat_graph(polygon)
+
+    vertices = [*polygon.border.vertices,
+                *[vertex for hole in polygon.holes for vertex in hole.vertices]]
+    assert all(locate_point_in_flat_graph(result, vertices, vertex,
+                                          polygon._context)
+               is polygon.locate(vertex)
+               for vertex in vertices)
+    assert (locate_point_in_flat_graph(result, vertices, point,
+                                       polygon._context)
+            is polygon.locate(point))
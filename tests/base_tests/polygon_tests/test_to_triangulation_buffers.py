@@ -0,0 +1,45 @@
+from hypothesis import given
+
+from gon.base import Polygon
+from tests.utils import (to_buffers_triangles,
+                         to_float_triangles)
+from . import strategies
+
+
+@given(strategies.polygons)
+def test_basic(polygon: Polygon) -> None:
+    result = polygon.to_triangulation_buffers()
+
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    assert all(isinstance(element, memoryview) and element.readonly
+               for element in result)
+
+
+@given(strategies.polygons)
+def test_properties(polygon: Polygon) -> None:
+    coordinates, indices = polygon.to_triangulation_buffers()
+
+    assert len(coordinates) == 2 * (len(polygon.border.vertices)
+                                    + sum(len(hole.vertices)
+                                          for hole in polygon.holes))
+    assert len(indices) % 3 == 0
+    assert all(0 <= index < len(coordinates) // 2 for index in indices)
+
+
+@given(strategies.polygons)
+def test_triangulation(polygon: Polygon) -> None:
+    coordinates, indices = polygon.to_triangulation_buffers()
+
+    assert (to_buffers_triangles(coordinates, indices)
+            == to_float_triangles(polygon.triangulate().triangles()))
+
+
+@given(strategies.polygons)
+def test_independence(polygon: Polygon) -> None:
+    triangulation = polygon.triangulate()
+    triangulation.delete(triangulation.left_side)
+
+    _, indices = polygon.to_triangulation_buffers()
+
+    assert len(indices) == 3 * len(polygon.triangulate().triangles())
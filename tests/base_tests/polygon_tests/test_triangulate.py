@@ -21,3 +21,12 @@ def test_round_trip(polygon: Polygon) -> None:
 
     assert (reduce(or_, [Polygon(contour) for contour in result.triangles()])
             == polygon)
+
+
+@given(strategies.polygons)
+def test_independence(polygon: Polygon) -> None:
+    result = polygon.triangulate()
+
+    triangles = result.triangles()
+    result.delete(result.left_side)
+    assert polygon.triangulate().triangles() == triangles
@@ -2,6 +2,9 @@ import pytest
 from hypothesis import given
 
 from gon.base import Polygon
+from tests.utils import (equivalence,
+                         is_polygon_equal_to_border_minus_holes,
+                         is_polygon_valid)
 from . import strategies
 
 
@@ -12,6 +15,13 @@ def test_basic(polygon: Polygon) -> None:
     assert result is None
 
 
+@given(strategies.polygons_with_medial_triangles_holes
+       | strategies.polygons_with_holes_rings)
+def test_holes_connectivity(polygon: Polygon) -> None:
+    assert equivalence(is_polygon_valid(polygon),
+                       is_polygon_equal_to_border_minus_holes(polygon))
+
+
 @given(strategies.invalid_polygons)
 def test_invalid_polygon(polygon: Polygon) -> None:
     with pytest.raises(ValueError):
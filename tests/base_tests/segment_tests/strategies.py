@@ -1,4 +1,5 @@
 from tests.strategies import (coordinates_strategies,
+                              coordinates_to_boxes,
                               coordinates_to_points,
                               coordinates_to_segments,
                               invalid_segments)
@@ -14,3 +15,6 @@ segments_with_points = (coordinates_strategies
                                                   coordinates_to_points)))
 segments_pairs = segments_strategies.flatmap(to_pairs)
 segments_triplets = segments_strategies.flatmap(to_triplets)
+segments_with_boxes = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_segments, coordinates_to_boxes)
+)
@@ -0,0 +1,37 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Box,
+                      Compound,
+                      Segment)
+from tests.utils import box_to_polygon
+from . import strategies
+
+
+@given(strategies.segments_with_boxes)
+def test_basic(segment_with_box: Tuple[Segment, Box]) -> None:
+    segment, box = segment_with_box
+
+    result = segment.clip_by_box(box)
+
+    assert isinstance(result, Compound)
+
+
+@given(strategies.segments_with_boxes)
+def test_validity(segment_with_box: Tuple[Segment, Box]) -> None:
+    segment, box = segment_with_box
+
+    result = segment.clip_by_box(box)
+
+    result.validate()
+
+
+@given(strategies.segments_with_boxes)
+def test_connection_with_intersection(segment_with_box: Tuple[Segment, Box]
+                                      ) -> None:
+    segment, box = segment_with_box
+
+    result = segment.clip_by_box(box)
+
+    assert result == segment & box_to_polygon(box)
@@ -33,3 +33,17 @@ shaped_geometries_points_with_angles = strategies.tuples(
                                    coordinates_to_points))),
         angles
 )
+shaped_geometries_pairs = coordinates_strategies.flatmap(
+        cleave_in_tuples(coordinates_to_shaped_geometries,
+                         coordinates_to_shaped_geometries)
+)
+shaped_geometries_lists_pairs = coordinates_strategies.flatmap(
+        cleave_in_tuples(
+                lambda coordinates: strategies.lists(
+                        coordinates_to_shaped_geometries(coordinates),
+                        max_size=4),
+                lambda coordinates: strategies.lists(
+                        coordinates_to_shaped_geometries(coordinates),
+                        max_size=4)
+        )
+)
@@ -0,0 +1,60 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Mix,
+                      Shaped,
+                      intersection_area)
+from tests.utils import is_scalar
+from . import strategies
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_basic(shaped_geometries_pair: Tuple[Shaped, Shaped]) -> None:
+    first, second = shaped_geometries_pair
+
+    result = intersection_area(first, second)
+
+    assert is_scalar(result)
+
+
+@given(strategies.shaped_geometries)
+def test_self(shaped: Shaped) -> None:
+    result = intersection_area(shaped, shaped)
+
+    assert result == shaped.area
+    assert type(result) is type(shaped.area)
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_value(shaped_geometries_pair: Tuple[Shaped, Shaped]) -> None:
+    first, second = shaped_geometries_pair
+
+    result = intersection_area(first, second)
+
+    assert 0 <= result <= min(first.area, second.area)
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_commutativity(shaped_geometries_pair: Tuple[Shaped, Shaped]
+                       ) -> None:
+    first, second = shaped_geometries_pair
+
+    result = intersection_area(first, second)
+
+    assert result == intersection_area(second, first)
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_connection_with_intersection(shaped_geometries_pair
+                                      : Tuple[Shaped, Shaped]) -> None:
+    first, second = shaped_geometries_pair
+
+    result = intersection_area(first, second)
+
+    intersection = first & second
+    if isinstance(intersection, Mix):
+        intersection = intersection.shaped
+    assert result == (intersection.area
+                      if isinstance(intersection, Shaped)
+                      else 0)
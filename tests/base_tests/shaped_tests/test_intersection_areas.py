@@ -0,0 +1,35 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from gon.base import (Shaped,
+                      intersection_area,
+                      intersection_areas)
+from . import strategies
+
+
+@given(strategies.shaped_geometries_lists_pairs)
+def test_basic(shaped_geometries_lists_pair: Tuple[List[Shaped],
+                                                   List[Shaped]]) -> None:
+    firsts, seconds = shaped_geometries_lists_pair
+
+    result = intersection_areas(firsts, seconds)
+
+    assert isinstance(result, list)
+    assert len(result) == len(firsts)
+    assert all(isinstance(row, list) for row in result)
+    assert all(len(row) == len(seconds) for row in result)
+
+
+@given(strategies.shaped_geometries_lists_pairs)
+def test_elements(shaped_geometries_lists_pair: Tuple[List[Shaped],
+                                                      List[Shaped]]) -> None:
+    firsts, seconds = shaped_geometries_lists_pair
+
+    result = intersection_areas(firsts, seconds)
+
+    assert all(result[first_index][second_index]
+               == intersection_area(first, second)
+               for first_index, first in enumerate(firsts)
+               for second_index, second in enumerate(seconds))
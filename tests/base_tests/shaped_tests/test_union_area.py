@@ -0,0 +1,53 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from gon.base import (Shaped,
+                      intersection_area,
+                      union_area)
+from tests.utils import is_scalar
+from . import strategies
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_basic(shaped_geometries_pair: Tuple[Shaped, Shaped]) -> None:
+    first, second = shaped_geometries_pair
+
+    result = union_area(first, second)
+
+    assert is_scalar(result)
+
+
+@given(strategies.shaped_geometries)
+def test_self(shaped: Shaped) -> None:
+    assert union_area(shaped, shaped) == shaped.area
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_value(shaped_geometries_pair: Tuple[Shaped, Shaped]) -> None:
+    first, second = shaped_geometries_pair
+
+    result = union_area(first, second)
+
+    assert max(first.area, second.area) <= result <= first.area + second.area
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_connection_with_intersection_area(shaped_geometries_pair
+                                           : Tuple[Shaped, Shaped]) -> None:
+    first, second = shaped_geometries_pair
+
+    result = union_area(first, second)
+
+    assert result + intersection_area(first, second) == (first.area
+                                                         + second.area)
+
+
+@given(strategies.shaped_geometries_pairs)
+def test_connection_with_union(shaped_geometries_pair: Tuple[Shaped, Shaped]
+                               ) -> None:
+    first, second = shaped_geometries_pair
+
+    result = union_area(first, second)
+
+    assert result == (first | second).area
@@ -1,8 +1,12 @@
 from .base import (angles,
-                   coordinates_strategies)
+                   coordinates_strategies,
+                   float_safe_rational_coordinates,
+                   simplification_methods)
 from .discrete import invalid_multipoints
 from .factories import (coordinates_to_angles,
+                        coordinates_to_boxes,
                         coordinates_to_contours,
+                        coordinates_to_convex_polygons,
                         coordinates_to_linear_geometries,
                         coordinates_to_maybe_linear_geometries,
                         coordinates_to_maybe_multipoints,
@@ -16,6 +20,7 @@ from .factories import (coordinates_to_angles,
                         coordinates_to_segments,
                         coordinates_to_shaped_geometries,
                         coordinates_to_vectors,
+                        to_non_negative_coordinates,
                         to_non_zero_coordinates,
                         to_zero_coordinates)
 from .linear import (contours_with_repeated_points,
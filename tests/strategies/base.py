@@ -7,7 +7,8 @@ from typing import (Optional,
 from cfractions import Fraction
 from hypothesis import strategies
 
-from gon.base import Angle
+from gon.base import (Angle,
+                      SimplificationMethod)
 from gon.hints import Scalar
 from tests.utils import (MAX_COORDINATE,
                          MIN_COORDINATE,
@@ -58,6 +59,12 @@ coordinates_strategies = strategies.sampled_from(
                                  max_denominator=MAX_COORDINATE),
                          strategies.integers]]
 )
+#: rational coordinates which are represented by floats
+#: with errors negligible relative to geometries' sizes
+float_safe_rational_coordinates = strategies.fractions(
+        -10 ** 3, 10 ** 3,
+        max_denominator=10 ** 3
+)
 
 
 def to_pythagorean_triplets(*,
@@ -100,3 +107,4 @@ angles = ((to_pythagorean_triplets(max_value=MAX_COORDINATE)
            .map(pythagorean_triplet_to_rational_cosine_sine))
           | coordinates_strategies.flatmap(coordinates_to_angles))
 empty_sequences = strategies.builds(list) | strategies.builds(tuple)
+simplification_methods = strategies.sampled_from(list(SimplificationMethod))
@@ -6,6 +6,7 @@ from hypothesis_geometry import planar
 from gon.base import (Angle,
                       Linear,
                       Multipoint,
+                      Polygon,
                       Shaped,
                       Vector)
 from gon.hints import (Maybe,
@@ -19,6 +20,11 @@ from tests.utils import (Strategy,
 MAX_LINEAR_SIZE = 5
 
 
+def to_non_negative_coordinates(coordinates: Strategy[Scalar]
+                                ) -> Strategy[Scalar]:
+    return coordinates.map(abs)
+
+
 def to_non_zero_coordinates(coordinates: Strategy[Scalar]) -> Strategy[Scalar]:
     return coordinates.filter(bool)
 
@@ -36,6 +42,7 @@ def coordinates_to_angles(coordinates: Strategy[Scalar]
             .map(pack(Angle.from_sides)))
 
 
+coordinates_to_boxes = planar.boxes
 coordinates_to_points = planar.points
 
 
@@ -80,6 +87,13 @@ coordinates_to_contours = partial(planar.contours,
 coordinates_to_mixes = partial(planar.mixes,
                                max_segments_size=MAX_LINEAR_SIZE)
 coordinates_to_polygons = planar.polygons
+
+
+def coordinates_to_convex_polygons(coordinates: Strategy[Scalar]
+                                   ) -> Strategy[Polygon[Scalar]]:
+    return planar.convex_contours(coordinates).map(Polygon)
+
+
 coordinates_to_multipolygons = planar.multipolygons
 
 
@@ -3,10 +3,15 @@ from contextlib import contextmanager
 from functools import partial
 from itertools import (chain,
                        repeat)
+from math import (floor,
+                  isclose,
+                  sqrt)
 from numbers import Real
 from operator import getitem
 from typing import (Any,
                     Callable,
+                    Dict,
+                    FrozenSet,
                     Hashable,
                     Iterable,
                     List,
@@ -15,19 +20,24 @@ from typing import (Any,
                     Set,
                     Tuple,
                     Type,
-                    TypeVar)
+                    TypeVar,
+                    Union)
 
 import pytest
 from cfractions import Fraction
-from clipping.planar import segments_to_multisegment
+from clipping.planar import (segments_to_multisegment,
+                             subtract_multipolygon_from_polygon)
 from ground.base import get_context
 from hypothesis import strategies
 from hypothesis.strategies import SearchStrategy
+from orient.planar import region_in_multiregion
 from symba.base import Expression
 
 from gon.base import (EMPTY,
+                      Box,
                       Compound,
                       Contour,
+                      Geometry,
                       Mix,
                       Multipoint,
                       Multipolygon,
@@ -49,6 +59,8 @@ MAX_COORDINATE_EXPONENT = 15
 MAX_COORDINATE = 10 ** MAX_COORDINATE_EXPONENT
 MIN_COORDINATE = -MAX_COORDINATE
 context = get_context()
+is_close = partial(isclose,
+                   abs_tol=1e-9)
 
 
 @contextmanager
@@ -182,6 +194,58 @@ def are_compounds_equivalent(left: Compound, right: Compound) -> bool:
     return left == right or left.relate(right) is Relation.EQUAL
 
 
+def box_to_polygon(box: Box) -> Polygon:
+    return Polygon(Contour([Point(box.min_x, box.min_y),
+                            Point(box.max_x, box.min_y),
+                            Point(box.max_x, box.max_y),
+                            Point(box.min_x, box.max_y)]), [])
+
+
+def is_box_non_degenerate(box: Box) -> bool:
+    return box.min_x < box.max_x and box.min_y < box.max_y
+
+
+def are_points_centered_at(points: Sequence[Point[float]],
+                           center: Point,
+                           box: Box) -> bool:
+    # deviation of the mean of points uniformly distributed in the box
+    # from their expected center exceeds 6 standard deviations
+    # with negligible probability
+    count = len(points)
+    tolerance_factor = 3 / sqrt(count)
+    return (abs(sum(point.x for point in points) / count - float(center.x))
+            <= tolerance_factor * float(box.max_x - box.min_x)
+            and (abs(sum(point.y for point in points) / count
+                     - float(center.y))
+                 <= tolerance_factor * float(box.max_y - box.min_y)))
+
+
+def is_point_in_box_approximately(point: Point, box: Box) -> bool:
+    return ((box.min_x <= point.x or is_close(point.x, box.min_x))
+            and (point.x <= box.max_x or is_close(point.x, box.max_x))
+            and (box.min_y <= point.y or is_close(point.y, box.min_y))
+            and (point.y <= box.max_y or is_close(point.y, box.max_y)))
+
+
+def is_polygon_valid(polygon: Polygon) -> bool:
+    try:
+        polygon.validate()
+    except ValueError:
+        return False
+    else:
+        return True
+
+
+def is_polygon_equal_to_border_minus_holes(polygon: Polygon) -> bool:
+    try:
+        relation = region_in_multiregion(polygon.border, polygon.holes)
+        return ((relation is Relation.COVER
+                 or relation is Relation.ENCLOSES)
+                and polygon_to_border_minus_holes(polygon) == polygon)
+    except ValueError:
+        return False
+
+
 def is_scalar(value: Any) -> bool:
     return isinstance(value, (Real, Expression))
 
@@ -299,6 +363,26 @@ def mix_to_segments(mix: Mix) -> Sequence[Segment]:
                   else linear.segments))
 
 
+def polygon_to_border_minus_holes(polygon: Polygon) -> Shaped:
+    return subtract_multipolygon_from_polygon(
+            Polygon(polygon.border, []),
+            Multipolygon([Polygon(hole, []) for hole in polygon.holes])
+    )
+
+
+def point_to_grid_cell(point: Point,
+                       box: Box,
+                       columns: int,
+                       rows: int) -> Optional[Tuple[int, int]]:
+    if not (box.min_x <= point.x <= box.max_x
+            and box.min_y <= point.y <= box.max_y):
+        return None
+    return (min(floor((point.y - box.min_y) * rows
+                      / (box.max_y - box.min_y)), rows - 1),
+            min(floor((point.x - box.min_x) * columns
+                      / (box.max_x - box.min_x)), columns - 1))
+
+
 def rationalize(value: Scalar) -> Scalar:
     try:
         return Fraction(value)
@@ -315,6 +399,13 @@ def rotate_segment(segment: Segment,
                                   segment.centroid)
 
 
+def runs_to_cells(runs: Iterable[Tuple[int, int, int]]
+                  ) -> Set[Tuple[int, int]]:
+    return {(row, column)
+            for row, start, stop in runs
+            for column in range(start, stop)}
+
+
 def segment_to_rotations(segment: Segment,
                          pythagorean_triplets: List[Tuple[int, int, int]]
                          ) -> List[Segment]:
@@ -326,10 +417,40 @@ def shaped_to_polygons(shaped: Shaped) -> Sequence[Polygon]:
     return shaped.polygons if isinstance(shaped, Multipolygon) else [shaped]
 
 
+def shaped_to_shaped_with_grid_multipoint(shaped: Shaped,
+                                          *,
+                                          size: int = 17
+                                          ) -> Tuple[Shaped, Multipoint]:
+    vertices = list(compound_to_points(shaped))
+    box = context.points_box(vertices)
+    width, height = box.max_x - box.min_x, box.max_y - box.min_y
+    grid_points = [Point(box.min_x + Fraction(column, size - 1) * width,
+                         box.min_y + Fraction(row, size - 1) * height)
+                   for row in range(size)
+                   for column in range(size)]
+    return shaped, Multipoint(list(to_unique_ever_seen(chain(vertices,
+                                                             grid_points))))
+
+
 def square(value: Scalar) -> Scalar:
     return value * value
 
 
+def to_buffers_triangles(coordinates: memoryview,
+                         indices: memoryview
+                         ) -> Set[FrozenSet[Tuple[float, float]]]:
+    points = list(zip(coordinates[::2], coordinates[1::2]))
+    return {frozenset(points[index] for index in indices[offset:offset + 3])
+            for offset in range(0, len(indices), 3)}
+
+
+def to_float_triangles(triangles: Iterable[Contour]
+                       ) -> Set[FrozenSet[Tuple[float, float]]]:
+    return {frozenset((float(vertex.x), float(vertex.y))
+                      for vertex in triangle.vertices)
+            for triangle in triangles}
+
+
 to_points_convex_hull = context.points_convex_hull
 
 
@@ -346,5 +467,59 @@ def to_rational_segment(segment: Segment[Real]) -> Segment[Fraction]:
                    to_rational_point(segment.end))
 
 
+def to_compound_with_bounding_box(compound: Compound
+                                  ) -> Tuple[Compound, Box]:
+    return compound, context.points_box(list(compound_to_points(compound)))
+
+
+def to_grid_cells_boxes(box: Box,
+                        columns: int,
+                        rows: int) -> Dict[Tuple[int, int], Box]:
+    width, height = ((box.max_x - box.min_x) / columns,
+                     (box.max_y - box.min_y) / rows)
+    return {(row, column): Box(box.min_x + column * width,
+                               box.min_x + (column + 1) * width,
+                               box.min_y + row * height,
+                               box.min_y + (row + 1) * height)
+            for row in range(rows)
+            for column in range(columns)}
+
+
+def to_rational_box(box: Box) -> Box:
+    return Box(rationalize(box.min_x), rationalize(box.max_x),
+               rationalize(box.min_y), rationalize(box.max_y))
+
+
+def to_rational_contour(contour: Contour[Real]) -> Contour[Fraction]:
+    return Contour([to_rational_point(vertex) for vertex in contour.vertices])
+
+
+def to_rational_multipolygon(multipolygon: Multipolygon[Real]
+                              ) -> Multipolygon[Fraction]:
+    return Multipolygon([to_rational_polygon(polygon)
+                         for polygon in multipolygon.polygons])
+
+
+def to_rational_polygon(polygon: Polygon[Real]) -> Polygon[Fraction]:
+    return Polygon(to_rational_contour(polygon.border),
+                   [to_rational_contour(hole) for hole in polygon.holes])
+
+
+def to_rational_multisegment(multisegment: Multisegment[Real]
+                              ) -> Multisegment[Fraction]:
+    return Multisegment([to_rational_segment(segment)
+                         for segment in multisegment.segments])
+
+
+def to_path_target(geometry: Geometry, path: Sequence[Union[int, str]]
+                   ) -> Any:
+    result = geometry
+    for step in path:
+        result = (result[step]
+                  if isinstance(step, int)
+                  else getattr(result, step))
+    return result
+
+
 def to_rational_point(point: Point[Real]) -> Point[Fraction]:
     return Point(rationalize(point.x), rationalize(point.y))